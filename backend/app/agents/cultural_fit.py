@@ -1,9 +1,15 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.utils.config import settings
+from app.utils.model_router import ModelRouter
+from app.utils.prompt_cache import CANDIDATE_DATA_MARKER, stable_json
+from app.utils.culture_scanner import (
+    CULTURE_CATEGORY,
+    CultureSignalEvidence,
+    get_culture_scanner,
+)
 
 
 class CulturalFitAnalysis(BaseModel):
@@ -18,22 +24,57 @@ class CulturalFitAnalysis(BaseModel):
 
 class CulturalFitAgent:
     def __init__(self, api_key: str):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.MODEL_NAME, api_key=api_key, temperature=0.3
-        )
+        self.router = ModelRouter(api_key, "cultural_fit", temperature=0.3)
         self.parser = PydanticOutputParser(pydantic_object=CulturalFitAnalysis)
 
     def analyze_cultural_fit(
-        self, resume_data: Dict, company_culture_keywords: List[str]
+        self,
+        resume_data: Dict,
+        company_culture_keywords: List[str],
+        resume_text: Optional[str] = None,
     ) -> CulturalFitAnalysis:
         print("Analyzing cultural fit...")
+        if resume_text is None:
+            return self._analyze_with_llm(
+                resume_data, company_culture_keywords, signal_evidence=None
+            )
+
+        print("Scanning resume for culture signals...")
+        evidence = get_culture_scanner(company_culture_keywords).scan(resume_text)
+
+        if settings.CULTURAL_FIT_FAST_MODE:
+            analysis = self.analyze_from_evidence(evidence, company_culture_keywords)
+            print("Cultural fit analysis complete (fast mode).")
+            return analysis
+
+        # The scanner already covers keyword spotting, so the model only needs
+        # the parts of the profile that describe how the candidate works
+        compact_profile = {
+            "summary": resume_data.get("summary"),
+            "work_experience": [
+                {
+                    "position": job.get("position"),
+                    "responsibilities": job.get("responsibilities", []),
+                    "achievements": job.get("achievements", []),
+                }
+                for job in resume_data.get("work_experience", [])
+            ],
+            "projects": resume_data.get("projects", []),
+        }
+        return self._analyze_with_llm(
+            compact_profile, company_culture_keywords, evidence.compact()
+        )
+
+    def _analyze_with_llm(
+        self,
+        resume_data: Dict,
+        company_culture_keywords: List[str],
+        signal_evidence: Optional[Dict[str, Dict[str, int]]],
+    ) -> CulturalFitAnalysis:
         prompt = PromptTemplate(
             template="""
-            Analyze cultural fit based on resume content and company culture:
-            
-            Resume Data: {resume_data}
-            Company Culture Keywords: {company_culture_keywords}
-            
+            Analyze cultural fit based on resume content and company culture.
+
             Evaluate:
             1. Cultural fit score (0-10)
             2. Soft skills demonstrated
@@ -42,22 +83,92 @@ class CulturalFitAgent:
             5. Team collaboration evidence
             6. Adaptability score (0-10)
             7. Cultural alignment factors
-            
+
             {format_instructions}
+
+            Company Culture Keywords: {company_culture_keywords}
+
+            {candidate_marker}
+            Resume Data: {resume_data}
+            Pre-scanned Resume Signals (phrase hit counts per category): {signal_evidence}
             """,
-            input_variables=["resume_data", "company_culture_keywords"],
+            input_variables=[
+                "resume_data",
+                "company_culture_keywords",
+                "signal_evidence",
+            ],
             partial_variables={
-                "format_instructions": self.parser.get_format_instructions()
+                "format_instructions": self.parser.get_format_instructions(),
+                "candidate_marker": CANDIDATE_DATA_MARKER,
             },
         )
 
-        chain = prompt | self.llm | self.parser
         print("Invoking LLM for cultural fit analysis...")
-        analysis = chain.invoke(
+        analysis = self.router.invoke(
+            prompt,
+            self.parser,
             {
                 "resume_data": resume_data,
-                "company_culture_keywords": company_culture_keywords,
-            }
+                "company_culture_keywords": stable_json(company_culture_keywords),
+                "signal_evidence": signal_evidence or "Not available",
+            },
+            output_complexity="medium",
         )
         print("Cultural fit analysis complete.")
         return analysis
+
+    @staticmethod
+    def analyze_from_evidence(
+        evidence: CultureSignalEvidence, company_culture_keywords: List[str]
+    ) -> CulturalFitAnalysis:
+        """Build a cultural fit analysis purely from scanned resume signals"""
+        culture_matches = evidence.phrases(CULTURE_CATEGORY)
+        leadership = evidence.phrases("leadership")
+        collaboration = evidence.phrases("collaboration")
+        adaptability = evidence.phrases("adaptability")
+        communication = evidence.phrases("communication")
+
+        distinct_keywords = {k.strip().lower() for k in company_culture_keywords if k}
+        keyword_coverage = (
+            len(culture_matches) / len(distinct_keywords) if distinct_keywords else 0.5
+        )
+
+        cultural_fit_score = (
+            3.0
+            + 4.0 * keyword_coverage
+            + 0.5 * min(len(collaboration), 3)
+            + 0.5 * min(len(leadership), 3)
+        )
+        adaptability_score = 4.0 + 1.5 * min(len(adaptability), 4)
+
+        if not (leadership or collaboration or communication):
+            communication_style = "Insufficient evidence"
+        elif len(leadership) > len(collaboration):
+            communication_style = "Directive"
+        elif communication:
+            communication_style = "Collaborative and articulate"
+        else:
+            communication_style = "Collaborative"
+
+        soft_skills = [
+            label
+            for label, phrases in (
+                ("Leadership", leadership),
+                ("Teamwork", collaboration),
+                ("Adaptability", adaptability),
+                ("Communication", communication),
+            )
+            if phrases
+        ]
+
+        return CulturalFitAnalysis(
+            cultural_fit_score=round(min(cultural_fit_score, 10.0), 1),
+            soft_skills_identified=soft_skills,
+            communication_style=communication_style,
+            leadership_indicators=leadership[:5],
+            team_collaboration_signals=collaboration[:5],
+            adaptability_score=round(min(adaptability_score, 10.0), 1),
+            cultural_alignment_factors=[
+                f"Mentions '{keyword}'" for keyword in culture_matches[:5]
+            ],
+        )
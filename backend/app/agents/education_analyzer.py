@@ -1,9 +1,9 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel
 from typing import List, Dict
-from app.utils.config import settings
+from app.utils.model_router import ModelRouter
+from app.utils.prompt_cache import CANDIDATE_DATA_MARKER, stable_json
 
 
 class EducationMatch(BaseModel):
@@ -36,9 +36,7 @@ class EducationAnalysis(BaseModel):
 
 class EducationAnalyzerAgent:
     def __init__(self, api_key: str):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.MODEL_NAME, api_key=api_key, temperature=0.2
-        )
+        self.router = ModelRouter(api_key, "education_analyzer", temperature=0.2)
         self.parser = PydanticOutputParser(pydantic_object=EducationAnalysis)
 
     def analyze_education(
@@ -53,11 +51,7 @@ class EducationAnalyzerAgent:
         print("Analyzing education...")
         prompt = PromptTemplate(
             template="""
-            Analyze the candidate's educational background against job requirements:
-            
-            Candidate Education: {candidate_education}
-            Candidate Certifications: {candidate_certifications}
-            Job Requirements: {job_requirements}
+            Analyze the candidate's educational background against job requirements.
             
             Evaluate the following aspects:
             
@@ -84,6 +78,12 @@ class EducationAnalyzerAgent:
             - Alternative education paths (bootcamps, online courses, self-taught skills)
             
             {format_instructions}
+            
+            Job Requirements: {job_requirements}
+            
+            {candidate_marker}
+            Candidate Education: {candidate_education}
+            Candidate Certifications: {candidate_certifications}
             """,
             input_variables=[
                 "candidate_education",
@@ -91,18 +91,21 @@ class EducationAnalyzerAgent:
                 "job_requirements",
             ],
             partial_variables={
-                "format_instructions": self.parser.get_format_instructions()
+                "format_instructions": self.parser.get_format_instructions(),
+                "candidate_marker": CANDIDATE_DATA_MARKER,
             },
         )
 
-        chain = prompt | self.llm | self.parser
         print("Invoking LLM for education analysis...")
-        analysis = chain.invoke(
+        analysis = self.router.invoke(
+            prompt,
+            self.parser,
             {
                 "candidate_education": candidate_education,
                 "candidate_certifications": candidate_certifications,
-                "job_requirements": job_requirements,
-            }
+                "job_requirements": stable_json(job_requirements),
+            },
+            output_complexity="medium",
         )
         print("Education analysis complete.")
         return analysis
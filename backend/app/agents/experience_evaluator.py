@@ -1,9 +1,9 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel
 from typing import List, Dict
-from app.utils.config import settings
+from app.utils.model_router import ModelRouter
+from app.utils.prompt_cache import CANDIDATE_DATA_MARKER, stable_json
 
 
 class ExperienceAnalysis(BaseModel):
@@ -19,9 +19,7 @@ class ExperienceAnalysis(BaseModel):
 
 class ExperienceEvaluatorAgent:
     def __init__(self, api_key: str):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.MODEL_NAME, api_key=api_key, temperature=0.2
-        )
+        self.router = ModelRouter(api_key, "experience_evaluator", temperature=0.2)
         self.parser = PydanticOutputParser(pydantic_object=ExperienceAnalysis)
 
     def evaluate_experience(
@@ -30,10 +28,7 @@ class ExperienceEvaluatorAgent:
         print("Evaluating experience...")
         prompt = PromptTemplate(
             template="""
-            Evaluate candidate's work experience against job requirements:
-            
-            Candidate Experience: {work_experience}
-            Job Requirements: {job_requirements}
+            Evaluate candidate's work experience against job requirements.
             
             Analyze:
             1. Overall experience relevance (0-10)
@@ -46,17 +41,28 @@ class ExperienceEvaluatorAgent:
             8. Key strengths
             
             {format_instructions}
+            
+            Job Requirements: {job_requirements}
+            
+            {candidate_marker}
+            Candidate Experience: {work_experience}
             """,
             input_variables=["work_experience", "job_requirements"],
             partial_variables={
-                "format_instructions": self.parser.get_format_instructions()
+                "format_instructions": self.parser.get_format_instructions(),
+                "candidate_marker": CANDIDATE_DATA_MARKER,
             },
         )
 
-        chain = prompt | self.llm | self.parser
         print("Invoking LLM for experience evaluation...")
-        analysis = chain.invoke(
-            {"work_experience": work_experience, "job_requirements": job_requirements}
+        analysis = self.router.invoke(
+            prompt,
+            self.parser,
+            {
+                "work_experience": work_experience,
+                "job_requirements": stable_json(job_requirements),
+            },
+            output_complexity="medium",
         )
         print("Experience evaluation complete.")
         return analysis
@@ -1,9 +1,8 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel
-from typing import List
-from app.utils.config import settings
+from typing import Dict, List
+from app.utils.model_router import ModelRouter
 
 
 class JobRequirements(BaseModel):
@@ -20,9 +19,7 @@ class JobRequirements(BaseModel):
 
 class JobParserAgent:
     def __init__(self, api_key: str):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.MODEL_NAME, api_key=api_key, temperature=0.1
-        )
+        self.router = ModelRouter(api_key, "job_parser", temperature=0.1)
         self.parser = PydanticOutputParser(pydantic_object=JobRequirements)
 
     def parse_job_description(self, job_text: str) -> JobRequirements:
@@ -53,8 +50,49 @@ class JobParserAgent:
             },
         )
 
-        chain = prompt | self.llm | self.parser
         print("Invoking LLM for job description parsing...")
-        data = chain.invoke({"job_description": job_text})
+        data = self.router.invoke(
+            prompt,
+            self.parser,
+            {"job_description": job_text},
+            output_complexity="low",
+        )
         print("Job description parsed successfully.")
         return data
+
+    def refine_job_requirements(
+        self, requirements: Dict, description_changes: List[str]
+    ) -> JobRequirements:
+        """
+        Update the parsed requirements of a near-identical job description
+        from only the lines that differ, instead of re-parsing the whole text
+        """
+        print("Refining job requirements from description changes...")
+        prompt = PromptTemplate(
+            template="""
+            These structured requirements were extracted from a job description:
+            {requirements}
+            
+            The job description has since been edited. Removed lines start with
+            "- " and added lines with "+ ":
+            {changes}
+            
+            Update the requirements to reflect these edits only. Keep every
+            field that the edits don't affect exactly as it is.
+            
+            {format_instructions}
+            """,
+            input_variables=["requirements", "changes"],
+            partial_variables={
+                "format_instructions": self.parser.get_format_instructions()
+            },
+        )
+
+        data = self.router.invoke(
+            prompt,
+            self.parser,
+            {"requirements": requirements, "changes": "\n".join(description_changes)},
+            output_complexity="low",
+        )
+        print("Job requirements refined successfully.")
+        return data
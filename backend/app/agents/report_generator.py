@@ -1,10 +1,20 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+import contextvars
 from app.utils.config import settings
+from app.utils.model_router import ModelRouter
+from app.utils.prompt_cache import CANDIDATE_DATA_MARKER, stable_json
+from app.utils.question_bank import question_banks
+from app.utils.request_context import (
+    DeadlineExceeded,
+    TokenBudgetExhausted,
+    current_request,
+)
+from app.utils.scoring_profile import ScoringProfile
 
 
 class InterviewQuestion(BaseModel):
@@ -43,12 +53,265 @@ class ComprehensiveReport(BaseModel):
     performance_predictions: Dict[str, str]
 
 
+class SummarySection(BaseModel):
+    executive_summary: str
+    overall_recommendation: str
+    hiring_confidence: float
+    key_strengths: List[str]
+    critical_concerns: List[str]
+
+
+class InterviewSection(BaseModel):
+    interview_questions: List[InterviewQuestion]
+
+
+class DevelopmentSection(BaseModel):
+    development_recommendations: List[RecommendationItem]
+
+
+class RiskSection(BaseModel):
+    risk_factors: List[RiskFactor]
+
+
+class OnboardingSection(BaseModel):
+    salary_recommendation_range: Optional[str]
+    onboarding_suggestions: List[str]
+    performance_predictions: Dict[str, str]
+
+
+# Report sections that can be generated separately, with the ComprehensiveReport
+# fields each one fills
+REPORT_SECTIONS = {
+    "summary": SummarySection,
+    "interview": InterviewSection,
+    "development": DevelopmentSection,
+    "risk": RiskSection,
+    "onboarding": OnboardingSection,
+}
+REPORT_SECTION_FIELDS = {
+    "summary": [
+        "executive_summary",
+        "overall_recommendation",
+        "hiring_confidence",
+        "key_strengths",
+        "critical_concerns",
+    ],
+    "interview": ["interview_questions"],
+    "development": ["development_recommendations"],
+    "risk": ["risk_factors"],
+    "onboarding": [
+        "salary_recommendation_range",
+        "onboarding_suggestions",
+        "performance_predictions",
+    ],
+}
+# Sections left out of a brief report
+OPTIONAL_SECTION_NAMES = ["development", "onboarding"]
+
+SECTION_PROMPTS = {
+    "summary": """
+            Write the summary of a hiring report for this candidate.
+
+            Include:
+            1. Executive Summary: 2-3 paragraph overview of the candidate's fit
+            2. Overall Recommendation: Clear hiring recommendation with rationale
+            3. Hiring Confidence: Confidence level in the recommendation (0-1)
+            4. Key Strengths: Top 5 candidate strengths
+            5. Critical Concerns: Main areas of concern or risk
+
+            {format_instructions}
+
+            Role: {role}
+
+            {candidate_marker}
+            Candidate: {candidate}
+            Scores (0-10): {scores}
+            Skills: {skills}
+            Experience: {experience}
+            Education: {education}
+            Cultural Fit: {cultural_fit}
+            {section_guidance}
+            """,
+    "interview": """
+            Write 8-10 targeted interview questions for this candidate across
+            technical, experience, behavioral and cultural categories. Probe the
+            missing skills and experience gaps and verify the claimed strengths.
+
+            {format_instructions}
+
+            Role: {role}
+
+            {candidate_marker}
+            Skills: {skills}
+            Experience: {experience}
+            Cultural Fit: {cultural_fit}
+            """,
+    "development": """
+            Recommend specific areas of improvement for this candidate, each with
+            a priority (High, Medium, Low), a timeline and the expected impact.
+
+            {format_instructions}
+
+            Role: {role}
+
+            {candidate_marker}
+            Skills: {skills}
+            Experience: {experience}
+            Education: {education}
+            """,
+    "risk": """
+            Identify the main risks of hiring this candidate, each with a severity
+            (High, Medium, Low) and a mitigation strategy.
+
+            {format_instructions}
+
+            Role: {role}
+
+            {candidate_marker}
+            Scores (0-10): {scores}
+            Skills: {skills}
+            Experience: {experience}
+            Cultural Fit: {cultural_fit}
+            """,
+    "onboarding": """
+            Plan the onboarding of this candidate: a suggested salary range if
+            applicable (null otherwise), onboarding suggestions, and expected
+            performance in key areas as an area -> prediction mapping.
+
+            {format_instructions}
+
+            Role: {role}
+
+            {candidate_marker}
+            Scores (0-10): {scores}
+            Skills: {skills}
+            Experience: {experience}
+            """,
+}
+
+# Role-level questions written once per job for its question bank
+QUESTION_BANK_PROMPT = """
+            Write {count} interview questions for this role that every candidate
+            for it should be asked, across technical, experience, behavioral and
+            cultural categories. Don't refer to any particular candidate.
+
+            {format_instructions}
+
+            Role: {role}
+            """
+
+# Per-candidate questions merged with those from the job's question bank
+PERSONAL_QUESTIONS_PROMPT = """
+            Write {count} interview questions for this candidate that probe their
+            missing skills and experience gaps and verify their claimed strengths.
+            Every candidate is already asked the role questions below; don't
+            repeat them.
+
+            {format_instructions}
+
+            Role: {role}
+            Role questions: {role_questions}
+
+            {candidate_marker}
+            Skills: {skills}
+            Experience: {experience}
+            Cultural Fit: {cultural_fit}
+            """
+
+PERSONAL_QUESTIONS_GUIDANCE = """
+            For interview questions, write only {count} questions specific to this
+            candidate's gaps and strengths. These role questions are asked of every
+            candidate already; don't repeat them: {role_questions}
+"""
+
+BRIEF_SUMMARY_GUIDANCE = """
+            Keep the executive summary to a single short paragraph.
+"""
+
+_section_executor = ThreadPoolExecutor(thread_name_prefix="report-section")
+
+
+def _submit_section(fn, *args) -> Future:
+    # Carry the request context over to the worker thread
+    context = contextvars.copy_context()
+    return _section_executor.submit(context.run, fn, *args)
+
+
+def role_summary(job_data: Dict) -> Dict[str, Any]:
+    """The parts of a job's requirements the report prompts use"""
+    return {
+        "role_title": job_data.get("role_title", ""),
+        "seniority_level": job_data.get("seniority_level", ""),
+        "experience_level": job_data.get("experience_level", ""),
+        "industry": job_data.get("industry", ""),
+        "required_skills": job_data.get("required_skills", []),
+        "responsibilities": job_data.get("responsibilities", []),
+    }
+
+
+def merge_interview_questions(
+    role_questions: List[InterviewQuestion],
+    personal_questions: List[InterviewQuestion],
+    missing_skills: List[str],
+) -> List[InterviewQuestion]:
+    """
+    INTERVIEW_BANK_QUESTIONS of the job's role questions, those about the
+    candidate's missing skills first, followed by the candidate's personal
+    questions that don't repeat one of them
+    """
+    missing = [skill.lower() for skill in missing_skills if skill]
+
+    def about_missing_skill(question: InterviewQuestion) -> bool:
+        text = f"{question.focus_area} {question.question}".lower()
+        return any(skill in text for skill in missing)
+
+    # Stable sort: bank order is kept within each group
+    ranked = sorted(
+        role_questions, key=lambda question: not about_missing_skill(question)
+    )
+    merged = ranked[: settings.INTERVIEW_BANK_QUESTIONS]
+    seen = {" ".join(question.question.lower().split()) for question in merged}
+    for question in personal_questions[: settings.INTERVIEW_PERSONAL_QUESTIONS]:
+        key = " ".join(question.question.lower().split())
+        if key not in seen:
+            seen.add(key)
+            merged.append(question)
+    return merged
+
+
+# Report fields left out of a brief report
+OPTIONAL_REPORT_SECTIONS = [
+    field for name in OPTIONAL_SECTION_NAMES for field in REPORT_SECTION_FIELDS[name]
+]
+# Sections only the LLM can write, left empty in a locally assembled report
+NARRATIVE_REPORT_SECTIONS = [
+    "executive_summary",
+    "overall_recommendation",
+    "hiring_confidence",
+    "interview_questions",
+    "risk_factors",
+]
+
+OPTIONAL_SECTIONS_SKIPPED_GUIDANCE = """
+            Keep this report brief: write a single short paragraph for the executive
+            summary, give at most 4 interview questions, and return empty lists for
+            development recommendations and onboarding suggestions, an empty object
+            for performance predictions and null for the salary range.
+"""
+
+INTERVIEW_QUESTIONS_SKIPPED_GUIDANCE = """
+            Return an empty list for interview questions.
+"""
+
+
 class ReportGeneratorAgent:
     def __init__(self, api_key: str):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.MODEL_NAME, api_key=api_key, temperature=0.3
-        )
+        self.router = ModelRouter(api_key, "report_generator", temperature=0.3)
         self.parser = PydanticOutputParser(pydantic_object=ComprehensiveReport)
+        self.section_parsers = {
+            name: PydanticOutputParser(pydantic_object=model)
+            for name, model in REPORT_SECTIONS.items()
+        }
 
     def generate_comprehensive_report(
         self,
@@ -59,22 +322,93 @@ class ReportGeneratorAgent:
         education_analysis: Dict,
         cultural_analysis: Dict,
         overall_score: float,
+        include_optional_sections: bool = True,
+        include_interview_questions: bool = True,
+        sections: Optional[List[str]] = None,
     ) -> ComprehensiveReport:
         """
-        Generate a comprehensive analysis report
+        Generate a comprehensive analysis report. Without the optional sections
+        the narrative is kept short and development, onboarding, salary and
+        performance sections are left empty to save tokens. Only the named
+        sections are generated (all by default); the rest are left empty.
         """
+        names = [
+            name
+            for name in (sections or list(REPORT_SECTIONS))
+            if (include_optional_sections or name not in OPTIONAL_SECTION_NAMES)
+            and (include_interview_questions or name != "interview")
+        ]
+
+        if settings.REPORT_MODE == "sectioned":
+            return self._generate_sections(
+                names,
+                job_data,
+                resume_data,
+                skills_analysis,
+                experience_analysis,
+                education_analysis,
+                cultural_analysis,
+                overall_score,
+                brief=not include_optional_sections,
+            )
+
+        report = self._generate_monolithic(
+            job_data,
+            resume_data,
+            skills_analysis,
+            experience_analysis,
+            education_analysis,
+            cultural_analysis,
+            overall_score,
+            include_optional_sections,
+            include_interview_questions,
+        )
+        if len(names) == len(REPORT_SECTIONS):
+            return report
+        # The single call can't leave sections out, so blank the unrequested ones
+        blank = self.build_minimal_report(skills_analysis, experience_analysis).dict()
+        return report.copy(
+            update={
+                field: blank[field]
+                for name in REPORT_SECTIONS
+                if name not in names
+                for field in REPORT_SECTION_FIELDS[name]
+            }
+        )
+
+    def _generate_monolithic(
+        self,
+        job_data: Dict,
+        resume_data: Dict,
+        skills_analysis: Dict,
+        experience_analysis: Dict,
+        education_analysis: Dict,
+        cultural_analysis: Dict,
+        overall_score: float,
+        include_optional_sections: bool,
+        include_interview_questions: bool,
+    ) -> ComprehensiveReport:
+        """The whole report in a single structured-output call"""
+        section_guidance = ""
+        if not include_optional_sections:
+            section_guidance += OPTIONAL_SECTIONS_SKIPPED_GUIDANCE
+        role_questions = None
+        if not include_interview_questions:
+            section_guidance += INTERVIEW_QUESTIONS_SKIPPED_GUIDANCE
+        elif settings.INTERVIEW_QUESTION_BANK:
+            role_questions = self._question_bank_or_none(job_data)
+            if role_questions is not None:
+                section_guidance += PERSONAL_QUESTIONS_GUIDANCE.format(
+                    count=settings.INTERVIEW_PERSONAL_QUESTIONS,
+                    role_questions=stable_json(
+                        [question.question for question in role_questions]
+                    ),
+                )
+
         print("Generating comprehensive report...")
         prompt = PromptTemplate(
             template="""
-            Generate a comprehensive hiring report based on the complete candidate analysis:
-            
-            Job Requirements: {job_data}
-            Candidate Profile: {resume_data}
-            Skills Analysis: {skills_analysis}
-            Experience Analysis: {experience_analysis}
-            Education Analysis: {education_analysis}
-            Cultural Fit Analysis: {cultural_analysis}
-            Overall Score: {overall_score}/10
+            Generate a comprehensive hiring report based on the complete candidate analysis.
             
             Create a detailed report including:
             
@@ -93,6 +427,17 @@ class ReportGeneratorAgent:
             Make the report actionable and specific to this role and candidate.
             
             {format_instructions}
+            
+            Job Requirements: {job_data}
+            
+            {candidate_marker}
+            Candidate Profile: {resume_data}
+            Skills Analysis: {skills_analysis}
+            Experience Analysis: {experience_analysis}
+            Education Analysis: {education_analysis}
+            Cultural Fit Analysis: {cultural_analysis}
+            Overall Score: {overall_score}/10
+            {section_guidance}
             """,
             input_variables=[
                 "job_data",
@@ -102,42 +447,258 @@ class ReportGeneratorAgent:
                 "education_analysis",
                 "cultural_analysis",
                 "overall_score",
+                "section_guidance",
             ],
             partial_variables={
-                "format_instructions": self.parser.get_format_instructions()
+                "format_instructions": self.parser.get_format_instructions(),
+                "candidate_marker": CANDIDATE_DATA_MARKER,
             },
         )
 
-        chain = prompt | self.llm | self.parser
         print("Invoking LLM for comprehensive report generation...")
-        report = chain.invoke(
+        report = self.router.invoke(
+            prompt,
+            self.parser,
             {
-                "job_data": job_data,
+                "job_data": stable_json(job_data),
                 "resume_data": resume_data,
                 "skills_analysis": skills_analysis,
                 "experience_analysis": experience_analysis,
                 "education_analysis": education_analysis,
                 "cultural_analysis": cultural_analysis,
                 "overall_score": overall_score,
-            }
+                "section_guidance": section_guidance,
+            },
+            output_complexity="high",
         )
+        if role_questions is not None:
+            report = report.copy(
+                update={
+                    "interview_questions": merge_interview_questions(
+                        role_questions,
+                        report.interview_questions,
+                        skills_analysis.get("missing_critical_skills", []),
+                    )
+                }
+            )
         print("Comprehensive report generated successfully.")
         return report
 
+    def _generate_sections(
+        self,
+        names: List[str],
+        job_data: Dict,
+        resume_data: Dict,
+        skills_analysis: Dict,
+        experience_analysis: Dict,
+        education_analysis: Dict,
+        cultural_analysis: Dict,
+        overall_score: float,
+        brief: bool = False,
+    ) -> ComprehensiveReport:
+        """
+        Generate the named sections with concurrent calls and assemble them into
+        one report. A failed summary fails the report; any other failed section
+        is left empty and marked as degraded.
+        """
+        print(f"Generating report sections concurrently: {', '.join(names)}")
+        inputs = {
+            # The only job-level input, part of the prompt prefix every
+            # candidate of the job shares
+            "role": stable_json(role_summary(job_data)),
+            "candidate": {
+                "name": resume_data.get("name", ""),
+                "summary": resume_data.get("summary", ""),
+            },
+            "scores": {
+                "skills": skills_analysis.get("overall_match_score"),
+                "experience": experience_analysis.get("overall_experience_score"),
+                "education": education_analysis.get("overall_education_score"),
+                "cultural_fit": cultural_analysis.get("cultural_fit_score"),
+                "overall": round(overall_score, 1),
+            },
+            "skills": {
+                "matched": skills_analysis.get("matched_skills", []),
+                "missing_critical": skills_analysis.get("missing_critical_skills", []),
+                "transferable": skills_analysis.get("transferable_skills", []),
+                "recommendations": skills_analysis.get("recommendations", []),
+            },
+            "experience": {
+                "relevant_years": experience_analysis.get("relevant_experience_years"),
+                "strengths": experience_analysis.get("strengths", []),
+                "gaps": experience_analysis.get("experience_gaps", []),
+            },
+            "education": {
+                "strengths": education_analysis.get("education_strengths", []),
+                "gaps": education_analysis.get("education_gaps", []),
+                "missing_certifications": education_analysis.get(
+                    "missing_certifications", []
+                ),
+                "recommendations": education_analysis.get("recommendations", []),
+            },
+            "cultural_fit": {
+                "soft_skills": cultural_analysis.get("soft_skills_identified", []),
+                "communication_style": cultural_analysis.get("communication_style", ""),
+                "alignment_factors": cultural_analysis.get(
+                    "cultural_alignment_factors", []
+                ),
+                "adaptability_score": cultural_analysis.get("adaptability_score"),
+            },
+            "section_guidance": BRIEF_SUMMARY_GUIDANCE if brief else "",
+        }
+
+        futures = {
+            name: (
+                _submit_section(self._generate_interview_section, job_data, inputs)
+                if name == "interview" and settings.INTERVIEW_QUESTION_BANK
+                else _submit_section(self._generate_section, name, inputs)
+            )
+            for name in names
+        }
+
+        report = self.build_minimal_report(skills_analysis, experience_analysis).dict()
+        for name, future in futures.items():
+            try:
+                report.update(future.result().dict())
+            except Exception as e:
+                if name == "summary":
+                    raise
+                print(f"Report section '{name}' failed: {str(e)}")
+                request = current_request()
+                if request is not None:
+                    reason = "error"
+                    if isinstance(e, DeadlineExceeded):
+                        reason = "deadline"
+                    elif isinstance(e, TokenBudgetExhausted):
+                        reason = "token_budget"
+                    request.mark_degraded(REPORT_SECTION_FIELDS[name], reason)
+
+        print("Report sections assembled successfully.")
+        return ComprehensiveReport(**report)
+
+    def _generate_section(
+        self, name: str, inputs: Dict[str, Any], template: Optional[str] = None
+    ) -> BaseModel:
+        template = template or SECTION_PROMPTS[name]
+        parser = self.section_parsers[name]
+        prompt = PromptTemplate(
+            template=template,
+            input_variables=[
+                variable
+                for variable in inputs
+                if "{" + variable + "}" in template
+            ],
+            partial_variables={
+                "format_instructions": parser.get_format_instructions(),
+                "candidate_marker": CANDIDATE_DATA_MARKER,
+            },
+        )
+        return self.router.invoke(
+            prompt,
+            parser,
+            {key: value for key, value in inputs.items() if "{" + key + "}" in template},
+            output_complexity="high" if name == "summary" else "medium",
+        )
+
+    def role_questions(self, job_data: Dict) -> List[InterviewQuestion]:
+        """The job's interview question bank, generated on first use"""
+        questions = question_banks.get_or_create(
+            job_data,
+            lambda: [
+                question.dict() for question in self._generate_question_bank(job_data)
+            ],
+        )
+        return [InterviewQuestion(**question) for question in questions]
+
+    def _generate_question_bank(self, job_data: Dict) -> List[InterviewQuestion]:
+        print("Generating the job's interview question bank...")
+        parser = self.section_parsers["interview"]
+        prompt = PromptTemplate(
+            template=QUESTION_BANK_PROMPT,
+            input_variables=["count", "role"],
+            partial_variables={"format_instructions": parser.get_format_instructions()},
+        )
+        section = self.router.invoke(
+            prompt,
+            parser,
+            {
+                "count": settings.INTERVIEW_BANK_SIZE,
+                "role": stable_json(role_summary(job_data)),
+            },
+            output_complexity="medium",
+        )
+        return section.interview_questions
+
+    def _question_bank_or_none(
+        self, job_data: Dict
+    ) -> Optional[List[InterviewQuestion]]:
+        try:
+            return self.role_questions(job_data)
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            print(
+                f"Interview question bank unavailable, writing every question: {str(e)}"
+            )
+            return None
+
+    def _generate_interview_section(
+        self, job_data: Dict, inputs: Dict[str, Any]
+    ) -> InterviewSection:
+        """
+        Questions from the job's bank merged with a few written for this
+        candidate; the whole set is written per candidate if there's no bank
+        """
+        role_questions = self._question_bank_or_none(job_data)
+        if role_questions is None:
+            return self._generate_section("interview", inputs)
+        personal = self._generate_section(
+            "interview",
+            {
+                **inputs,
+                "count": settings.INTERVIEW_PERSONAL_QUESTIONS,
+                "role_questions": stable_json(
+                    [question.question for question in role_questions]
+                ),
+            },
+            PERSONAL_QUESTIONS_PROMPT,
+        )
+        return InterviewSection(
+            interview_questions=merge_interview_questions(
+                role_questions,
+                personal.interview_questions,
+                inputs["skills"]["missing_critical"],
+            )
+        )
+
+    @staticmethod
+    def build_minimal_report(
+        skills_analysis: Dict, experience_analysis: Dict
+    ) -> ComprehensiveReport:
+        """
+        Report assembled from the agent analyses without an LLM call, for when
+        there is no time left to write the narrative
+        """
+        return ComprehensiveReport(
+            executive_summary="",
+            overall_recommendation="",
+            hiring_confidence=0.0,
+            key_strengths=experience_analysis.get("strengths", [])[:5],
+            critical_concerns=skills_analysis.get("missing_critical_skills", [])[:5],
+            interview_questions=[],
+            development_recommendations=[],
+            risk_factors=[],
+            salary_recommendation_range=None,
+            onboarding_suggestions=[],
+            performance_predictions={},
+        )
+
 
 class DashboardDataGenerator:
     """
     Generates structured data specifically for dashboard visualization
     """
 
-    def __init__(self):
-        self.score_thresholds = {
-            "excellent": 8.5,
-            "good": 7.0,
-            "fair": 5.5,
-            "poor": 0.0,
-        }
-
     def generate_dashboard_data(
         self,
         job_data: Dict,
@@ -148,9 +709,11 @@ class DashboardDataGenerator:
         cultural_analysis: Dict,
         comprehensive_report: ComprehensiveReport,
         overall_score: float,
+        scoring_profile: Optional[ScoringProfile] = None,
     ) -> Dict[str, Any]:
         """
-        Generate structured data for dashboard display
+        Generate structured data for dashboard display, ranking the overall
+        score by the given scoring profile's thresholds (default: configured)
         """
         print("Generating dashboard data...")
 
@@ -163,7 +726,9 @@ class DashboardDataGenerator:
 
         # Determine ranking and recommendation
         print("Determining ranking and recommendation...")
-        ranking_info = self._get_ranking_info(overall_score)
+        ranking_info = (scoring_profile or ScoringProfile.default()).ranking(
+            overall_score
+        )
 
         # Generate charts data
         print("Generating charts data...")
@@ -314,28 +879,67 @@ class DashboardDataGenerator:
         print("Dashboard data generated successfully.")
         return dashboard_data
 
-    def _get_ranking_info(self, score: float) -> Dict[str, str]:
-        """Determine ranking category and recommendation based on score"""
-        if score >= self.score_thresholds["excellent"]:
-            return {
-                "category": "Excellent Fit",
-                "recommendation": "Strong candidate - Proceed to final interview",
-            }
-        elif score >= self.score_thresholds["good"]:
-            return {
-                "category": "Good Fit",
-                "recommendation": "Good candidate - Proceed to technical interview",
-            }
-        elif score >= self.score_thresholds["fair"]:
-            return {
-                "category": "Fair Fit",
-                "recommendation": "Potential candidate - Requires further evaluation",
-            }
-        else:
-            return {
-                "category": "Poor Fit",
-                "recommendation": "Not recommended for this position",
-            }
+    def generate_rejection_data(
+        self,
+        job_data: Dict,
+        resume_data: Dict,
+        skills_analysis: Dict,
+        overall_score: float,
+        reason: str,
+        scoring_profile: Optional[ScoringProfile] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compact dashboard data for a candidate rejected after the skills
+        analysis, built without the other analyses or the LLM report
+        """
+        ranking_info = (scoring_profile or ScoringProfile.default()).ranking(
+            overall_score
+        )
+        missing_skills = skills_analysis.get("missing_critical_skills", [])
+        return {
+            "candidate_summary": {
+                "name": resume_data.get("name", "Unknown Candidate"),
+                "email": resume_data.get("email", ""),
+                "phone": resume_data.get("phone", ""),
+                "analysis_date": datetime.now().isoformat(),
+                "job_title": job_data.get("role_title", ""),
+                "company": job_data.get("company", ""),
+            },
+            "scoring_overview": {
+                "overall_fitness_score": round(overall_score, 1),
+                "ranking_category": ranking_info["category"],
+                "recommendation": ranking_info["recommendation"],
+                "confidence_level": None,
+                "score_breakdown": {
+                    "Skills Match": round(
+                        skills_analysis.get("overall_match_score", 0), 1
+                    ),
+                },
+            },
+            "detailed_metrics": {
+                "skills_match_percentage": self._calculate_skills_percentage(
+                    skills_analysis
+                ),
+            },
+            "key_insights": {
+                "top_strengths": [],
+                "critical_gaps": [f"Missing skill: {skill}" for skill in missing_skills[:5]],
+                "risk_factors": [],
+                "development_areas": skills_analysis.get("recommendations", [])[:5],
+            },
+            "detailed_analysis": {
+                "skills": {
+                    "matched_skills": skills_analysis.get("matched_skills", []),
+                    "missing_skills": missing_skills,
+                    "transferable_skills": skills_analysis.get(
+                        "transferable_skills", []
+                    ),
+                    "skill_categories": skills_analysis.get("skill_categories", {}),
+                },
+            },
+            "early_rejection": {"reason": reason},
+            "executive_summary": "",
+        }
 
     def _calculate_skills_percentage(self, skills_analysis: Dict) -> float:
         """Calculate skills match percentage"""
@@ -1,9 +1,10 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel
-from typing import List, Optional
-from app.utils.config import settings
+from typing import Any, Callable, List, Optional
+from app.utils.model_router import ModelRouter
+from app.utils.partial_json import PartialModelParser
+from app.utils.prompt_cache import CANDIDATE_DATA_MARKER
 
 
 class WorkExperience(BaseModel):
@@ -35,20 +36,24 @@ class ResumeData(BaseModel):
 
 class ResumeExtractorAgent:
     def __init__(self, api_key: str):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.MODEL_NAME, api_key=api_key, temperature=0.1
-        )
+        self.router = ModelRouter(api_key, "resume_extractor", temperature=0.1)
         self.parser = PydanticOutputParser(pydantic_object=ResumeData)
 
-    def extract_resume_data(self, resume_text: str) -> ResumeData:
+    def extract_resume_data(
+        self,
+        resume_text: str,
+        on_field: Optional[Callable[[str, Any], None]] = None,
+    ) -> ResumeData:
+        """
+        Extract structured resume data. With on_field the response is streamed
+        and each ResumeData field is passed to on_field, validated, as soon as
+        it is complete.
+        """
         print("Extracting structured data from resume...")
         prompt = PromptTemplate(
             template="""
             Extract structured information from the following resume:
             
-            Resume Text:
-            {resume_text}
-            
             Extract:
             1. Personal information (name, email, phone)
             2. Skills (technical and soft skills)
@@ -59,15 +64,27 @@ class ResumeExtractorAgent:
             7. Professional summary
             
             {format_instructions}
+            
+            {candidate_marker}
+            Resume Text:
+            {resume_text}
             """,
             input_variables=["resume_text"],
             partial_variables={
-                "format_instructions": self.parser.get_format_instructions()
+                "format_instructions": self.parser.get_format_instructions(),
+                "candidate_marker": CANDIDATE_DATA_MARKER,
             },
         )
 
-        chain = prompt | self.llm | self.parser
         print("Invoking LLM for resume data extraction...")
-        data = chain.invoke({"resume_text": resume_text})
+        data = self.router.invoke(
+            prompt,
+            self.parser,
+            {"resume_text": resume_text},
+            output_complexity="medium",
+            stream_listener=(
+                PartialModelParser(ResumeData, on_field) if on_field else None
+            ),
+        )
         print("Resume data extracted successfully.")
         return data
@@ -1,9 +1,11 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel
 from typing import List, Dict
 from app.utils.config import settings
+from app.utils.model_router import ModelRouter
+from app.utils.prompt_cache import CANDIDATE_DATA_MARKER, stable_json
+from app.utils.skill_graph import find_transferable_skills, get_skill_graph
 
 
 class SkillsAnalysis(BaseModel):
@@ -17,9 +19,7 @@ class SkillsAnalysis(BaseModel):
 
 class SkillsMatcherAgent:
     def __init__(self, api_key: str):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.MODEL_NAME, api_key=api_key, temperature=0.2
-        )
+        self.router = ModelRouter(api_key, "skills_matcher", temperature=0.2)
         self.parser = PydanticOutputParser(pydantic_object=SkillsAnalysis)
 
     def analyze_skills_match(
@@ -31,11 +31,7 @@ class SkillsMatcherAgent:
         print("Analyzing skills match...")
         prompt = PromptTemplate(
             template="""
-            Analyze the skill match between candidate and job requirements:
-            
-            Candidate Skills: {candidate_skills}
-            Required Skills: {required_skills}
-            Preferred Skills: {preferred_skills}
+            Analyze the skill match between candidate and job requirements.
             
             Provide:
             1. Overall match score (0-10)
@@ -46,21 +42,58 @@ class SkillsMatcherAgent:
             6. Recommendations for skill development
             
             {format_instructions}
+            
+            Required Skills: {required_skills}
+            Preferred Skills: {preferred_skills}
+            
+            {candidate_marker}
+            Candidate Skills: {candidate_skills}
             """,
             input_variables=["candidate_skills", "required_skills", "preferred_skills"],
             partial_variables={
-                "format_instructions": self.parser.get_format_instructions()
+                "format_instructions": self.parser.get_format_instructions(),
+                "candidate_marker": CANDIDATE_DATA_MARKER,
             },
         )
 
-        chain = prompt | self.llm | self.parser
         print("Invoking LLM for skills analysis...")
-        analysis = chain.invoke(
+        analysis = self.router.invoke(
+            prompt,
+            self.parser,
             {
                 "candidate_skills": candidate_skills,
-                "required_skills": required_skills,
-                "preferred_skills": preferred_skills,
-            }
+                "required_skills": stable_json(required_skills),
+                "preferred_skills": stable_json(preferred_skills),
+            },
+            output_complexity="low",
         )
+        if settings.LOCAL_TRANSFERABLE_SKILLS:
+            self._apply_local_transferable_skills(analysis, candidate_skills)
         print("Skills analysis complete.")
         return analysis
+
+    @staticmethod
+    def _apply_local_transferable_skills(
+        analysis: SkillsAnalysis, candidate_skills: List[str]
+    ):
+        """
+        Replace the model's transferable skills with the candidate skills that
+        sit close to a missing critical skill in the local skill graph
+        """
+        matched = {skill.lower() for skill in analysis.matched_skills}
+        related = find_transferable_skills(
+            [skill for skill in candidate_skills if skill.lower() not in matched],
+            analysis.missing_critical_skills,
+        )
+
+        transferable: List[str] = []
+        for matches in related.values():
+            for skill, _ in matches:
+                if skill not in transferable:
+                    transferable.append(skill)
+
+        # Keep the model's answer only when the graph knows none of the missing
+        # skills; otherwise the graph decides, even if it finds no match
+        graph = get_skill_graph()
+        if any(skill in graph for skill in analysis.missing_critical_skills):
+            analysis.transferable_skills = transferable
@@ -1,9 +1,12 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import os
+import threading
 from app.routes import analysis
+from app.utils.config import settings
+from app.utils.static_files import StaticAssetManifest
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -12,6 +15,7 @@ app = FastAPI(
     title="HireSight API",
     description="AI-powered resume analysis system",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -22,35 +26,63 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compresses large API payloads; static files already carry Content-Encoding
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MIN_SIZE)
+
 app.include_router(analysis.router, prefix="/api")
 
+
+@app.on_event("startup")
+async def warm_up_workflow():
+    # Warm up off the event loop so the server can bind immediately
+    if settings.WARM_UP_ON_STARTUP:
+        threading.Thread(target=analysis.warm_up, daemon=True).start()
+
+
 static_files_dir = os.path.join(
     os.path.dirname(__file__), "..", "..", "frontend", "dist"
 )
+static_manifest = StaticAssetManifest(static_files_dir)
 
-app.mount(
-    "/assets",
-    StaticFiles(directory=os.path.join(static_files_dir, "assets")),
-    name="assets",
-)
+
+@app.on_event("startup")
+async def load_static_files():
+    static_manifest.load()
+
+
+# Registered before the SPA catch-all so it is never shadowed by index.html
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy", "version": "1.0.0"}
+
+
+def _serve_static(asset, request: Request) -> Response:
+    return static_manifest.response(
+        asset,
+        accept_encoding=request.headers.get("accept-encoding", ""),
+        if_none_match=request.headers.get("if-none-match", ""),
+    )
 
 
 @app.get("/")
-async def read_index():
-    return FileResponse(os.path.join(static_files_dir, "index.html"))
+async def read_index(request: Request):
+    if static_manifest.index is None:
+        raise HTTPException(status_code=404, detail="Frontend build not found")
+    return _serve_static(static_manifest.index, request)
 
 
 @app.get("/{full_path:path}")
-async def catch_all(full_path: str):
-    file_path = os.path.join(static_files_dir, full_path)
-    if os.path.exists(file_path) and os.path.isfile(file_path):
-        return FileResponse(file_path)
-    return FileResponse(os.path.join(static_files_dir, "index.html"))
+async def catch_all(full_path: str, request: Request):
+    # Unknown API routes and missing build assets must not fall back to the SPA
+    if full_path == "api" or full_path.startswith("api/"):
+        raise HTTPException(status_code=404, detail="Not Found")
 
-
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy", "version": "1.0.0"}
+    asset = static_manifest.get(full_path)
+    if asset is None and not full_path.startswith("assets/"):
+        asset = static_manifest.index
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return _serve_static(asset, request)
 
 
 if __name__ == "__main__":
@@ -1,78 +1,932 @@
-from fastapi import APIRouter, File, UploadFile, Form, HTTPException
-from fastapi.responses import JSONResponse
-from app.workflow.resume_workflow import ResumeAnalysisWorkflow
+from fastapi import (
+    APIRouter,
+    Body,
+    File,
+    UploadFile,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from app.utils.analysis_export import EXPORT_FORMATS, export_analyses
+from app.utils.analysis_store import analysis_store, job_id_for_description
+from app.utils.candidate_ranking import leaderboards
 from app.utils.file_processor import FileProcessor
 from app.utils.config import settings
-from typing import Dict, Any
+from app.utils.job_analytics import job_analytics
+from app.utils.job_registry import job_registry
+from app.utils.job_similarity import similar_jobs
+from app.utils.json_repair import repair_stats
+from app.utils.model_router import hedging_stats, routing_stats
+from app.utils.near_duplicate import near_duplicates
+from app.utils.prompt_cache import prompt_cache
+from app.utils.quick_score import quick_score
+from app.utils.request_context import (
+    RequestContext,
+    TokenPool,
+    combine_usage,
+    request_scope,
+    token_pool,
+)
+from app.utils.response_shaping import parse_fields, shape_report
+from app.utils.scoring_profile import (
+    ScoringProfile,
+    rescore_job,
+    rescore_report,
+    scoring_profiles,
+)
+from contextlib import nullcontext
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import threading
+import time
 
 router = APIRouter()
 
-workflow = ResumeAnalysisWorkflow(settings.GOOGLE_API_KEY)
 file_processor = FileProcessor()
 
+_workflow = None
+_workflow_lock = threading.Lock()
 
-@router.post("/analyze-resume", response_model=Dict[str, Any])
-async def analyze_resume(
-    job_description: str = Form(...), resume_file: UploadFile = File(...)
-):
+
+def get_workflow():
     """
-    Analyze a resume against a job description
+    Build the analysis workflow on first use. The import is deferred too, so
+    langchain/langgraph aren't loaded before the server can accept requests.
     """
-    try:
-        # Validate file
-        if not resume_file.filename:
-            raise HTTPException(status_code=400, detail="No file uploaded")
+    global _workflow
+    if _workflow is None:
+        with _workflow_lock:
+            if _workflow is None:
+                from app.workflow.resume_workflow import ResumeAnalysisWorkflow
 
-        # Check file size
-        file_content = await resume_file.read()
-        if len(file_content) > settings.MAX_FILE_SIZE:
-            raise HTTPException(status_code=400, detail="File too large")
+                _workflow = ResumeAnalysisWorkflow(settings.GOOGLE_API_KEY)
+    return _workflow
 
-        # Check file extension
-        file_extension = "." + resume_file.filename.split(".")[-1].lower()
-        if file_extension not in settings.ALLOWED_EXTENSIONS:
-            raise HTTPException(status_code=400, detail="Unsupported file format")
 
-        # Extract text from file
-        resume_text = file_processor.extract_text(resume_file.filename, file_content)
+def warm_up() -> Dict[str, float]:
+    """Build the workflow and every model client it may route to, with timings"""
+    start = time.perf_counter()
+    workflow = get_workflow()
+    workflow_seconds = time.perf_counter() - start
 
-        if not resume_text.strip():
+    start = time.perf_counter()
+    workflow.warm_up()
+    clients_seconds = time.perf_counter() - start
+
+    return {
+        "workflow_seconds": round(workflow_seconds, 3),
+        "model_clients_seconds": round(clients_seconds, 3),
+    }
+
+
+def record_analysis(job_id: str, report: Dict[str, Any]) -> int:
+    """Persist a finished analysis and update the job's leaderboard and analytics"""
+    analysis_id = analysis_store.save_analysis(job_id, report)
+    leaderboards.record(job_id, analysis_id, report)
+    job_analytics.record(job_id, analysis_id, report)
+    return analysis_id
+
+
+def rescore_analyses(job_id: str, profile: ScoringProfile) -> Dict[str, Any]:
+    """Re-score a job's stored analyses and rebuild its leaderboard and analytics"""
+    result = rescore_job(analysis_store, job_id, profile)
+    leaderboards.invalidate(job_id)
+    job_analytics.invalidate(job_id)
+    return result
+
+
+def request_timeout(x_request_timeout: Optional[float]) -> Optional[float]:
+    """Deadline for a request in seconds: the client's, else the configured default"""
+    if x_request_timeout is not None:
+        if x_request_timeout <= 0:
+            raise HTTPException(
+                status_code=400, detail="X-Request-Timeout must be positive"
+            )
+        return x_request_timeout
+    return settings.REQUEST_TIMEOUT_SECONDS or None
+
+
+def resolve_job(
+    job_description: Optional[str], job_id: Optional[str]
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    (job_id, parsed requirements if already known) for a request that gives
+    either a registered job_id or the job description text
+    """
+    if job_id:
+        job_data = job_registry.get(job_id)
+        if job_data is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job_id, job_data
+
+    if not job_description or not job_description.strip():
+        raise HTTPException(
+            status_code=400, detail="Provide a job_id or a job description"
+        )
+    job_id = job_id_for_description(job_description)
+    job_data = job_registry.get(job_id)
+    if job_data is not None:
+        similar_jobs.count_exact_hit()
+    return job_id, job_data
+
+
+def raise_for_request(request: RequestContext):
+    """Raise the HTTP error for a request that ran out of time or tokens"""
+    if request.deadline_passed():
+        raise HTTPException(status_code=504, detail="Request deadline exceeded")
+    if request.budget_exhausted:
+        raise HTTPException(
+            status_code=429, detail="Token budget too low to analyze the input"
+        )
+
+
+def pooled_context(
+    pool: TokenPool, timeout_seconds: Optional[float] = None
+) -> RequestContext:
+    """
+    Context for one analysis, spending from the request's pool: at most
+    REQUEST_TOKEN_BUDGET, and no more than the pool has left
+    """
+    if pool.remaining <= 0:
+        raise HTTPException(status_code=429, detail="Tenant token budget exhausted")
+    return RequestContext(
+        pool.tenant_id, settings.REQUEST_TOKEN_BUDGET, timeout_seconds, pool
+    )
+
+
+def register_job(
+    job_description: str, tenant_id: str, pool: Optional[TokenPool] = None
+) -> Tuple[str, Dict[str, Any], bool]:
+    """
+    Parse and store a job description once, with tokens from the given pool
+    (or a pool of its own). Returns (job_id, requirements, created).
+    """
+    job_id, job_data = resolve_job(job_description, None)
+    if job_data is not None:
+        return job_id, job_data, False
+
+    workflow = get_workflow()
+    with token_pool(tenant_id) if pool is None else nullcontext(pool) as job_pool:
+        with request_scope(pooled_context(job_pool)) as request:
+            try:
+                job_id, job_data, _ = workflow.parse_job(job_description)
+            except Exception:
+                raise_for_request(request)
+                raise
+    return job_id, job_data, True
+
+
+def read_resume_file(resume_file: UploadFile, file_content: bytes) -> str:
+    """Validate an uploaded resume and extract its text"""
+    if not resume_file.filename:
+        raise HTTPException(status_code=400, detail="No file uploaded")
+
+    # Check file size
+    if len(file_content) > settings.MAX_FILE_SIZE:
+        raise HTTPException(status_code=400, detail="File too large")
+
+    # Check file extension
+    file_extension = "." + resume_file.filename.split(".")[-1].lower()
+    if file_extension not in settings.ALLOWED_EXTENSIONS:
+        raise HTTPException(status_code=400, detail="Unsupported file format")
+
+    # Extract text from file
+    resume_text = file_processor.extract_text(resume_file.filename, file_content)
+
+    if not resume_text.strip():
+        raise HTTPException(status_code=400, detail="Could not extract text from file")
+    return resume_text
+
+
+def analyze_and_record(
+    job_description: Optional[str],
+    resume_text: str,
+    tenant_id: str,
+    timeout_seconds: Optional[float] = None,
+    report_sections: Optional[List[str]] = None,
+    job_id: Optional[str] = None,
+    dimensions: Optional[List[str]] = None,
+    early_reject: Optional[bool] = None,
+    resume_data: Optional[Dict[str, Any]] = None,
+    pool: Optional[TokenPool] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Run the workflow for the requested dimensions and persist the result,
+    unless a near-identical resume was already analyzed for the same job with
+    at least those dimensions (or was rejected early). The job is given by
+    its registered job_id or its description. early_reject overrides
+    EARLY_REJECT_ENABLED; resume_data skips the resume extraction. Tokens
+    come from the given pool, shared with the rest of a batch, or a pool of
+    its own. Returns (report, response metadata).
+    """
+    job_id, job_data = resolve_job(job_description, job_id)
+    workflow = get_workflow()
+    from app.agents.report_generator import REPORT_SECTIONS
+    from app.workflow.resume_workflow import DIMENSION_NAMES, resolve_dimensions
+
+    try:
+        wanted = resolve_dimensions(dimensions)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if report_sections is not None:
+        unknown = [name for name in report_sections if name not in REPORT_SECTIONS]
+        if unknown:
             raise HTTPException(
-                status_code=400, detail="Could not extract text from file"
+                status_code=400,
+                detail=f"Unknown report sections: {', '.join(unknown)}",
+            )
+
+    scoring_profile, _ = scoring_profiles.resolve(job_id, tenant_id)
+    signature = near_duplicates.hasher.signature(resume_text)
+    duplicate = near_duplicates.find_duplicate(job_id, tenant_id, signature)
+
+    duplicate_of = None
+    if duplicate:
+        duplicate_id, similarity = duplicate
+        duplicate_of = {"analysis_id": duplicate_id, "similarity": round(similarity, 3)}
+        if settings.DUPLICATE_ACTION == "reuse":
+            report = analysis_store.get_analysis(duplicate_id)
+            rejecting = (
+                settings.EARLY_REJECT_ENABLED if early_reject is None else early_reject
             )
+            sections = set(report_sections or REPORT_SECTIONS)
+            # Only reuse a complete analysis that covered every requested
+            # dimension and report section, or that rejected the resume at the
+            # skills screening when early rejection is on for this request
+            if (
+                report is not None
+                and not report.get("degraded_sections")
+                and (
+                    (report.get("early_rejection") and rejecting)
+                    or (
+                        wanted
+                        <= set(report.get("analyzed_dimensions", DIMENSION_NAMES))
+                        and sections
+                        <= set(report.get("report_sections", REPORT_SECTIONS))
+                    )
+                )
+            ):
+                print(f"Reusing analysis {duplicate_id} for near-duplicate resume")
+                # The profile may have changed since the analysis was stored
+                report = rescore_report(report, scoring_profile)
+                meta = {"job_id": job_id, "analysis_id": duplicate_id}
+                return report, {**meta, "duplicate_of": duplicate_of}
+
+    with token_pool(tenant_id) if pool is None else nullcontext(pool) as request_pool:
+        with request_scope(pooled_context(request_pool, timeout_seconds)) as request:
+            try:
+                report = workflow.analyze_resume(
+                    job_description or "",
+                    resume_text,
+                    report_sections,
+                    job_data,
+                    scoring_profile,
+                    sorted(wanted),
+                    early_reject,
+                    resume_data,
+                )
+            except Exception:
+                raise_for_request(request)
+                raise
+    analysis_id = record_analysis(job_id, report)
+    near_duplicates.record(job_id, tenant_id, analysis_id, signature)
+
+    meta = {
+        "job_id": job_id,
+        "analysis_id": analysis_id,
+        "token_usage": request.usage_summary(),
+    }
+    if duplicate_of:
+        meta["duplicate_of"] = duplicate_of
+    return report, meta
+
+
+def extract_resume_once(
+    resume_text: str, pool: TokenPool, timeout_seconds: Optional[float] = None
+) -> Tuple[Dict[str, Any], RequestContext]:
+    """
+    Extract a resume that is about to be analyzed against several jobs.
+    Returns (resume data, the extraction's request context).
+    """
+    workflow = get_workflow()
+    with request_scope(pooled_context(pool, timeout_seconds)) as request:
+        try:
+            resume_data = workflow.extract_resume(resume_text)
+        except Exception:
+            raise_for_request(request)
+            raise
+    return resume_data, request
+
+
+def analysis_response(
+    report: Dict[str, Any],
+    meta: Dict[str, Any],
+    fields: Optional[str],
+    compact: bool,
+) -> ORJSONResponse:
+    content = shape_report(report, fields, compact)
+    return ORJSONResponse(content={**content, **meta})
+
+
+@router.post("/analyze-resume", response_model=Dict[str, Any])
+async def analyze_resume(
+    job_description: Optional[str] = Form(None),
+    job_id: Optional[str] = Form(None),
+    resume_file: UploadFile = File(...),
+    fields: Optional[str] = Query(None),
+    compact: bool = Query(False),
+    x_tenant_id: str = Header("default"),
+    x_request_timeout: Optional[float] = Header(None),
+    report_sections: Optional[str] = Query(None),
+    dimensions: Optional[str] = Query(None),
+    early_reject: Optional[bool] = Query(None),
+):
+    """
+    Analyze a resume against a job description or a registered job
+    """
+    try:
+        file_content = await resume_file.read()
+        resume_text = read_resume_file(resume_file, file_content)
 
         # Run analysis
-        result = workflow.analyze_resume(job_description, resume_text)
+        result, meta = await run_in_threadpool(
+            analyze_and_record,
+            job_description,
+            resume_text,
+            x_tenant_id,
+            request_timeout(x_request_timeout),
+            parse_fields(report_sections) if report_sections is not None else None,
+            job_id,
+            parse_fields(dimensions) if dimensions is not None else None,
+            early_reject,
+        )
 
-        return JSONResponse(content=result)
+        return analysis_response(result, meta, fields, compact)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
 @router.post("/analyze-resume-text")
 async def analyze_resume_text(
-    job_description: str = Form(...), resume_text: str = Form(...)
+    resume_text: str = Form(...),
+    job_description: Optional[str] = Form(None),
+    job_id: Optional[str] = Form(None),
+    fields: Optional[str] = Query(None),
+    compact: bool = Query(False),
+    x_tenant_id: str = Header("default"),
+    x_request_timeout: Optional[float] = Header(None),
+    report_sections: Optional[str] = Query(None),
+    dimensions: Optional[str] = Query(None),
+    early_reject: Optional[bool] = Query(None),
 ):
     """
-    Analyze resume text directly against a job description
+    Analyze resume text directly against a job description or a registered job
     """
     try:
         if not resume_text.strip():
             raise HTTPException(status_code=400, detail="Resume text cannot be empty")
 
-        if not job_description.strip():
+        # Run analysis
+        result, meta = await run_in_threadpool(
+            analyze_and_record,
+            job_description,
+            resume_text,
+            x_tenant_id,
+            request_timeout(x_request_timeout),
+            parse_fields(report_sections) if report_sections is not None else None,
+            job_id,
+            parse_fields(dimensions) if dimensions is not None else None,
+            early_reject,
+        )
+
+        return analysis_response(result, meta, fields, compact)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+
+
+@router.post("/analyze-batch")
+async def analyze_batch(
+    resume_files: List[UploadFile] = File(...),
+    job_description: Optional[str] = Form(None),
+    job_id: Optional[str] = Form(None),
+    fields: Optional[str] = Query(None),
+    compact: bool = Query(False),
+    x_tenant_id: str = Header("default"),
+    x_request_timeout: Optional[float] = Header(None),
+    report_sections: Optional[str] = Query(None),
+    dimensions: Optional[str] = Query(None),
+    early_reject: Optional[bool] = Query(None),
+):
+    """
+    Analyze several resumes against one job. The job is parsed (or looked up)
+    once; resumes are analyzed concurrently and each gets its own result or
+    error, in upload order. All of them share one BATCH_TOKEN_BUDGET pool.
+    """
+    pool = TokenPool(x_tenant_id, settings.BATCH_TOKEN_BUDGET)
+    try:
+        if len(resume_files) > settings.MAX_BATCH_FILES:
             raise HTTPException(
-                status_code=400, detail="Job description cannot be empty"
+                status_code=400,
+                detail=f"At most {settings.MAX_BATCH_FILES} resumes per batch",
             )
+        timeout_seconds = request_timeout(x_request_timeout)
+        sections = parse_fields(report_sections) if report_sections is not None else None
+        wanted = parse_fields(dimensions) if dimensions is not None else None
 
-        # Run analysis
-        result = workflow.analyze_resume(job_description, resume_text)
+        if not job_id:
+            job_id, _, _ = await run_in_threadpool(
+                register_job, job_description or "", x_tenant_id, pool
+            )
+        else:
+            resolve_job(None, job_id)
+
+        semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+        early_rejected = []
+
+        async def analyze_file(resume_file: UploadFile) -> Dict[str, Any]:
+            result = {"filename": resume_file.filename}
+            try:
+                resume_text = read_resume_file(resume_file, await resume_file.read())
+                async with semaphore:
+                    report, meta = await run_in_threadpool(
+                        analyze_and_record,
+                        None,
+                        resume_text,
+                        x_tenant_id,
+                        timeout_seconds,
+                        sections,
+                        job_id,
+                        wanted,
+                        early_reject,
+                        None,
+                        pool,
+                    )
+                if report.get("early_rejection"):
+                    early_rejected.append(resume_file.filename)
+                return {**result, **shape_report(report, fields, compact), **meta}
+            except HTTPException as e:
+                return {**result, "error": e.detail, "status_code": e.status_code}
+            except Exception as e:
+                return {**result, "error": f"Analysis failed: {str(e)}", "status_code": 500}
 
-        return JSONResponse(content=result)
+        results = await asyncio.gather(*(analyze_file(f) for f in resume_files))
+        # Cached vs uncached prompt tokens over the analyses that called the LLMs
+        token_usage = combine_usage(
+            [result["token_usage"] for result in results if "token_usage" in result]
+        )
+        return ORJSONResponse(
+            content={
+                "job_id": job_id,
+                "token_usage": token_usage,
+                "early_rejected": len(early_rejected),
+                "results": results,
+            }
+        )
 
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Batch analysis failed: {str(e)}")
+    finally:
+        pool.close()
+
+
+@router.post("/match-jobs")
+async def match_resume_to_jobs(
+    job_ids: str = Form(...),
+    resume_file: Optional[UploadFile] = File(None),
+    resume_text: Optional[str] = Form(None),
+    shortlist: Optional[int] = Query(None, ge=1),
+    x_tenant_id: str = Header("default"),
+    x_request_timeout: Optional[float] = Header(None),
+    report_sections: Optional[str] = Query(None),
+    dimensions: Optional[str] = Query(None),
+    early_reject: Optional[bool] = Query(None),
+):
+    """
+    Match one resume against several registered jobs (comma separated
+    job_ids) and rank the roles by fitness score. Every role is first scored
+    locally, without LLM calls; only the best `shortlist` roles are analyzed
+    in full. The resume is extracted once and the roles are analyzed
+    concurrently, sharing one BATCH_TOKEN_BUDGET pool.
+    """
+    pool = TokenPool(x_tenant_id, settings.BATCH_TOKEN_BUDGET)
+    try:
+        ids = list(dict.fromkeys(parse_fields(job_ids)))
+        if not ids:
+            raise HTTPException(status_code=400, detail="Provide at least one job_id")
+        if len(ids) > settings.MAX_MATCH_JOBS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {settings.MAX_MATCH_JOBS} jobs per match request",
+            )
+        jobs = {job_id: resolve_job(None, job_id)[1] for job_id in ids}
+
+        if resume_file is not None and resume_file.filename:
+            resume_text = read_resume_file(resume_file, await resume_file.read())
+        if not resume_text or not resume_text.strip():
+            raise HTTPException(status_code=400, detail="No resume text provided")
+
+        timeout_seconds = request_timeout(x_request_timeout)
+        sections = None
+        if report_sections is not None:
+            sections = parse_fields(report_sections)
+        wanted = parse_fields(dimensions) if dimensions is not None else None
+
+        def score_roles() -> Dict[str, float]:
+            return {
+                job_id: quick_score("", resume_text, job_id, x_tenant_id)[
+                    "overall_fitness_score"
+                ]
+                for job_id in ids
+            }
+
+        # Local pre-filter: approximate scores rank the roles before any LLM call
+        quick_scores = await run_in_threadpool(score_roles)
+        ranked_ids = sorted(ids, key=lambda job_id: -quick_scores[job_id])
+        size = shortlist or settings.MATCH_SHORTLIST_SIZE
+        shortlisted = [
+            job_id
+            for job_id in ranked_ids[:size]
+            if quick_scores[job_id] >= settings.MATCH_MIN_QUICK_SCORE
+        ]
+
+        resume_data, extraction = None, None
+        if shortlisted:
+            resume_data, extraction = await run_in_threadpool(
+                extract_resume_once, resume_text, pool, timeout_seconds
+            )
+            if timeout_seconds is not None:
+                timeout_seconds = max(extraction.remaining_seconds(), 0.001)
+
+        semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+
+        async def analyze_role(job_id: str) -> Dict[str, Any]:
+            role = {
+                "job_id": job_id,
+                "role_title": jobs[job_id].get("role_title", ""),
+                "quick_score": quick_scores[job_id],
+            }
+            try:
+                async with semaphore:
+                    report, meta = await run_in_threadpool(
+                        analyze_and_record,
+                        None,
+                        resume_text,
+                        x_tenant_id,
+                        timeout_seconds,
+                        sections,
+                        job_id,
+                        wanted,
+                        early_reject,
+                        resume_data,
+                        pool,
+                    )
+                scoring = report.get("scoring_overview", {})
+                role.update(
+                    {
+                        "overall_fitness_score": scoring.get("overall_fitness_score"),
+                        "ranking_category": scoring.get("ranking_category"),
+                        "recommendation": scoring.get("recommendation"),
+                        "score_breakdown": scoring.get("score_breakdown", {}),
+                    }
+                )
+                if report.get("early_rejection"):
+                    role["early_rejection"] = report["early_rejection"]
+                return {**role, **meta}
+            except HTTPException as e:
+                return {**role, "error": e.detail, "status_code": e.status_code}
+            except Exception as e:
+                return {
+                    **role,
+                    "error": f"Analysis failed: {str(e)}",
+                    "status_code": 500,
+                }
+
+        results = await asyncio.gather(
+            *(analyze_role(job_id) for job_id in shortlisted)
+        )
+        analyzed = sorted(
+            (result for result in results if "error" not in result),
+            key=lambda result: (
+                -(result["overall_fitness_score"] or 0),
+                -result["quick_score"],
+            ),
+        )
+        usage = [extraction.usage_summary()] if extraction is not None else []
+        usage += [
+            result["token_usage"] for result in results if "token_usage" in result
+        ]
+
+        return ORJSONResponse(
+            content={
+                "candidate_name": (resume_data or {}).get("name", ""),
+                "roles": [
+                    {"rank": rank, **result}
+                    for rank, result in enumerate(analyzed, start=1)
+                ],
+                "failed": [result for result in results if "error" in result],
+                # Left out by the local pre-filter, best first
+                "not_shortlisted": [
+                    {
+                        "job_id": job_id,
+                        "role_title": jobs[job_id].get("role_title", ""),
+                        "quick_score": quick_scores[job_id],
+                    }
+                    for job_id in ranked_ids
+                    if job_id not in shortlisted
+                ],
+                "token_usage": combine_usage(usage),
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Job matching failed: {str(e)}")
+    finally:
+        pool.close()
+
+
+@router.post("/jobs")
+async def create_job(
+    job_description: str = Form(...),
+    x_tenant_id: str = Header("default"),
+):
+    """
+    Register a job description: it is parsed once and can then be referenced
+    by job_id in the analyze, batch and quick-score endpoints
+    """
+    try:
+        job_id, requirements, created = await run_in_threadpool(
+            register_job, job_description, x_tenant_id
+        )
+        return ORJSONResponse(
+            content={"job_id": job_id, "requirements": requirements, "created": created},
+            status_code=201 if created else 200,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Job parsing failed: {str(e)}")
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Stored requirements of a registered job
+    """
+    job = await run_in_threadpool(analysis_store.get_job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return ORJSONResponse(
+        content={
+            "job_id": job_id,
+            "requirements": job["requirements"],
+            "created_at": job["created_at"],
+        }
+    )
+
+
+@router.get("/jobs/{job_id}/interview-questions")
+async def get_job_interview_questions(job_id: str):
+    """
+    Role-level interview questions of a registered job, shared by every
+    candidate's report. Generated on first request if no report made them yet.
+    """
+    try:
+        _, job_data = resolve_job(None, job_id)
+        report_generator = get_workflow().report_generator
+        questions = await run_in_threadpool(report_generator.role_questions, job_data)
+        return ORJSONResponse(
+            content={
+                "job_id": job_id,
+                "interview_questions": [question.dict() for question in questions],
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Question bank generation failed: {str(e)}"
+        )
+
+
+@router.post("/quick-score")
+async def quick_score_resume(
+    job_description: Optional[str] = Form(None),
+    job_id: Optional[str] = Form(None),
+    resume_file: Optional[UploadFile] = File(None),
+    resume_text: Optional[str] = Form(None),
+    x_tenant_id: str = Header("default"),
+):
+    """
+    Approximate fitness score from local heuristics, without any LLM call.
+    Accepts either a resume file or resume text; run the full analysis
+    afterwards for candidates that look promising.
+    """
+    try:
+        job_id, _ = resolve_job(job_description, job_id)
+
+        if resume_file is not None and resume_file.filename:
+            resume_text = read_resume_file(resume_file, await resume_file.read())
+
+        if not resume_text or not resume_text.strip():
+            raise HTTPException(status_code=400, detail="No resume text provided")
+
+        result = await run_in_threadpool(
+            quick_score, job_description or "", resume_text, job_id, x_tenant_id
+        )
+        return ORJSONResponse(content=result)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Quick score failed: {str(e)}")
+
+
+@router.get("/jobs/{job_id}/scoring-profile")
+async def get_scoring_profile(job_id: str, x_tenant_id: str = Header("default")):
+    """
+    Score weights and ranking thresholds that apply to a job, and whether they
+    come from the job, its tenant or the defaults
+    """
+    profile, source = await run_in_threadpool(
+        scoring_profiles.resolve, job_id, x_tenant_id
+    )
+    return ORJSONResponse(
+        content={"job_id": job_id, "source": source, **profile.to_dict()}
+    )
+
+
+@router.put("/jobs/{job_id}/scoring-profile")
+async def set_job_scoring_profile(
+    job_id: str,
+    profile: Dict[str, Any] = Body(...),
+    rescore: bool = Query(True),
+):
+    """
+    Set a job's score weights and ranking thresholds, e.g.
+    {"weights": {"Skills Match": 0.5, ...}, "thresholds": {"excellent": 9, ...}}.
+    Omitted parts keep the defaults. Stored analyses are re-scored unless
+    rescore is false.
+    """
+    try:
+        scoring_profile = await run_in_threadpool(
+            scoring_profiles.set, "job", job_id, profile
+        )
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    content = {"job_id": job_id, "source": "job", **scoring_profile.to_dict()}
+    if rescore:
+        content["rescore"] = await run_in_threadpool(
+            rescore_analyses, job_id, scoring_profile
+        )
+    return ORJSONResponse(content=content)
+
+
+@router.put("/tenants/{tenant_id}/scoring-profile")
+async def set_tenant_scoring_profile(tenant_id: str, profile: Dict[str, Any] = Body(...)):
+    """
+    Set the score weights and ranking thresholds for a tenant's jobs that
+    have no profile of their own. Re-score jobs with /jobs/{job_id}/rescore.
+    """
+    try:
+        scoring_profile = await run_in_threadpool(
+            scoring_profiles.set, "tenant", tenant_id, profile
+        )
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse(
+        content={"tenant_id": tenant_id, "source": "tenant", **scoring_profile.to_dict()}
+    )
+
+
+@router.post("/jobs/{job_id}/rescore")
+async def rescore_job_analyses(job_id: str, x_tenant_id: str = Header("default")):
+    """
+    Recompute the overall fitness score and ranking category of every stored
+    analysis of a job with its current scoring profile. No LLM calls are made.
+    """
+    profile, _ = await run_in_threadpool(scoring_profiles.resolve, job_id, x_tenant_id)
+    result = await run_in_threadpool(rescore_analyses, job_id, profile)
+    if not result["rescored"]:
+        raise HTTPException(status_code=404, detail="No analyses found for this job")
+    return ORJSONResponse(content=result)
+
+
+@router.get("/jobs/{job_id}/ranking")
+async def get_candidate_ranking(
+    job_id: str,
+    k: int = Query(10, ge=1, le=1000),
+    tie_breakers: Optional[str] = Query(None),
+):
+    """
+    Rank the stored analyses of a job by overall fitness score, breaking ties
+    by the given comma separated detailed metrics. No LLM calls are made.
+    """
+    try:
+        ranking = await run_in_threadpool(
+            leaderboards.rank,
+            job_id,
+            k,
+            parse_fields(tie_breakers) if tie_breakers is not None else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not ranking["total_candidates"]:
+        raise HTTPException(status_code=404, detail="No analyses found for this job")
+    return ORJSONResponse(content=ranking)
+
+
+@router.get("/jobs/{job_id}/analytics")
+async def get_job_analytics(
+    job_id: str,
+    top_skills: int = Query(10, ge=1, le=100),
+    matrix_rows: int = Query(50, ge=0, le=1000),
+):
+    """
+    Score distributions, most frequently missing required skills and a skills
+    coverage matrix across the stored analyses of a job. No LLM calls are made.
+    """
+    analytics = await run_in_threadpool(
+        job_analytics.summary, job_id, top_skills, matrix_rows
+    )
+    if not analytics["total_candidates"]:
+        raise HTTPException(status_code=404, detail="No analyses found for this job")
+    return ORJSONResponse(content=analytics)
+
+
+@router.get("/jobs/{job_id}/export")
+async def export_job_analyses(job_id: str, format: str = Query("csv")):
+    """
+    Stream every stored analysis of a job as a CSV or Parquet file, one row
+    per analysis with the score breakdown, detailed metrics and skill lists
+    flattened into columns
+    """
+    try:
+        chunks = export_analyses(analysis_store, job_id, format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    if not await run_in_threadpool(analysis_store.count_analyses, job_id):
+        raise HTTPException(status_code=404, detail="No analyses found for this job")
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_FORMATS[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="analyses-{job_id}.{format}"'
+        },
+    )
+
+
+@router.get("/job-cache/stats")
+async def get_job_cache_stats():
+    """
+    Hit rate of the near-identical job description cache and the distribution
+    of best similarities found
+    """
+    return ORJSONResponse(content=similar_jobs.snapshot())
+
+
+@router.post("/warmup")
+async def warmup():
+    """
+    Build the workflow and model clients ahead of the first analysis request
+    """
+    timings = await run_in_threadpool(warm_up)
+    return ORJSONResponse(content={"status": "warm", **timings})
+
+
+@router.get("/model-routing/stats")
+async def get_model_routing_stats():
+    """
+    Latency, token usage and estimated cost per model tier, plus hedging,
+    JSON repair and prompt context cache rates
+    """
+    return ORJSONResponse(
+        content={
+            **routing_stats.snapshot(),
+            "hedging": hedging_stats.snapshot(),
+            "json_repair": repair_stats.snapshot(),
+            "context_cache": prompt_cache.snapshot(),
+        }
+    )
 
 
 @router.get("/dashboard-sample")
@@ -123,4 +977,4 @@ async def get_dashboard_sample():
         },
     }
 
-    return JSONResponse(content=sample_data)
+    return ORJSONResponse(content=sample_data)
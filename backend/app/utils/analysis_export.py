@@ -0,0 +1,251 @@
+"""
+Bulk export of stored analyses as CSV or Parquet, one flat row per analysis.
+Rows are read, flattened and written in batches, so memory use stays the
+same however many analyses a job has.
+
+Usage (from the backend directory):
+    python -m app.utils.analysis_export --job-id <job_id> --format parquet -o out.parquet
+"""
+
+import argparse
+import csv
+import importlib.util
+import io
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import orjson
+from app.utils.analysis_store import AnalysisStore
+from app.utils.config import settings
+
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Column -> value type; "list" columns are string lists in Parquet and
+# "; " separated in CSV
+EXPORT_COLUMNS: List[Tuple[str, str]] = [
+    ("analysis_id", "int"),
+    ("job_id", "str"),
+    ("created_at", "str"),
+    ("candidate_name", "str"),
+    ("candidate_email", "str"),
+    ("job_title", "str"),
+    ("overall_fitness_score", "float"),
+    ("ranking_category", "str"),
+    ("recommendation", "str"),
+    ("confidence_level", "float"),
+    ("score_skills_match", "float"),
+    ("score_experience", "float"),
+    ("score_education", "float"),
+    ("score_cultural_fit", "float"),
+    ("skills_match_percentage", "float"),
+    ("experience_relevance", "float"),
+    ("education_alignment", "float"),
+    ("cultural_fit_score", "float"),
+    ("years_relevant_experience", "float"),
+    ("matched_skills", "list"),
+    ("missing_skills", "list"),
+    ("transferable_skills", "list"),
+]
+
+SCORE_BREAKDOWN_COLUMNS = {
+    "Skills Match": "score_skills_match",
+    "Experience": "score_experience",
+    "Education": "score_education",
+    "Cultural Fit": "score_cultural_fit",
+}
+DETAILED_METRIC_COLUMNS = [
+    "skills_match_percentage",
+    "experience_relevance",
+    "education_alignment",
+    "cultural_fit_score",
+    "years_relevant_experience",
+]
+SKILL_LIST_COLUMNS = ["matched_skills", "missing_skills", "transferable_skills"]
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def flatten_report(
+    analysis_id: int, job_id: str, created_at: str, report: Dict[str, Any]
+) -> Dict[str, Any]:
+    """One export row from a stored final report"""
+    candidate = report.get("candidate_summary", {})
+    scoring = report.get("scoring_overview", {})
+    breakdown = scoring.get("score_breakdown", {})
+    metrics = report.get("detailed_metrics", {})
+    skills = report.get("detailed_analysis", {}).get("skills", {})
+
+    row = {
+        "analysis_id": analysis_id,
+        "job_id": job_id,
+        "created_at": created_at,
+        "candidate_name": candidate.get("name"),
+        "candidate_email": candidate.get("email"),
+        "job_title": candidate.get("job_title"),
+        "overall_fitness_score": _number(scoring.get("overall_fitness_score")),
+        "ranking_category": scoring.get("ranking_category"),
+        "recommendation": scoring.get("recommendation"),
+        "confidence_level": _number(scoring.get("confidence_level")),
+    }
+    for name, column in SCORE_BREAKDOWN_COLUMNS.items():
+        row[column] = _number(breakdown.get(name))
+    for name in DETAILED_METRIC_COLUMNS:
+        row[name] = _number(metrics.get(name))
+    for name in SKILL_LIST_COLUMNS:
+        row[name] = [str(skill) for skill in skills.get(name) or []]
+    return row
+
+
+def _row_batches(
+    store: AnalysisStore, job_id: Optional[str], batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for analysis_id, row_job_id, created_at, report in store.iter_analysis_rows(
+        job_id, batch_size
+    ):
+        batch.append(flatten_report(analysis_id, row_job_id, created_at, orjson.loads(report)))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _csv_chunks(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    for batch in batches:
+        for row in batch:
+            writer.writerow(
+                [
+                    "; ".join(row[name]) if kind == "list" else row[name]
+                    for name, kind in EXPORT_COLUMNS
+                ]
+            )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _parquet_schema():
+    import pyarrow as pa
+
+    types = {
+        "int": pa.int64(),
+        "str": pa.string(),
+        "float": pa.float64(),
+        "list": pa.list_(pa.string()),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in EXPORT_COLUMNS])
+
+
+def _parquet_chunks(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    # Deferred so importing the app doesn't pull in pyarrow
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema()
+    sink = _ChunkSink()
+    # One row group per batch, streamed out as soon as it is written
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for batch in batches:
+            writer.write_table(
+                pa.Table.from_pydict(
+                    {name: [row[name] for row in batch] for name, _ in EXPORT_COLUMNS},
+                    schema=schema,
+                )
+            )
+            yield sink.drain()
+    yield sink.drain()
+
+
+def check_export_format(export_format: str):
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unknown export format {export_format!r}, expected one of: "
+            + ", ".join(EXPORT_FORMATS)
+        )
+    # pyarrow is optional; CSV export works without it
+    if export_format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        raise RuntimeError("Parquet export needs pyarrow installed")
+
+
+def export_analyses(
+    store: AnalysisStore,
+    job_id: Optional[str],
+    export_format: str,
+    batch_size: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Stream the analyses of a job (every job when job_id is None) as chunks
+    of a CSV or Parquet file
+    """
+    check_export_format(export_format)
+    batches = _row_batches(store, job_id, batch_size or settings.EXPORT_BATCH_SIZE)
+    if export_format == "csv":
+        return _csv_chunks(batches)
+    return _parquet_chunks(batches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export stored analyses")
+    parser.add_argument("--job-id", help="Only this job's analyses (default: all)")
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    parser.add_argument("--database", default=settings.DATABASE_PATH)
+    parser.add_argument("--batch-size", type=int, default=settings.EXPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    try:
+        chunks = export_analyses(
+            AnalysisStore(args.database), args.job_id, args.format, args.batch_size
+        )
+    except RuntimeError as e:
+        parser.error(str(e))
+
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
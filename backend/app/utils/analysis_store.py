@@ -0,0 +1,301 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from app.utils.config import settings
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    candidate_name TEXT,
+    overall_score REAL,
+    created_at TEXT NOT NULL,
+    report TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_job_id ON analyses (job_id, id);
+CREATE TABLE IF NOT EXISTS resume_signatures (
+    analysis_id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    tenant_id TEXT,
+    signature BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_resume_signatures_job_id ON resume_signatures (job_id);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    description TEXT NOT NULL,
+    requirements TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_signatures (
+    job_id TEXT PRIMARY KEY,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scoring_profiles (
+    scope TEXT NOT NULL,
+    scope_id TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    PRIMARY KEY (scope, scope_id)
+);
+CREATE TABLE IF NOT EXISTS question_banks (
+    job_key TEXT PRIMARY KEY,
+    questions TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+
+def job_id_for_description(job_description: str) -> str:
+    """Stable ID for a job description, insensitive to case and whitespace"""
+    normalized = " ".join(job_description.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+class AnalysisStore:
+    """
+    SQLite store for finished analyses. Writes share one connection behind a
+    lock; reads that stream many rows open their own connection so they
+    never hold up writers.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+        # Signatures saved before they were scoped by tenant keep a NULL
+        # tenant, so they never match any tenant's resumes
+        columns = {
+            row[1]
+            for row in self._connection.execute("PRAGMA table_info(resume_signatures)")
+        }
+        if "tenant_id" not in columns:
+            self._connection.execute(
+                "ALTER TABLE resume_signatures ADD COLUMN tenant_id TEXT"
+            )
+        self._connection.commit()
+
+    def save_analysis(self, job_id: str, report: Dict[str, Any]) -> int:
+        scoring = report.get("scoring_overview", {})
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO analyses (job_id, candidate_name, overall_score, created_at, report) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    report.get("candidate_summary", {}).get("name"),
+                    scoring.get("overall_fitness_score"),
+                    datetime.now().isoformat(),
+                    json.dumps(report),
+                ),
+            )
+            self._connection.commit()
+            return cursor.lastrowid
+
+    def get_analysis(self, analysis_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT report FROM analyses WHERE id = ?", (analysis_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count_analyses(self, job_id: str) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM analyses WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return row[0]
+
+    def iter_analyses(
+        self, job_id: str, batch_size: int = 500
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (analysis_id, report) for a job in insertion order, batch by batch"""
+        connection = sqlite3.connect(self.path)
+        try:
+            cursor = connection.execute(
+                "SELECT id, report FROM analyses WHERE job_id = ? ORDER BY id",
+                (job_id,),
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for analysis_id, report in rows:
+                    yield analysis_id, json.loads(report)
+        finally:
+            connection.close()
+
+    def iter_analysis_rows(
+        self, job_id: Optional[str] = None, batch_size: int = 1000
+    ) -> Iterator[Tuple[int, str, str, str]]:
+        """
+        Yield (analysis_id, job_id, created_at, report JSON) for one job, or
+        every job, without decoding the reports
+        """
+        query = "SELECT id, job_id, created_at, report FROM analyses"
+        params: Tuple[str, ...] = ()
+        if job_id is not None:
+            query += " WHERE job_id = ?"
+            params = (job_id,)
+        connection = sqlite3.connect(self.path)
+        try:
+            cursor = connection.execute(query + " ORDER BY id", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            connection.close()
+
+    def save_job(self, job_id: str, description: str, requirements: Dict[str, Any]):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, description, requirements, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (job_id, description, json.dumps(requirements), datetime.now().isoformat()),
+            )
+            self._connection.commit()
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT description, requirements, created_at FROM jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "job_id": job_id,
+            "description": row[0],
+            "requirements": json.loads(row[1]),
+            "created_at": row[2],
+        }
+
+    def save_scoring_profile(self, scope: str, scope_id: str, profile: Dict[str, Any]):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO scoring_profiles (scope, scope_id, profile) "
+                "VALUES (?, ?, ?)",
+                (scope, scope_id, json.dumps(profile)),
+            )
+            self._connection.commit()
+
+    def get_scoring_profile(self, scope: str, scope_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT profile FROM scoring_profiles WHERE scope = ? AND scope_id = ?",
+                (scope, scope_id),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_question_bank(self, job_key: str, questions: List[Dict[str, Any]]):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO question_banks (job_key, questions, created_at) "
+                "VALUES (?, ?, ?)",
+                (job_key, json.dumps(questions), datetime.now().isoformat()),
+            )
+            self._connection.commit()
+
+    def get_question_bank(self, job_key: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT questions FROM question_banks WHERE job_key = ?", (job_key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_score_breakdowns(
+        self, job_id: str, dimensions: List[str]
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yield (analysis_id, score, ...) with one score per dimension,
+        extracted by SQLite without decoding the whole report. Scores come
+        from exact_score_breakdown, or the rounded score_breakdown of
+        analyses stored before it was kept.
+        """
+        columns = ", ".join(
+            "coalesce(json_extract(report, ?), json_extract(report, ?))"
+            for _ in dimensions
+        )
+        paths = [
+            path
+            for name in dimensions
+            for path in (
+                f'$.scoring_overview.exact_score_breakdown."{name}"',
+                f'$.scoring_overview.score_breakdown."{name}"',
+            )
+        ]
+        connection = sqlite3.connect(self.path)
+        try:
+            yield from connection.execute(
+                f"SELECT id, {columns} FROM analyses WHERE job_id = ? ORDER BY id",
+                (*paths, job_id),
+            )
+        finally:
+            connection.close()
+
+    def update_overall_scores(self, updates: List[Tuple[float, str, str, int]]):
+        """
+        Rewrite the overall score, ranking category and recommendation of
+        stored analyses, given (score, category, recommendation, analysis_id)
+        """
+        with self._lock:
+            self._connection.executemany(
+                "UPDATE analyses SET overall_score = ?1, report = json_set(report, "
+                "'$.scoring_overview.overall_fitness_score', ?1, "
+                "'$.scoring_overview.ranking_category', ?2, "
+                "'$.scoring_overview.recommendation', ?3) WHERE id = ?4",
+                updates,
+            )
+            self._connection.commit()
+
+    def save_job_signature(self, job_id: str, signature: bytes):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO job_signatures (job_id, signature) VALUES (?, ?)",
+                (job_id, signature),
+            )
+            self._connection.commit()
+
+    def iter_job_signatures(self) -> Iterator[Tuple[str, bytes]]:
+        connection = sqlite3.connect(self.path)
+        try:
+            yield from connection.execute("SELECT job_id, signature FROM job_signatures")
+        finally:
+            connection.close()
+
+    def save_signature(
+        self, analysis_id: int, job_id: str, tenant_id: str, signature: bytes
+    ):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO resume_signatures "
+                "(analysis_id, job_id, tenant_id, signature) VALUES (?, ?, ?, ?)",
+                (analysis_id, job_id, tenant_id, signature),
+            )
+            self._connection.commit()
+
+    def iter_signatures(
+        self, job_id: str, tenant_id: str
+    ) -> Iterator[Tuple[int, bytes]]:
+        connection = sqlite3.connect(self.path)
+        try:
+            yield from connection.execute(
+                "SELECT analysis_id, signature FROM resume_signatures "
+                "WHERE job_id = ? AND tenant_id = ?",
+                (job_id, tenant_id),
+            )
+        finally:
+            connection.close()
+
+
+analysis_store = AnalysisStore(settings.DATABASE_PATH)
@@ -0,0 +1,111 @@
+import heapq
+import threading
+from typing import Any, Dict, List, Optional
+from app.utils.analysis_store import AnalysisStore, analysis_store
+
+
+# Secondary sort keys a caller may ask for, read from `detailed_metrics`
+RANKING_TIE_BREAKERS = [
+    "skills_match_percentage",
+    "years_relevant_experience",
+    "experience_relevance",
+    "education_alignment",
+    "cultural_fit_score",
+]
+DEFAULT_TIE_BREAKERS = ["skills_match_percentage", "years_relevant_experience"]
+
+
+class CandidateLeaderboard:
+    """Compact scoring entries for every analyzed candidate of one job"""
+
+    def __init__(self):
+        self._entries: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, analysis_id: int, report: Dict[str, Any]):
+        scoring = report.get("scoring_overview", {})
+        metrics = report.get("detailed_metrics", {})
+        entry = {
+            "analysis_id": analysis_id,
+            "candidate_name": report.get("candidate_summary", {}).get("name", ""),
+            "overall_fitness_score": scoring.get("overall_fitness_score", 0.0),
+            "ranking_category": scoring.get("ranking_category", ""),
+            "score_breakdown": scoring.get("score_breakdown", {}),
+            "detailed_metrics": {
+                name: metrics.get(name, 0) or 0 for name in RANKING_TIE_BREAKERS
+            },
+        }
+        with self._lock:
+            # Re-adding an analysis (e.g. after re-scoring) replaces its entry
+            self._entries[analysis_id] = entry
+
+    def top_k(self, k: int, tie_breakers: List[str]) -> List[Dict[str, Any]]:
+        def sort_key(entry):
+            metrics = entry["detailed_metrics"]
+            # Earlier analyses win full ties so the order is deterministic
+            return (
+                entry["overall_fitness_score"],
+                *(metrics[name] for name in tie_breakers),
+                -entry["analysis_id"],
+            )
+
+        with self._lock:
+            entries = list(self._entries.values())
+        top = heapq.nlargest(k, entries, key=sort_key)
+        return [{"rank": rank, **entry} for rank, entry in enumerate(top, start=1)]
+
+
+class LeaderboardRegistry:
+    """
+    Leaderboards per job, loaded from the store on first use and updated in
+    place as new analyses are recorded
+    """
+
+    def __init__(self, store: AnalysisStore):
+        self.store = store
+        self._boards: Dict[str, CandidateLeaderboard] = {}
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> CandidateLeaderboard:
+        with self._lock:
+            board = self._boards.get(job_id)
+            if board is None:
+                board = CandidateLeaderboard()
+                for analysis_id, report in self.store.iter_analyses(job_id):
+                    board.add(analysis_id, report)
+                self._boards[job_id] = board
+            return board
+
+    def invalidate(self, job_id: str):
+        """Drop a job's in-memory state, e.g. after its analyses were re-scored"""
+        with self._lock:
+            self._boards.pop(job_id, None)
+
+    def record(self, job_id: str, analysis_id: int, report: Dict[str, Any]):
+        with self._lock:
+            board = self._boards.get(job_id)
+        # Boards that aren't loaded yet will pick the analysis up from the store
+        if board is not None:
+            board.add(analysis_id, report)
+
+    def rank(
+        self, job_id: str, k: int, tie_breakers: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        tie_breakers = DEFAULT_TIE_BREAKERS if tie_breakers is None else tie_breakers
+        unknown = [name for name in tie_breakers if name not in RANKING_TIE_BREAKERS]
+        if unknown:
+            raise ValueError(f"Unknown tie-breakers: {', '.join(unknown)}")
+
+        board = self.get(job_id)
+        return {
+            "job_id": job_id,
+            "total_candidates": len(board),
+            "tie_breakers": tie_breakers,
+            "candidates": board.top_k(k, tie_breakers),
+        }
+
+
+leaderboards = LeaderboardRegistry(analysis_store)
@@ -5,8 +5,136 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY")
     MODEL_NAME: str = "gemini-2.5-flash"
+    # Model used for each tier, cheapest first. Unknown tiers fall back to MODEL_NAME
+    MODEL_TIERS: dict = {
+        "fast": "gemini-2.5-flash-lite",
+        "standard": "gemini-2.5-flash",
+        "strong": "gemini-2.5-pro",
+    }
+    # Base tier per agent; the adaptive policy may move one tier up or down
+    AGENT_MODEL_TIERS: dict = {
+        "job_parser": "fast",
+        "resume_extractor": "standard",
+        "skills_matcher": "fast",
+        "experience_evaluator": "standard",
+        "education_analyzer": "standard",
+        "cultural_fit": "standard",
+        "report_generator": "strong",
+    }
+    ADAPTIVE_MODEL_ROUTING: bool = True
+    # Re-asks of an agent whose output can't be parsed even after local repair
+    PARSE_REASKS: int = 1
+    # Default weight of each score in the overall fitness score and the minimum
+    # overall score per ranking category; jobs and tenants can override both
+    SCORE_WEIGHTS: dict = {
+        "Skills Match": 0.35,
+        "Experience": 0.35,
+        "Education": 0.15,
+        "Cultural Fit": 0.15,
+    }
+    SCORE_THRESHOLDS: dict = {"excellent": 8.5, "good": 7.0, "fair": 5.5}
+    ROUTING_SHORT_INPUT_CHARS: int = 4000
+    ROUTING_LONG_INPUT_CHARS: int = 24000
+    # USD per million input/output tokens, used for cost tracking only
+    MODEL_TIER_COSTS: dict = {
+        "fast": {"input": 0.10, "cached_input": 0.025, "output": 0.40},
+        "standard": {"input": 0.30, "cached_input": 0.075, "output": 2.50},
+        "strong": {"input": 1.25, "cached_input": 0.31, "output": 10.00},
+    }
+    # Context caching of the prompt prefix shared by every candidate of a job:
+    # "gemini" uses the provider's explicit caches, "local" only simulates them
+    # (for tests and benchmarks), "off" sends full prompts. Prefixes shorter
+    # than CONTEXT_CACHE_MIN_TOKENS are below the provider minimum
+    CONTEXT_CACHE_MODE: str = "off"
+    CONTEXT_CACHE_TTL_SECONDS: int = 600
+    CONTEXT_CACHE_MIN_TOKENS: int = 1024
+    # Hedged LLM requests: duplicate a call still running after the agent's
+    # HEDGE_PERCENTILE latency, with hedges capped at a fraction of all calls
+    HEDGING_ENABLED: bool = False
+    HEDGE_PERCENTILE: float = 0.95
+    HEDGE_MIN_SAMPLES: int = 20
+    HEDGE_MAX_EXTRA_FRACTION: float = 0.1
+    # Build the workflow and model clients in the background once the server starts
+    WARM_UP_ON_STARTUP: bool = False
+    # Responses smaller than this (bytes) are sent uncompressed
+    GZIP_MIN_SIZE: int = 1000
+    # SQLite file holding finished analyses
+    DATABASE_PATH: str = "hiresight.db"
+    # Analyses per batch (and Parquet row group) when exporting
+    EXPORT_BATCH_SIZE: int = 1000
+    # Near-duplicate resumes for the same job: "reuse" returns the earlier
+    # analysis without calling the LLMs, "flag" analyzes and marks the match
+    DUPLICATE_ACTION: str = "reuse"
+    DUPLICATE_SIMILARITY_THRESHOLD: float = 0.9
+    DUPLICATE_NUM_PERM: int = 128
+    DUPLICATE_LSH_BANDS: int = 16
+    # Derive transferable skills from the local skill graph instead of the LLM
+    LOCAL_TRANSFERABLE_SKILLS: bool = True
+    SKILL_GRAPH_MAX_HOPS: int = 2
+    SKILL_GRAPH_MIN_PROXIMITY: float = 0.5
+    # Token budgets. Near REQUEST_TOKEN_BUDGET the workflow downscales (truncated
+    # inputs, shorter report) rather than failing, but inputs are never cut below
+    # MIN_INPUT_CHARS: with less budget left the request fails with 429. A
+    # TENANT_TOKEN_BUDGET of 0 disables the tenant budget
+    REQUEST_TOKEN_BUDGET: int = 60000
+    # Shared by all analyses of one /analyze-batch or /match-jobs request, each
+    # still capped at REQUEST_TOKEN_BUDGET
+    BATCH_TOKEN_BUDGET: int = 300000
+    TOKEN_DOWNSCALE_RATIO: float = 0.75
+    TENANT_TOKEN_BUDGET: int = 0
+    TENANT_BUDGET_WINDOW_SECONDS: int = 24 * 60 * 60
+    RESUME_INPUT_BUDGET_SHARE: float = 0.3
+    JOB_INPUT_BUDGET_SHARE: float = 0.15
+    CHARS_PER_TOKEN: int = 4
+    MIN_INPUT_CHARS: int = 2000
+    # Request deadlines. Clients may send X-Request-Timeout (seconds), otherwise
+    # REQUEST_TIMEOUT_SECONDS applies (0 = no deadline). With less than
+    # REPORT_FULL_MIN_SECONDS left the report is kept brief without interview
+    # questions; under REPORT_MIN_SECONDS it is assembled locally
+    REQUEST_TIMEOUT_SECONDS: float = 0
+    REPORT_FULL_MIN_SECONDS: float = 30
+    REPORT_MIN_SECONDS: float = 10
+    # "sectioned" writes the report sections with concurrent smaller calls,
+    # "monolithic" asks for the whole report in one call
+    REPORT_MODE: str = "sectioned"
+    # Interview questions: INTERVIEW_BANK_SIZE role-level questions are written
+    # once per job, and each report merges INTERVIEW_BANK_QUESTIONS of them with
+    # INTERVIEW_PERSONAL_QUESTIONS written for the candidate's gaps and strengths
+    INTERVIEW_QUESTION_BANK: bool = True
+    INTERVIEW_BANK_SIZE: int = 10
+    INTERVIEW_BANK_QUESTIONS: int = 6
+    INTERVIEW_PERSONAL_QUESTIONS: int = 3
+    # Stream resume extraction and start the skills, experience and education
+    # analyses as soon as the resume fields they need have arrived
+    RESUME_STREAMING: bool = True
+    # Registered jobs kept in memory on top of the persistent store
+    JOB_REGISTRY_HOT_SIZE: int = 512
+    # Reuse the parsed requirements of a known job whose description is at least
+    # JOB_SIMILARITY_THRESHOLD similar, refining them from the changed lines
+    JOB_SIMILARITY_ENABLED: bool = True
+    JOB_SIMILARITY_THRESHOLD: float = 0.8
+    JOB_SIMILARITY_REFINE: bool = True
+    JOB_SIMILARITY_NUM_PERM: int = 128
+    JOB_SIMILARITY_LSH_BANDS: int = 32
+    # Resumes per /analyze-batch request and how many are analyzed at once
+    MAX_BATCH_FILES: int = 50
+    BATCH_CONCURRENCY: int = 4
+    # /match-jobs: jobs per request, and how many of them (at most, best local
+    # quick score first and at least MATCH_MIN_QUICK_SCORE) are analyzed in full
+    MAX_MATCH_JOBS: int = 50
+    MATCH_SHORTLIST_SIZE: int = 10
+    MATCH_MIN_QUICK_SCORE: float = 0.0
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_EXTENSIONS: list = [".pdf", ".txt"]
+    # Early reject: when the skills analysis scores below
+    # EARLY_REJECT_MAX_SKILLS_SCORE and at least EARLY_REJECT_MIN_MISSING_SHARE
+    # of the required skills are missing, skip the remaining analyses and the
+    # LLM report and return a compact rejection report
+    EARLY_REJECT_ENABLED: bool = False
+    EARLY_REJECT_MAX_SKILLS_SCORE: float = 3.0
+    EARLY_REJECT_MIN_MISSING_SHARE: float = 0.6
+    # Score cultural fit from locally scanned resume signals, skipping the LLM
+    CULTURAL_FIT_FAST_MODE: bool = False
 
     class Config:
         env_file = ".env"
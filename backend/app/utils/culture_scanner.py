@@ -0,0 +1,217 @@
+from collections import deque
+from functools import lru_cache
+from pydantic import BaseModel
+from typing import Dict, List, Tuple
+
+
+# Curated phrases that usually signal leadership, collaboration, adaptability
+# and communication in resume text. Job-specific culture keywords are added
+# on top of these at scan time.
+DEFAULT_SIGNAL_LEXICON: Dict[str, List[str]] = {
+    "leadership": [
+        "led",
+        "lead",
+        "leading",
+        "managed",
+        "mentored",
+        "mentoring",
+        "supervised",
+        "coached",
+        "directed",
+        "headed",
+        "spearheaded",
+        "team lead",
+        "tech lead",
+        "ownership",
+        "owned",
+        "drove",
+        "championed",
+        "hired",
+        "onboarded",
+        "initiated",
+        "founded",
+        "established",
+    ],
+    "collaboration": [
+        "collaborated",
+        "collaboration",
+        "collaborative",
+        "partnered",
+        "cross-functional",
+        "cross functional",
+        "teamwork",
+        "team player",
+        "worked closely",
+        "coordinated",
+        "pair programming",
+        "code review",
+        "code reviews",
+        "stakeholders",
+        "liaised",
+        "supported",
+        "contributed",
+    ],
+    "adaptability": [
+        "adapted",
+        "adaptable",
+        "fast-paced",
+        "fast paced",
+        "startup",
+        "migrated",
+        "transitioned",
+        "learned",
+        "self-taught",
+        "pivoted",
+        "ambiguity",
+        "multiple projects",
+        "quickly",
+    ],
+    "communication": [
+        "presented",
+        "presentation",
+        "communicated",
+        "documentation",
+        "documented",
+        "wrote",
+        "authored",
+        "published",
+        "trained",
+        "workshop",
+        "workshops",
+        "negotiated",
+        "public speaking",
+    ],
+}
+
+CULTURE_CATEGORY = "culture"
+
+
+class SignalHit(BaseModel):
+    phrase: str
+    category: str
+    start: int
+    end: int
+
+
+class CultureSignalEvidence(BaseModel):
+    hits: List[SignalHit]
+    counts: Dict[str, Dict[str, int]]
+
+    def phrases(self, category: str) -> List[str]:
+        """Distinct phrases found for a category, most frequent first"""
+        category_counts = self.counts.get(category, {})
+        return sorted(category_counts, key=lambda p: (-category_counts[p], p))
+
+    def total(self, category: str) -> int:
+        return sum(self.counts.get(category, {}).values())
+
+    def compact(self, max_phrases: int = 8) -> Dict[str, Dict[str, int]]:
+        """Hit counts per category trimmed for inclusion in an LLM prompt"""
+        return {
+            category: {
+                phrase: self.counts[category][phrase]
+                for phrase in self.phrases(category)[:max_phrases]
+            }
+            for category in self.counts
+        }
+
+
+class CultureSignalScanner:
+    """
+    Aho-Corasick automaton that finds every lexicon phrase in a single pass
+    over the text. Matching is case-insensitive and only whole words count.
+    """
+
+    def __init__(self, lexicon: Dict[str, List[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str]]] = [[]]
+
+        for category, phrases in lexicon.items():
+            for phrase in phrases:
+                normalized = " ".join(phrase.lower().split())
+                if normalized:
+                    self._add_phrase(normalized, category)
+
+        self._build_failure_links()
+
+    def _add_phrase(self, phrase: str, category: str):
+        node = 0
+        for char in phrase:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+
+        if (phrase, category) not in self._output[node]:
+            self._output[node].append((phrase, category))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child].extend(self._output[self._fail[child]])
+
+    def scan(self, text: str) -> CultureSignalEvidence:
+        hits: List[SignalHit] = []
+        counts: Dict[str, Dict[str, int]] = {}
+        # Original text offset of every character fed to the automaton, so
+        # spans stay correct when runs of whitespace are collapsed
+        positions: List[int] = []
+        node = 0
+
+        for index, raw_char in enumerate(text):
+            char = raw_char.lower()
+            if len(char) != 1:
+                char = raw_char
+            if char.isspace():
+                if positions and text[positions[-1]].isspace():
+                    continue
+                char = " "
+            positions.append(index)
+
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+
+            for phrase, category in self._output[node]:
+                start = positions[len(positions) - len(phrase)]
+                if not self._is_word_boundary(text, start, index + 1):
+                    continue
+                hits.append(
+                    SignalHit(phrase=phrase, category=category, start=start, end=index + 1)
+                )
+                category_counts = counts.setdefault(category, {})
+                category_counts[phrase] = category_counts.get(phrase, 0) + 1
+
+        return CultureSignalEvidence(hits=hits, counts=counts)
+
+    @staticmethod
+    def _is_word_boundary(text: str, start: int, end: int) -> bool:
+        before_ok = start == 0 or not text[start - 1].isalnum()
+        after_ok = end == len(text) or not text[end].isalnum()
+        return before_ok and after_ok
+
+
+@lru_cache(maxsize=128)
+def _cached_scanner(culture_keywords: Tuple[str, ...]) -> CultureSignalScanner:
+    lexicon = dict(DEFAULT_SIGNAL_LEXICON)
+    lexicon[CULTURE_CATEGORY] = list(culture_keywords)
+    return CultureSignalScanner(lexicon)
+
+
+def get_culture_scanner(company_culture_keywords: List[str]) -> CultureSignalScanner:
+    """Scanner for the default lexicon plus a job's culture keywords (cached)"""
+    keywords = tuple(sorted({k.strip().lower() for k in company_culture_keywords if k}))
+    return _cached_scanner(keywords)
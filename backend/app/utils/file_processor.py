@@ -1,10 +1,11 @@
-import PyPDF2
 import io
 
 
 class FileProcessor:
     @staticmethod
     def extract_text_from_pdf(file_content: bytes) -> str:
+        import PyPDF2
+
         try:
             pdf_file = io.BytesIO(file_content)
             pdf_reader = PyPDF2.PdfReader(pdf_file)
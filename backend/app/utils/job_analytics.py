@@ -0,0 +1,225 @@
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List
+from app.utils.analysis_store import AnalysisStore, analysis_store
+from app.utils.skill_graph import get_skill_graph
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+SCORE_DIMENSIONS = ["Overall", "Skills Match", "Experience", "Education", "Cultural Fit"]
+HISTOGRAM_BINS = 20  # 0.5 wide over the 0-10 score range
+PERCENTILES = [10, 25, 50, 75, 90]
+
+
+class JobAnalytics:
+    """
+    Pool-level aggregates for one job, updated in amortized O(1) per analysis:
+    a score matrix (one row per analysis, grown by doubling), histogram counts
+    per dimension, missing skill counts and a candidate x skill coverage matrix.
+    Re-adding an analysis replaces its earlier contribution.
+    """
+
+    def __init__(self, capacity: int = 64):
+        import numpy as np
+
+        self._rows: Dict[int, int] = {}  # analysis_id -> row
+        self._analysis_ids: List[int] = []
+        self._scores = np.zeros((capacity, len(SCORE_DIMENSIONS)), dtype=np.float32)
+        self._histograms = np.zeros(
+            (len(SCORE_DIMENSIONS), HISTOGRAM_BINS), dtype=np.int64
+        )
+        self._skills: Dict[str, int] = {}  # normalized skill -> column
+        self._coverage = np.zeros((capacity, 8), dtype=np.int8)  # 1 matched, -1 missing
+        self._missing = Counter()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._analysis_ids)
+
+    def _count(self, scores: "np.ndarray", delta: int):
+        """Add delta to the histogram bin of each analyzed dimension's score"""
+        import numpy as np
+
+        dimensions = np.flatnonzero(~np.isnan(scores))
+        bins = np.clip(
+            (scores[dimensions] * (HISTOGRAM_BINS / 10.0)).astype(np.int64),
+            0,
+            HISTOGRAM_BINS - 1,
+        )
+        self._histograms[dimensions, bins] += delta
+
+    def _skill_column(self, skill: str) -> int:
+        column = self._skills.get(skill)
+        if column is None:
+            column = len(self._skills)
+            self._skills[skill] = column
+            if column >= self._coverage.shape[1]:
+                import numpy as np
+
+                self._coverage = np.pad(
+                    self._coverage, ((0, 0), (0, self._coverage.shape[1]))
+                )
+        return column
+
+    def _ensure_capacity(self, rows: int):
+        if rows > len(self._scores):
+            import numpy as np
+
+            extra = len(self._scores)
+            self._scores = np.pad(self._scores, ((0, extra), (0, 0)))
+            self._coverage = np.pad(self._coverage, ((0, extra), (0, 0)))
+
+    def add(self, analysis_id: int, report: Dict[str, Any]):
+        import numpy as np
+
+        scoring = report.get("scoring_overview", {})
+        breakdown = scoring.get("score_breakdown", {})
+        # NaN for dimensions the analysis didn't cover
+        scores = np.array(
+            [scoring.get("overall_fitness_score", 0.0) or 0.0]
+            + [breakdown.get(name, np.nan) for name in SCORE_DIMENSIONS[1:]],
+            dtype=np.float32,
+        )
+        skills = report.get("detailed_analysis", {}).get("skills", {})
+        graph = get_skill_graph()
+        matched = {graph.normalize(skill) for skill in skills.get("matched_skills", [])}
+        missing = {graph.normalize(skill) for skill in skills.get("missing_skills", [])}
+        missing -= matched
+
+        with self._lock:
+            row = self._rows.get(analysis_id)
+            if row is None:
+                row = len(self._analysis_ids)
+                self._ensure_capacity(row + 1)
+                self._rows[analysis_id] = row
+                self._analysis_ids.append(analysis_id)
+            else:
+                # Take the earlier version of this analysis back out
+                self._count(self._scores[row], -1)
+                for skill, column in self._skills.items():
+                    if self._coverage[row, column] == -1:
+                        self._missing[skill] -= 1
+                self._coverage[row] = 0
+
+            self._scores[row] = scores
+            self._count(scores, 1)
+            for skill in matched:
+                self._coverage[row, self._skill_column(skill)] = 1
+            for skill in missing:
+                self._coverage[row, self._skill_column(skill)] = -1
+                self._missing[skill] += 1
+
+    def summary(self, top_skills: int = 10, matrix_rows: int = 50) -> Dict[str, Any]:
+        import numpy as np
+
+        with self._lock:
+            count = len(self._analysis_ids)
+            scores = self._scores[:count].copy()
+            histograms = self._histograms.copy()
+            skills = list(self._skills)
+            coverage = self._coverage[:count, : len(skills)].copy()
+            analysis_ids = list(self._analysis_ids)
+            missing = self._missing.most_common(top_skills)
+
+        edges = np.linspace(0.0, 10.0, HISTOGRAM_BINS + 1)
+        dimensions = {}
+        for index, name in enumerate(SCORE_DIMENSIONS):
+            column = scores[:, index]
+            column = column[~np.isnan(column)]
+            dimensions[name] = {
+                "count": len(column),
+                "mean": round(float(column.mean()), 2) if len(column) else 0.0,
+                "std": round(float(column.std()), 2) if len(column) else 0.0,
+                "percentiles": {
+                    f"p{p}": round(float(value), 2)
+                    for p, value in zip(
+                        PERCENTILES,
+                        np.percentile(column, PERCENTILES)
+                        if len(column)
+                        else [0.0] * len(PERCENTILES),
+                    )
+                },
+                "histogram": {
+                    "bin_edges": edges.round(1).tolist(),
+                    "counts": histograms[index].tolist(),
+                },
+            }
+
+        # Skills every candidate was assessed against, most commonly required first
+        assessed = (coverage != 0).sum(axis=0)
+        order = np.argsort(-assessed, kind="stable")
+        matched = (coverage == 1).sum(axis=0)
+        top_rows = np.argsort(-scores[:, 0], kind="stable")[:matrix_rows] if count else []
+
+        return {
+            "total_candidates": count,
+            "score_dimensions": dimensions,
+            "most_missing_skills": [
+                {
+                    "skill": skill,
+                    "missing_count": missing_count,
+                    "missing_rate": round(missing_count / count, 3),
+                }
+                for skill, missing_count in missing
+                if missing_count > 0
+            ],
+            "skills_coverage": {
+                "skills": [skills[i] for i in order],
+                "coverage_rate": [
+                    round(float(matched[i] / assessed[i]), 3) if assessed[i] else 0.0
+                    for i in order
+                ],
+                # Rows: top candidates by overall score. 1 matched, 0 missing,
+                # None when the skill wasn't assessed for that candidate
+                "candidates": [analysis_ids[row] for row in top_rows],
+                "matrix": [
+                    [
+                        None if coverage[row, i] == 0 else int(coverage[row, i] == 1)
+                        for i in order
+                    ]
+                    for row in top_rows
+                ],
+            },
+        }
+
+
+class AnalyticsRegistry:
+    """
+    Analytics per job, built from the store on first use and updated in place
+    as new analyses are recorded
+    """
+
+    def __init__(self, store: AnalysisStore):
+        self.store = store
+        self._jobs: Dict[str, JobAnalytics] = {}
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> JobAnalytics:
+        with self._lock:
+            analytics = self._jobs.get(job_id)
+            if analytics is None:
+                analytics = JobAnalytics()
+                for analysis_id, report in self.store.iter_analyses(job_id):
+                    analytics.add(analysis_id, report)
+                self._jobs[job_id] = analytics
+            return analytics
+
+    def invalidate(self, job_id: str):
+        """Drop a job's in-memory state, e.g. after its analyses were re-scored"""
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def record(self, job_id: str, analysis_id: int, report: Dict[str, Any]):
+        with self._lock:
+            analytics = self._jobs.get(job_id)
+        # Jobs that aren't loaded yet will pick the analysis up from the store
+        if analytics is not None:
+            analytics.add(analysis_id, report)
+
+    def summary(self, job_id: str, top_skills: int, matrix_rows: int) -> Dict[str, Any]:
+        return {"job_id": job_id, **self.get(job_id).summary(top_skills, matrix_rows)}
+
+
+job_analytics = AnalyticsRegistry(analysis_store)
@@ -0,0 +1,46 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from app.utils.analysis_store import AnalysisStore, analysis_store
+from app.utils.config import settings
+
+
+class JobRegistry:
+    """
+    Parsed job requirements by job ID. Every job is persisted in the analysis
+    store; recently used ones are also kept in an in-memory hot tier so
+    per-candidate requests neither re-parse nor re-read them.
+    """
+
+    def __init__(self, store: AnalysisStore, hot_size: int):
+        self.store = store
+        self.hot_size = hot_size
+        self._hot: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _promote(self, job_id: str, job_data: Dict[str, Any]):
+        with self._lock:
+            self._hot[job_id] = job_data
+            self._hot.move_to_end(job_id)
+            while len(self._hot) > self.hot_size:
+                self._hot.popitem(last=False)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job_data = self._hot.get(job_id)
+            if job_data is not None:
+                self._hot.move_to_end(job_id)
+                return job_data
+
+        job = self.store.get_job(job_id)
+        if job is None:
+            return None
+        self._promote(job_id, job["requirements"])
+        return job["requirements"]
+
+    def put(self, job_id: str, job_data: Dict[str, Any], job_description: str):
+        self.store.save_job(job_id, job_description, job_data)
+        self._promote(job_id, job_data)
+
+
+job_registry = JobRegistry(analysis_store, settings.JOB_REGISTRY_HOT_SIZE)
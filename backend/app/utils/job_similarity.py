@@ -0,0 +1,124 @@
+import difflib
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from app.utils.analysis_store import AnalysisStore, analysis_store
+from app.utils.config import settings
+from app.utils.near_duplicate import MinHasher, MinHashLSHIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def description_diff(old: str, new: str) -> List[str]:
+    """Lines removed from (-) and added to (+) a job description, ignoring blank lines"""
+    old_lines = [line.strip() for line in old.splitlines() if line.strip()]
+    new_lines = [line.strip() for line in new.splitlines() if line.strip()]
+    return [
+        line
+        for line in difflib.ndiff(old_lines, new_lines)
+        if line.startswith(("- ", "+ "))
+    ]
+
+
+class SimilarJobCache:
+    """
+    MinHash LSH index over the descriptions of parsed jobs, so a reworded
+    copy of a known job can reuse its parsed requirements. Loaded from the
+    store's saved signatures on first use. Also tracks the hit rate and the
+    best similarity found for each lookup.
+    """
+
+    def __init__(self, store: AnalysisStore, similarity_window: int = 1000):
+        self.store = store
+        self.hasher = MinHasher(settings.JOB_SIMILARITY_NUM_PERM)
+        self._index: Optional[MinHashLSHIndex] = None
+        self._job_ids: List[str] = []
+        self._keys: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self.exact_hits = 0
+        self.lookups = 0
+        self.hits = 0
+        self.refinements = 0
+        self._similarities: deque = deque(maxlen=similarity_window)
+
+    def _insert(self, job_id: str, signature: "np.ndarray"):
+        if job_id not in self._keys:
+            self._keys[job_id] = len(self._job_ids)
+            self._job_ids.append(job_id)
+        self._index.insert(self._keys[job_id], signature)
+
+    def _get_index(self) -> MinHashLSHIndex:
+        if self._index is None:
+            import numpy as np
+
+            self._index = MinHashLSHIndex(
+                settings.JOB_SIMILARITY_NUM_PERM, settings.JOB_SIMILARITY_LSH_BANDS
+            )
+            for job_id, signature in self.store.iter_job_signatures():
+                self._insert(job_id, np.frombuffer(signature, dtype=np.uint64))
+        return self._index
+
+    def find(
+        self, job_description: str
+    ) -> Tuple["np.ndarray", Optional[Tuple[str, float]]]:
+        """
+        Signature of the description and the (job_id, similarity) of the most
+        similar known job at or above JOB_SIMILARITY_THRESHOLD, if any
+        """
+        signature = self.hasher.signature(job_description)
+        with self._lock:
+            best = self._get_index().query(signature, 0.0)
+            similarity = best[1] if best else 0.0
+            self.lookups += 1
+            self._similarities.append(similarity)
+            if best is None or similarity < settings.JOB_SIMILARITY_THRESHOLD:
+                return signature, None
+            self.hits += 1
+            return signature, (self._job_ids[best[0]], similarity)
+
+    def record(self, job_id: str, signature: "np.ndarray"):
+        self.store.save_job_signature(job_id, signature.tobytes())
+        with self._lock:
+            self._insert(job_id, signature)
+
+    def count_exact_hit(self):
+        with self._lock:
+            self.exact_hits += 1
+
+    def count_refinement(self):
+        with self._lock:
+            self.refinements += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        import numpy as np
+
+        with self._lock:
+            similarities = np.array(self._similarities, dtype=np.float64)
+            counts, edges = np.histogram(similarities, bins=10, range=(0.0, 1.0))
+            return {
+                "threshold": settings.JOB_SIMILARITY_THRESHOLD,
+                "indexed_jobs": len(self._job_ids),
+                "exact_hits": self.exact_hits,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+                "refinements": self.refinements,
+                "similarity": {
+                    "samples": len(similarities),
+                    "p50": round(float(np.percentile(similarities, 50)), 3)
+                    if len(similarities)
+                    else 0.0,
+                    "p90": round(float(np.percentile(similarities, 90)), 3)
+                    if len(similarities)
+                    else 0.0,
+                    "histogram": {
+                        f"{edges[i]:.1f}-{edges[i + 1]:.1f}": int(counts[i])
+                        for i in range(len(counts))
+                    },
+                },
+            }
+
+
+similar_jobs = SimilarJobCache(analysis_store)
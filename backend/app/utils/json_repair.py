@@ -0,0 +1,238 @@
+import json
+import re
+import threading
+import typing
+from typing import Any, Dict, List, Optional, Type
+from pydantic import BaseModel, ValidationError
+
+
+# Valid range per numeric field name; any other field ending in _score is 0-10
+FIELD_RANGES = {
+    "field_of_study_relevance": (0.0, 10.0),
+    "hiring_confidence": (0.0, 1.0),
+    "relevant_experience_years": (0.0, 80.0),
+}
+SCORE_RANGE = (0.0, 10.0)
+
+_NUMBER_PATTERN = re.compile(r"-?\d+(?:\.\d+)?")
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def _drop_trailing_comma(out: List[str]):
+    index = len(out) - 1
+    while index >= 0 and out[index].isspace():
+        index -= 1
+    if index >= 0 and out[index] == ",":
+        del out[index]
+
+
+def repair_json_text(text: str, openers: str = "{[") -> str:
+    """
+    Best-effort fix of the usual LLM JSON mistakes: text or ``` fences around
+    the object, trailing commas, raw newlines in strings, Python literals
+    (True/False/None) and output cut off before the closing brackets. The
+    value starts at the first of openers, so openers="{" skips prose such
+    as "Note [1]:" before an object.
+    """
+    starts = [index for index in map(text.find, openers) if index != -1]
+    if not starts:
+        return text
+    out: List[str] = []
+    closers: List[str] = []
+    in_string = False
+    escaped = False
+    index = min(starts)
+
+    while index < len(text):
+        char = text[index]
+        index += 1
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            elif char == "\n":
+                char = "\\n"
+            elif char == "\t":
+                char = "\\t"
+            elif char == "\r":
+                continue
+            out.append(char)
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            if closers:
+                closers.pop()
+            out.append(char)
+            if not closers:
+                break  # ignore whatever follows the top-level value
+            continue
+        elif char.isalpha():
+            word_end = index
+            while word_end < len(text) and text[word_end].isalpha():
+                word_end += 1
+            word = text[index - 1 : word_end]
+            out.append(_PYTHON_LITERALS.get(word, word))
+            index = word_end
+            continue
+        out.append(char)
+
+    # Cut off mid-value: close the open string and brackets
+    if in_string:
+        out.append('"')
+    if closers:
+        _drop_trailing_comma(out)
+        while out and out[-1].isspace():
+            out.pop()
+        if out and out[-1] == ":":
+            out.append("null")
+        out.extend(reversed(closers))
+    return "".join(out)
+
+
+def _field_range(name: str) -> Optional[tuple]:
+    if name in FIELD_RANGES:
+        return FIELD_RANGES[name]
+    return SCORE_RANGE if name.endswith("_score") else None
+
+
+def _coerce_number(value: Any) -> Any:
+    """Numbers written as strings, e.g. "7.5", "8/10" or "~6"""
+    if isinstance(value, str):
+        match = _NUMBER_PATTERN.search(value)
+        if match:
+            return float(match.group())
+    return value
+
+
+def _clamp(value: Any, bounds: Optional[tuple]) -> Any:
+    if bounds is None or not isinstance(value, (int, float)) or isinstance(value, bool):
+        return value
+    return min(max(value, bounds[0]), bounds[1])
+
+
+def _coerce(value: Any, annotation: Any, name: str = "") -> Any:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Union:
+        if value is None and type(None) in args:
+            return None
+        # Optional[X]: coerce as X
+        options = [arg for arg in args if arg is not type(None)]
+        return _coerce(value, options[0], name) if len(options) == 1 else value
+    if annotation is str:
+        if value is None:
+            return ""
+        return str(value) if isinstance(value, (int, float)) else value
+    if annotation in (int, float):
+        value = _coerce_number(value)
+        if isinstance(value, float) and annotation is int:
+            value = round(value)
+        return _clamp(value, _field_range(name))
+    if origin in (list, List):
+        item_type = args[0] if args else Any
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            value = [value]
+        return [_coerce(item, item_type) for item in value]
+    if origin in (dict, Dict) and value is None:
+        return {}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return coerce_to_model(value, annotation)
+    return value
+
+
+def coerce_to_model(data: Any, model: Type[BaseModel]) -> Any:
+    """Coerce decoded JSON toward a model's field types, clamping scores"""
+    if not isinstance(data, dict):
+        return data
+    coerced = dict(data)
+    for name, field in model.model_fields.items():
+        if name in coerced:
+            coerced[name] = _coerce(coerced[name], field.annotation, name)
+    return coerced
+
+
+def clamp_scores(instance: BaseModel):
+    """Clamp the score fields of a parsed model (and nested models) in place"""
+    for name in type(instance).model_fields:
+        value = getattr(instance, name)
+        if isinstance(value, BaseModel):
+            clamp_scores(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, BaseModel):
+                    clamp_scores(item)
+        else:
+            clamped = _clamp(value, _field_range(name))
+            if clamped != value:
+                setattr(instance, name, clamped)
+
+
+def repair_output(text: str, model: Type[BaseModel]) -> Optional[BaseModel]:
+    """Parse model output the strict parser rejected, or None if it can't be saved"""
+    try:
+        # Every model parses from a JSON object
+        data = json.loads(repair_json_text(text, "{"))
+        return model.model_validate(coerce_to_model(data, model))
+    except (ValueError, ValidationError):
+        return None
+
+
+class RepairStats:
+    """How often unparseable output was repaired locally or needed a re-ask"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._agents: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, agent_name: str, key: str):
+        with self._lock:
+            stats = self._agents.setdefault(
+                agent_name,
+                {"parse_failures": 0, "repaired": 0, "reasks": 0, "reask_successes": 0},
+            )
+            stats[key] += 1
+
+    def record_repair(self, agent_name: str, repaired: bool):
+        self._count(agent_name, "parse_failures")
+        if repaired:
+            self._count(agent_name, "repaired")
+
+    def record_reask(self, agent_name: str, parsed: bool):
+        self._count(agent_name, "reasks")
+        if parsed:
+            self._count(agent_name, "reask_successes")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            agents = {name: dict(stats) for name, stats in self._agents.items()}
+        totals = {
+            key: sum(stats[key] for stats in agents.values())
+            for key in ("parse_failures", "repaired", "reasks", "reask_successes")
+        }
+        failures = totals["parse_failures"]
+        return {
+            **totals,
+            "repair_success_rate": (
+                round(totals["repaired"] / failures, 3) if failures else 0.0
+            ),
+            "reask_success_rate": (
+                round(totals["reask_successes"] / totals["reasks"], 3)
+                if totals["reasks"]
+                else 0.0
+            ),
+            "agents": agents,
+        }
+
+
+repair_stats = RepairStats()
@@ -0,0 +1,453 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+from app.utils.config import settings
+from app.utils.json_repair import clamp_scores, repair_output, repair_stats
+from app.utils.prompt_cache import prompt_cache
+from app.utils.request_context import (
+    DeadlineExceeded,
+    current_request,
+    estimate_tokens,
+)
+
+
+OUTPUT_COMPLEXITIES = ("low", "medium", "high")
+
+REASK_SUFFIX = (
+    "\n\nYour previous reply could not be parsed. Reply again with only the "
+    "JSON object, following the format instructions above exactly."
+)
+
+
+class RoutingStats:
+    """
+    Thread-safe latency, token and cost counters per model tier, used to tune
+    the routing table
+    """
+
+    def __init__(self, latency_window: int = 200):
+        self._lock = threading.Lock()
+        self._latency_window = latency_window
+        self._tiers: Dict[str, Dict[str, Any]] = {}
+        self._agents: Dict[str, Dict[str, int]] = {}
+
+    def record(
+        self,
+        agent_name: str,
+        tier: str,
+        latency: float,
+        input_tokens: int,
+        output_tokens: int,
+        parsed: bool,
+        cached_tokens: int = 0,
+    ):
+        costs = settings.MODEL_TIER_COSTS.get(tier, {})
+        input_cost = costs.get("input", 0.0)
+        cost = (
+            (input_tokens - cached_tokens) * input_cost
+            + cached_tokens * costs.get("cached_input", input_cost)
+            + output_tokens * costs.get("output", 0.0)
+        ) / 1_000_000
+
+        with self._lock:
+            tier_stats = self._tiers.setdefault(
+                tier,
+                {
+                    "calls": 0,
+                    "parse_failures": 0,
+                    "input_tokens": 0,
+                    "cached_input_tokens": 0,
+                    "output_tokens": 0,
+                    "cost_usd": 0.0,
+                    "total_latency": 0.0,
+                    "latencies": deque(maxlen=self._latency_window),
+                },
+            )
+            tier_stats["calls"] += 1
+            tier_stats["parse_failures"] += 0 if parsed else 1
+            tier_stats["input_tokens"] += input_tokens
+            tier_stats["cached_input_tokens"] += cached_tokens
+            tier_stats["output_tokens"] += output_tokens
+            tier_stats["cost_usd"] += cost
+            tier_stats["total_latency"] += latency
+            tier_stats["latencies"].append(latency)
+
+            agent_stats = self._agents.setdefault(agent_name, {})
+            agent_stats[tier] = agent_stats.get(tier, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            tiers = {}
+            for tier, stats in self._tiers.items():
+                latencies = sorted(stats["latencies"])
+                p95_index = max(int(len(latencies) * 0.95) - 1, 0)
+                tiers[tier] = {
+                    "model": settings.MODEL_TIERS.get(tier, settings.MODEL_NAME),
+                    "calls": stats["calls"],
+                    "parse_failures": stats["parse_failures"],
+                    "input_tokens": stats["input_tokens"],
+                    "cached_input_tokens": stats["cached_input_tokens"],
+                    "output_tokens": stats["output_tokens"],
+                    "cost_usd": round(stats["cost_usd"], 6),
+                    "avg_latency_seconds": round(
+                        stats["total_latency"] / stats["calls"], 3
+                    ),
+                    "p95_latency_seconds": (
+                        round(latencies[p95_index], 3) if latencies else 0.0
+                    ),
+                }
+            return {
+                "tiers": tiers,
+                "agents": {name: dict(counts) for name, counts in self._agents.items()},
+            }
+
+
+routing_stats = RoutingStats()
+
+
+class HedgingStats:
+    """
+    Recent latencies per agent, used to time hedged requests, plus counters
+    that cap hedges to a fraction of all calls
+    """
+
+    def __init__(self, latency_window: int = 100):
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, deque] = {}
+        self._latency_window = latency_window
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def observe_latency(self, agent_name: str, latency: float):
+        with self._lock:
+            self._latencies.setdefault(
+                agent_name, deque(maxlen=self._latency_window)
+            ).append(latency)
+
+    def hedge_delay(self, agent_name: str) -> Optional[float]:
+        """Configured latency percentile for the agent, once enough samples exist"""
+        with self._lock:
+            latencies = sorted(self._latencies.get(agent_name, ()))
+        if len(latencies) < settings.HEDGE_MIN_SAMPLES:
+            return None
+        index = min(int(len(latencies) * settings.HEDGE_PERCENTILE), len(latencies) - 1)
+        return latencies[index]
+
+    def count_call(self):
+        with self._lock:
+            self.calls += 1
+
+    def try_start_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.calls * settings.HEDGE_MAX_EXTRA_FRACTION:
+                return False
+            self.hedges += 1
+            return True
+
+    def count_hedge_win(self):
+        with self._lock:
+            self.hedge_wins += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": settings.HEDGING_ENABLED,
+                "calls": self.calls,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "hedge_rate": round(self.hedges / self.calls, 4) if self.calls else 0.0,
+                "win_rate": (
+                    round(self.hedge_wins / self.hedges, 4) if self.hedges else 0.0
+                ),
+            }
+
+
+hedging_stats = HedgingStats()
+
+_llm_executor = ThreadPoolExecutor(thread_name_prefix="llm-call")
+
+
+def _submit(fn, *args) -> Future:
+    # Carry the request context over to the worker thread
+    context = contextvars.copy_context()
+    return _llm_executor.submit(context.run, fn, *args)
+
+
+def _result_within(future: Future, timeout: Optional[float], agent_name: str):
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        future.cancel()
+        raise DeadlineExceeded(
+            f"{agent_name}: no response within the request deadline"
+        )
+
+
+_llm_cache: Dict[tuple, Any] = {}
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm(model_name: str, api_key: str, temperature: float):
+    """Shared chat client per model/temperature so agents don't duplicate clients"""
+    key = (model_name, api_key, temperature)
+    with _llm_cache_lock:
+        llm = _llm_cache.get(key)
+        if llm is None:
+            # Deferred so importing the app doesn't pull in the Gemini SDK
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            llm = ChatGoogleGenerativeAI(
+                model=model_name, api_key=api_key, temperature=temperature
+            )
+            _llm_cache[key] = llm
+        return llm
+
+
+class ModelRouter:
+    """
+    Picks the model tier for an agent call. Output the parser rejects is
+    repaired locally; if that fails the agent is re-asked on a stronger tier.
+    """
+
+    def __init__(self, api_key: str, agent_name: str, temperature: float):
+        self.api_key = api_key
+        self.agent_name = agent_name
+        self.temperature = temperature
+
+    @staticmethod
+    def tier_order() -> List[str]:
+        return list(settings.MODEL_TIERS)
+
+    def base_tier(self) -> str:
+        tiers = self.tier_order()
+        tier = settings.AGENT_MODEL_TIERS.get(self.agent_name)
+        if tier in tiers:
+            return tier
+        return "standard" if "standard" in tiers else tiers[0]
+
+    def warm_up(self):
+        """Create the clients for every tier this agent can be routed to"""
+        tiers = self.tier_order()
+        # Adaptive routing can step one tier below the base and escalate above it
+        lowest = max(tiers.index(self.base_tier()) - 1, 0)
+        for tier in tiers[lowest:]:
+            get_llm(
+                settings.MODEL_TIERS.get(tier, settings.MODEL_NAME),
+                self.api_key,
+                self.temperature,
+            )
+
+    def select_tier(self, input_chars: int, output_complexity: str = "medium") -> str:
+        """Adaptive policy: move one tier from the agent's base by input size and output complexity"""
+        tiers = self.tier_order()
+        index = tiers.index(self.base_tier())
+
+        if settings.ADAPTIVE_MODEL_ROUTING:
+            if (
+                input_chars > settings.ROUTING_LONG_INPUT_CHARS
+                or output_complexity == "high"
+            ):
+                index += 1
+            elif (
+                input_chars < settings.ROUTING_SHORT_INPUT_CHARS
+                and output_complexity == "low"
+            ):
+                index -= 1
+
+        return tiers[min(max(index, 0), len(tiers) - 1)]
+
+    def invoke(
+        self,
+        prompt,
+        parser,
+        inputs: Dict[str, Any],
+        output_complexity: str = "medium",
+        tier: Optional[str] = None,
+        stream_listener=None,
+    ):
+        """
+        Format the prompt, call the routed model and parse the response. With a
+        stream_listener the response is streamed: the listener is reset at the
+        start of every attempt and fed each chunk of text as it arrives.
+        """
+        from langchain_core.exceptions import OutputParserException
+        from langchain_core.prompt_values import StringPromptValue
+
+        prompt_value = prompt.format_prompt(**inputs)
+        tiers = self.tier_order()
+        current = tier or self.select_tier(
+            len(prompt_value.to_string()), output_complexity
+        )
+        result, parsed = self._call(current, prompt_value, parser, stream_listener)
+        if parsed:
+            return result
+
+        # Repair failed too: re-ask, on the next stronger tier if there is one
+        reask_value = StringPromptValue(text=prompt_value.to_string() + REASK_SUFFIX)
+        for _ in range(settings.PARSE_REASKS):
+            model_name = settings.MODEL_TIERS.get(current, settings.MODEL_NAME)
+            current = tiers[min(tiers.index(current) + 1, len(tiers) - 1)]
+            print(
+                f"{self.agent_name}: could not parse or repair {model_name} output, "
+                f"re-asking on the {current} tier..."
+            )
+            result, parsed = self._call(current, reask_value, parser, stream_listener)
+            repair_stats.record_reask(self.agent_name, parsed)
+            if parsed:
+                return result
+
+        raise OutputParserException(
+            f"{self.agent_name}: no parseable output after repair and re-ask"
+        )
+
+    def _call(
+        self, tier: str, prompt_value, parser, stream_listener=None
+    ) -> Tuple[Any, bool]:
+        """
+        One routed call, bounded by the time left before the request deadline.
+        Raises DeadlineExceeded when the deadline passes first, and
+        TokenBudgetExhausted when the request has no tokens left.
+        """
+        request = current_request()
+        timeout = None
+        if request is not None:
+            request.check_budget(self.agent_name)
+            timeout = request.check_deadline(self.agent_name)
+        # Streamed calls aren't hedged: two streams would interleave their chunks
+        if settings.HEDGING_ENABLED and stream_listener is None:
+            return self._hedged_attempt(tier, prompt_value, parser, timeout)
+        if timeout is None:
+            return self._attempt(tier, prompt_value, parser, stream_listener)
+        return _result_within(
+            _submit(self._attempt, tier, prompt_value, parser, stream_listener),
+            timeout,
+            self.agent_name,
+        )
+
+    def _attempt(
+        self, tier: str, prompt_value, parser, stream_listener=None
+    ) -> Tuple[Any, bool]:
+        """One model call with usage accounting. Returns (result, parsed)."""
+        from langchain_core.exceptions import OutputParserException
+
+        model_name = settings.MODEL_TIERS.get(tier, settings.MODEL_NAME)
+        llm = get_llm(model_name, self.api_key, self.temperature)
+        prompt_text = prompt_value.to_string()
+        # With context caching only the candidate part may be sent
+        payload, cache_kwargs, cached_estimate = prompt_cache.prepare(
+            model_name, self.api_key, prompt_text
+        )
+
+        start = time.perf_counter()
+        if stream_listener is None:
+            message = llm.invoke(payload, **cache_kwargs)
+        else:
+            stream_listener.reset()
+            message = None
+            try:
+                for chunk in llm.stream(payload, **cache_kwargs):
+                    if isinstance(chunk.content, str):
+                        stream_listener.feed(chunk.content)
+                    message = chunk if message is None else message + chunk
+            except ValueError:
+                # LangChain raises ValueError when no chunk was generated
+                if message is not None:
+                    raise
+            if message is None:
+                # The stream ended without a chunk: ask again without streaming
+                print(f"{self.agent_name}: empty stream from {model_name}, invoking instead...")
+                message = llm.invoke(payload, **cache_kwargs)
+                if isinstance(message.content, str):
+                    stream_listener.feed(message.content)
+        latency = time.perf_counter() - start
+
+        usage = getattr(message, "usage_metadata", None) or {}
+        input_tokens = usage.get("input_tokens") or estimate_tokens(prompt_text)
+        output_tokens = usage.get("output_tokens") or estimate_tokens(
+            str(message.content)
+        )
+        # Provider-reported cache reads also cover its implicit prefix caching
+        cache_read = (usage.get("input_token_details") or {}).get("cache_read")
+        cached_tokens = min(cache_read or cached_estimate, input_tokens)
+        request = current_request()
+        if request is not None:
+            request.record_usage(
+                self.agent_name, input_tokens, output_tokens, cached_tokens
+            )
+
+        try:
+            result = parser.invoke(message)
+            clamp_scores(result)
+            parsed = True
+        except OutputParserException:
+            result = repair_output(str(message.content), parser.pydantic_object)
+            parsed = result is not None
+            repair_stats.record_repair(self.agent_name, parsed)
+
+        routing_stats.record(
+            self.agent_name,
+            tier,
+            latency,
+            input_tokens,
+            output_tokens,
+            parsed,
+            cached_tokens,
+        )
+        hedging_stats.observe_latency(self.agent_name, latency)
+        return result, parsed
+
+    def _hedged_attempt(
+        self, tier: str, prompt_value, parser, timeout: Optional[float] = None
+    ) -> Tuple[Any, bool]:
+        """
+        Fire a duplicate call when the first hasn't returned by the agent's
+        usual latency percentile; the first parsed result wins. A running call
+        can't be interrupted, so the losing call is cancelled if still queued
+        and its result is otherwise discarded.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        def time_left() -> Optional[float]:
+            return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+        primary = _submit(self._attempt, tier, prompt_value, parser)
+        delay = hedging_stats.hedge_delay(self.agent_name)
+        hedging_stats.count_call()
+        if delay is None or (timeout is not None and delay >= timeout):
+            return _result_within(primary, time_left(), self.agent_name)
+
+        done, _ = wait([primary], timeout=delay)
+        if done or not hedging_stats.try_start_hedge():
+            return _result_within(primary, time_left(), self.agent_name)
+
+        print(f"{self.agent_name}: no response after {delay:.1f}s, sending a hedged request...")
+        hedge = _submit(self._attempt, tier, prompt_value, parser)
+        pending = {primary, hedge}
+        fallback: Optional[Future] = None
+
+        while pending:
+            done, pending = wait(
+                pending, timeout=time_left(), return_when=FIRST_COMPLETED
+            )
+            if not done:
+                for other in pending:
+                    other.cancel()
+                raise DeadlineExceeded(
+                    f"{self.agent_name}: no response within the request deadline"
+                )
+            for future in done:
+                if future.exception() is None and future.result()[1]:
+                    for other in pending:
+                        other.cancel()
+                    if future is hedge:
+                        hedging_stats.count_hedge_win()
+                    return future.result()
+                fallback = fallback or future
+
+        # Neither call produced a parsed result: surface the first outcome
+        return fallback.result()
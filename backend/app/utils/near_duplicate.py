@@ -0,0 +1,180 @@
+import re
+import threading
+import zlib
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+from app.utils.analysis_store import AnalysisStore, analysis_store
+from app.utils.config import settings
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Smallest prime above 2**32, so (a * x + b) mod p never overflows uint64 for
+# 32-bit shingle hashes and coefficients
+HASH_PRIME = 4294967311
+SHINGLE_SIZE = 3
+
+_WORD_PATTERN = re.compile(r"[a-z]+")
+
+
+def normalize_resume_text(text: str) -> List[str]:
+    """
+    Lower-cased words with digits and punctuation dropped, so resumes that
+    differ only in formatting or dates normalize to the same tokens
+    """
+    return _WORD_PATTERN.findall(text.lower())
+
+
+def shingle_hashes(tokens: List[str], size: int = SHINGLE_SIZE) -> "np.ndarray":
+    import numpy as np
+
+    if len(tokens) < size:
+        shingles = {" ".join(tokens)} if tokens else set()
+    else:
+        shingles = {
+            " ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)
+        }
+    return np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        self.num_perm = num_perm
+        self.seed = seed
+        self._coefficients = None
+
+    def _permutations(self):
+        # Drawn on first use, so the module-level registries don't import numpy
+        if self._coefficients is None:
+            import numpy as np
+
+            rng = np.random.RandomState(self.seed)
+            self._coefficients = (
+                rng.randint(1, 2**32, size=self.num_perm, dtype=np.uint64),
+                rng.randint(0, 2**32, size=self.num_perm, dtype=np.uint64),
+            )
+        return self._coefficients
+
+    def signature(self, text: str) -> "np.ndarray":
+        import numpy as np
+
+        hashes = shingle_hashes(normalize_resume_text(text))
+        prime = np.uint64(HASH_PRIME)
+        if not len(hashes):
+            return np.full(self.num_perm, prime, dtype=np.uint64)
+        a, b = self._permutations()
+        permuted = (np.outer(a, hashes) + b[:, None]) % prime
+        return permuted.min(axis=1)
+
+
+def estimate_similarity(first: "np.ndarray", second: "np.ndarray") -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures"""
+    import numpy as np
+
+    return float(np.count_nonzero(first == second)) / len(first)
+
+
+class MinHashLSHIndex:
+    """
+    Banded locality-sensitive hashing over MinHash signatures. Signatures
+    that agree on every row of at least one band become candidates, and
+    candidates are then checked against the similarity threshold.
+    """
+
+    def __init__(self, num_perm: int, bands: int):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by the number of bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, List[int]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self._signatures: Dict[int, "np.ndarray"] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: "np.ndarray"):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows].tobytes()
+
+    def insert(self, key: int, signature: "np.ndarray"):
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band][band_key].append(key)
+
+    def candidates(self, signature: "np.ndarray") -> Set[int]:
+        found: Set[int] = set()
+        for band, band_key in self._band_keys(signature):
+            found.update(self._buckets[band].get(band_key, ()))
+        return found
+
+    def query(
+        self, signature: "np.ndarray", threshold: float
+    ) -> Optional[Tuple[int, float]]:
+        """Most similar indexed key at or above the threshold, if any"""
+        best = None
+        for key in self.candidates(signature):
+            similarity = estimate_similarity(signature, self._signatures[key])
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+
+class NearDuplicateRegistry:
+    """
+    One LSH index of analyzed resumes per job and tenant, loaded from the
+    store's saved signatures on first use. Tenants never see each other's
+    analyses, even for the same job description.
+    """
+
+    def __init__(self, store: AnalysisStore):
+        self.store = store
+        self.hasher = MinHasher(settings.DUPLICATE_NUM_PERM)
+        self._indexes: Dict[Tuple[str, str], MinHashLSHIndex] = {}
+        self._lock = threading.Lock()
+
+    def _get_index(self, job_id: str, tenant_id: str) -> MinHashLSHIndex:
+        index = self._indexes.get((job_id, tenant_id))
+        if index is None:
+            index = MinHashLSHIndex(
+                settings.DUPLICATE_NUM_PERM, settings.DUPLICATE_LSH_BANDS
+            )
+            import numpy as np
+
+            signatures = self.store.iter_signatures(job_id, tenant_id)
+            for analysis_id, signature in signatures:
+                index.insert(analysis_id, np.frombuffer(signature, dtype=np.uint64))
+            self._indexes[(job_id, tenant_id)] = index
+        return index
+
+    def find_duplicate(
+        self, job_id: str, tenant_id: str, signature: "np.ndarray"
+    ) -> Optional[Tuple[int, float]]:
+        """
+        (analysis_id, similarity) of an earlier near-identical resume the
+        tenant analyzed for the job
+        """
+        with self._lock:
+            return self._get_index(job_id, tenant_id).query(
+                signature, settings.DUPLICATE_SIMILARITY_THRESHOLD
+            )
+
+    def record(
+        self, job_id: str, tenant_id: str, analysis_id: int, signature: "np.ndarray"
+    ):
+        self.store.save_signature(analysis_id, job_id, tenant_id, signature.tobytes())
+        with self._lock:
+            index = self._indexes.get((job_id, tenant_id))
+            if index is not None:
+                index.insert(analysis_id, signature)
+
+
+near_duplicates = NearDuplicateRegistry(analysis_store)
@@ -0,0 +1,102 @@
+import json
+from typing import Any, Callable, List, Set, Tuple, Type
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+
+class IncrementalJSONObjectParser:
+    """
+    Parses a JSON object arriving in chunks (e.g. streamed LLM output) and
+    returns each top-level member as soon as its value is complete. Text
+    before the opening brace, such as a ```json fence, is skipped.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start = None
+        self.done = False
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """Add a chunk and return the (key, value) members it completed"""
+        self._buffer += text
+        members = []
+
+        while self._position < len(self._buffer) and not self.done:
+            char = self._buffer[self._position]
+            index = self._position
+            self._position += 1
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    self._member_start = index + 1
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    members.extend(self._complete_member(index))
+                    self.done = True
+            elif char == "," and self._depth == 1:
+                members.extend(self._complete_member(index))
+                self._member_start = index + 1
+
+        return members
+
+    def _complete_member(self, end: int) -> List[Tuple[str, Any]]:
+        member = self._buffer[self._member_start : end].strip()
+        if not member:
+            return []
+        try:
+            return list(json.loads("{" + member + "}").items())
+        except ValueError:
+            # Leave malformed members to the full parse of the final output
+            return []
+
+
+class PartialModelParser:
+    """
+    Validated fields of a pydantic model, passed to on_field as they complete
+    in a streamed JSON object. Each field is reported at most once, even when
+    the stream restarts (reset) for a retry.
+    """
+
+    def __init__(self, model: Type[BaseModel], on_field: Callable[[str, Any], None]):
+        self.on_field = on_field
+        self._adapters = {
+            name: TypeAdapter(field.annotation)
+            for name, field in model.model_fields.items()
+        }
+        self._emitted: Set[str] = set()
+        self._json = IncrementalJSONObjectParser()
+
+    def reset(self):
+        self._json = IncrementalJSONObjectParser()
+
+    def feed(self, text: str):
+        for name, value in self._json.feed(text):
+            adapter = self._adapters.get(name)
+            if adapter is None or name in self._emitted:
+                continue
+            try:
+                validated = adapter.validate_python(value)
+            except ValidationError:
+                continue
+            self._emitted.add(name)
+            self.on_field(name, adapter.dump_python(validated))
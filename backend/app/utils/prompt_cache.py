@@ -0,0 +1,157 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from app.utils.config import settings
+from app.utils.request_context import estimate_tokens
+
+
+# Agent prompts put their stable parts (instructions, format instructions,
+# job requirements) first and the candidate's data after this line, so every
+# candidate analyzed for a job shares the same prompt prefix
+CANDIDATE_DATA_MARKER = "=== Candidate data ==="
+
+CACHE_MODES = ("off", "local", "gemini")
+
+
+def stable_json(value: Any) -> str:
+    """Serialize prompt data the same way every time so shared prefixes match"""
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def split_prompt(text: str) -> Tuple[str, str]:
+    """(shared prefix, candidate part); the prefix is empty without a marker"""
+    index = text.find(CANDIDATE_DATA_MARKER)
+    if index == -1:
+        return "", text
+    return text[:index], text[index:]
+
+
+class PromptCache:
+    """
+    Context caching of the shared prompt prefix. "gemini" stores the prefix
+    as explicit cached content through the Gemini API and sends only the
+    candidate part with each call; "local" is a stand-in that tracks which
+    prefixes would be cached, without calling the provider, so cached token
+    counts can be checked in tests and benchmarks.
+    """
+
+    def __init__(self, mode: str, ttl_seconds: int, min_tokens: int):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown context cache mode: {mode}")
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.min_tokens = min_tokens
+        # prefix key -> (cache name, or None if it couldn't be created; reuse until)
+        self._entries: Dict[str, Tuple[Optional[str], float]] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "created": 0, "failures": 0}
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def _reuse_until(self) -> float:
+        # Stop handing out a cache a little before it expires at the provider
+        margin = min(30.0, self.ttl_seconds / 10)
+        return time.monotonic() + self.ttl_seconds - margin
+
+    def _create(self, model_name: str, api_key: str, prefix: str) -> Optional[str]:
+        if self.mode == "local":
+            return "local"
+        try:
+            # Deferred so importing the app doesn't pull in the Gemini SDK
+            from google import genai
+            from google.genai import types
+        except ImportError as e:
+            print(
+                "WARNING: context caching mode is 'gemini' but the google-genai "
+                f"package can't be imported ({str(e)}); sending full prompts"
+            )
+            self._count("failures")
+            return None
+        try:
+            cache = genai.Client(api_key=api_key).caches.create(
+                model=model_name,
+                config=types.CreateCachedContentConfig(
+                    contents=[types.Content(role="user", parts=[types.Part(text=prefix)])],
+                    display_name="hiresight-prompt-prefix",
+                    ttl=f"{self.ttl_seconds}s",
+                ),
+            )
+        except Exception as e:
+            # e.g. a prefix under the model's minimum: send full prompts until expiry
+            print(f"Could not create context cache for {model_name}: {str(e)}")
+            self._count("failures")
+            return None
+        self._count("created")
+        return cache.name
+
+    def _cache_name(self, model_name: str, api_key: str, prefix: str) -> Tuple[Optional[str], bool]:
+        """(cache name, whether it already existed)"""
+        key = hashlib.sha256(f"{model_name}\0{prefix}".encode("utf-8")).hexdigest()
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Concurrent calls with the same prefix wait for one cache to be created
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            existed = entry is not None and entry[1] > time.monotonic()
+            if existed:
+                name = entry[0]
+            else:
+                name = self._create(model_name, api_key, prefix)
+                with self._lock:
+                    # Forget expired prefixes, e.g. of jobs no longer analyzed
+                    now = time.monotonic()
+                    for expired in [
+                        k for k, (_, until) in self._entries.items() if until <= now
+                    ]:
+                        del self._entries[expired]
+                    self._entries[key] = (name, self._reuse_until())
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return name, existed
+
+    def prepare(self, model_name: str, api_key: str, text: str) -> Tuple[str, Dict[str, Any], int]:
+        """
+        (prompt text to send, extra model call arguments, estimated prompt
+        tokens served from the cache)
+        """
+        if self.mode == "off":
+            return text, {}, 0
+        prefix, candidate_part = split_prompt(text)
+        prefix_tokens = estimate_tokens(prefix) if prefix else 0
+        if prefix_tokens < self.min_tokens:
+            return text, {}, 0
+
+        name, existed = self._cache_name(model_name, api_key, prefix)
+        self._count("hits" if existed and name else "misses")
+        if name is None:
+            return text, {}, 0
+        if self.mode == "local":
+            # Like the provider, the call that fills the cache pays for the prefix
+            return text, {}, prefix_tokens if existed else 0
+        return candidate_part, {"cached_content": name}, prefix_tokens
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            now = time.monotonic()
+            live = sum(1 for name, until in self._entries.values() if name and until > now)
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            "mode": self.mode,
+            **stats,
+            "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+            "live_prefixes": live,
+        }
+
+
+prompt_cache = PromptCache(
+    settings.CONTEXT_CACHE_MODE,
+    settings.CONTEXT_CACHE_TTL_SECONDS,
+    settings.CONTEXT_CACHE_MIN_TOKENS,
+)
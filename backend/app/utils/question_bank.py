@@ -0,0 +1,75 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List
+from app.utils.analysis_store import AnalysisStore, analysis_store
+from app.utils.config import settings
+from app.utils.prompt_cache import stable_json
+
+
+def question_bank_key(job_data: Dict[str, Any]) -> str:
+    """Key of a parsed job's question bank; re-parsed requirements get a new bank"""
+    return hashlib.sha256(stable_json(job_data).encode("utf-8")).hexdigest()[:16]
+
+
+class QuestionBankRegistry:
+    """
+    Role-level interview questions per parsed job, generated once and shared
+    by every candidate of the job. Banks are persisted in the analysis store
+    and the recently used ones kept in memory.
+    """
+
+    def __init__(self, store: AnalysisStore, hot_size: int):
+        self.store = store
+        self.hot_size = hot_size
+        self._hot: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _promote(self, key: str, questions: List[Dict[str, Any]]):
+        with self._lock:
+            self._hot[key] = questions
+            self._hot.move_to_end(key)
+            while len(self._hot) > self.hot_size:
+                self._hot.popitem(last=False)
+
+    def _lookup(self, key: str):
+        with self._lock:
+            questions = self._hot.get(key)
+            if questions is not None:
+                self._hot.move_to_end(key)
+                return questions
+        questions = self.store.get_question_bank(key)
+        if questions is not None:
+            self._promote(key, questions)
+        return questions
+
+    def get_or_create(
+        self,
+        job_data: Dict[str, Any],
+        generate: Callable[[], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """The job's bank, generated with generate() the first time it is needed"""
+        key = question_bank_key(job_data)
+        questions = self._lookup(key)
+        if questions is not None:
+            return questions
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Concurrent candidates of a new job wait for a single generation
+        try:
+            with key_lock:
+                questions = self._lookup(key)
+                if questions is None:
+                    questions = generate()
+                    self.store.save_question_bank(key, questions)
+                    self._promote(key, questions)
+        finally:
+            # Also when generate() fails, so failed jobs don't leak their lock
+            with self._lock:
+                self._key_locks.pop(key, None)
+        return questions
+
+
+question_banks = QuestionBankRegistry(analysis_store, settings.JOB_REGISTRY_HOT_SIZE)
@@ -0,0 +1,314 @@
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from app.utils.analysis_store import job_id_for_description
+from app.utils.culture_scanner import CultureSignalScanner, get_culture_scanner
+from app.utils.job_registry import job_registry
+from app.utils.scoring_profile import scoring_profiles
+from app.utils.skill_graph import find_transferable_skills, get_skill_graph
+
+
+# Highest level first, so the first match is the candidate's top degree
+DEGREE_LEVELS: List[Tuple[int, str]] = [
+    (4, r"ph\.?\s?d|doctorate|doctor of"),
+    # A bare "master" is too often a job title ("Scrum Master")
+    (
+        3,
+        r"(?<!scrum )master['’]?s?\s+(?:degree|of|in)"
+        r"|m\.?sc|m\.s\.|mba|m\.tech|m\.eng",
+    ),
+    (2, r"bachelor'?s?|b\.?sc|b\.s\.|b\.a\.|b\.tech|b\.e\.|undergraduate degree"),
+    (1, r"associate'?s? degree|diploma"),
+]
+
+SENIORITY_YEARS = {
+    "intern": 0,
+    "entry": 0,
+    "junior": 1,
+    "mid": 3,
+    "senior": 5,
+    "lead": 7,
+    "staff": 8,
+    "principal": 8,
+}
+
+_DEGREE_PATTERNS = [
+    (level, re.compile(rf"(?<![a-z]){pattern}(?![a-z])", re.IGNORECASE))
+    for level, pattern in DEGREE_LEVELS
+]
+_YEARS_PATTERN = re.compile(r"\b(\d{1,2})\+?\s*(?:years?|yrs?)\b", re.IGNORECASE)
+MONTHS = [
+    "jan(?:uary)?",
+    "feb(?:ruary)?",
+    "mar(?:ch)?",
+    "apr(?:il)?",
+    "may",
+    "june?",
+    "july?",
+    "aug(?:ust)?",
+    "sept?(?:ember)?",
+    "oct(?:ober)?",
+    "nov(?:ember)?",
+    "dec(?:ember)?",
+]
+# Optional month before a year: a name ("Jan", "Sept.", "March") or a number
+# ("03/2016", "3.2016")
+_MONTH = rf"(?:({'|'.join(MONTHS)})\.?,?\s+|(0?[1-9]|1[0-2])\s*[/.]\s*)?"
+_MONTH_NAMES = [re.compile(rf"{name}$", re.IGNORECASE) for name in MONTHS]
+_DATE_RANGE_PATTERN = re.compile(
+    rf"\b{_MONTH}((?:19|20)\d{{2}})\s*(?:-|–|—|to)\s*"
+    rf"{_MONTH}((?:19|20)\d{{2}}|present|current|now)\b",
+    re.IGNORECASE,
+)
+_PREFERRED_PATTERN = re.compile(
+    r"preferred|nice to have|nice-to-have|bonus|a plus", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=128)
+def _skill_scanner(job_skills: Tuple[str, ...]) -> CultureSignalScanner:
+    """Phrase scanner over the skill graph vocabulary plus a job's own skills"""
+    graph = get_skill_graph()
+    lexicon: Dict[str, List[str]] = {skill: [skill] for skill in graph.skills}
+    for alias, skill in graph.aliases.items():
+        lexicon.setdefault(skill, [skill]).append(alias)
+    for skill in job_skills:
+        lexicon.setdefault(graph.normalize(skill), [skill])
+    return CultureSignalScanner(lexicon)
+
+
+def find_skills(text: str, job_skills: List[str]) -> List[str]:
+    """Normalized skills mentioned in the text, most frequent first"""
+    scanner = _skill_scanner(tuple(sorted(set(job_skills))))
+    counts = scanner.scan(text).counts
+    return sorted(counts, key=lambda skill: (-sum(counts[skill].values()), skill))
+
+
+def detect_degree_level(text: str) -> Tuple[int, str]:
+    """(level, line mentioning it) of the highest degree in the text, 0 if none"""
+    for level, pattern in _DEGREE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            line_start = text.rfind("\n", 0, match.start()) + 1
+            line_end = text.find("\n", match.end())
+            return level, text[line_start : line_end if line_end != -1 else None]
+    return 0, ""
+
+
+def _month_index(name: Optional[str], number: Optional[str]) -> int:
+    if name:
+        return next(i for i, pattern in enumerate(_MONTH_NAMES) if pattern.match(name))
+    return int(number) - 1 if number else 0
+
+
+def estimate_years_of_experience(text: str) -> float:
+    """
+    Larger of the explicit "N years" claims and the total span of the
+    resume's date ranges (overlapping ranges are merged)
+    """
+    claimed = max((int(years) for years in _YEARS_PATTERN.findall(text)), default=0)
+
+    # In months since year 0; a range without months counts from January
+    now = datetime.now()
+    current = now.year * 12 + now.month - 1
+    ranges = []
+    for match in _DATE_RANGE_PATTERN.finditer(text):
+        start_name, start_number, start_year, end_name, end_number, end_year = (
+            match.groups()
+        )
+        start = int(start_year) * 12 + _month_index(start_name, start_number)
+        end = (
+            int(end_year) * 12 + _month_index(end_name, end_number)
+            if end_year.isdigit()
+            else current
+        )
+        if start <= end <= current:
+            ranges.append((start, end))
+
+    spanned = 0
+    merged_end = None
+    for start, end in sorted(ranges):
+        if merged_end is None or start > merged_end:
+            spanned += end - start
+            merged_end = end
+        elif end > merged_end:
+            spanned += end - merged_end
+            merged_end = end
+
+    return float(max(claimed, round(spanned / 12, 1)))
+
+
+def required_years(job_data: Dict[str, Any], job_description: str = "") -> int:
+    level_text = f"{job_data.get('experience_level', '')} {job_data.get('seniority_level', '')}"
+    match = _YEARS_PATTERN.search(level_text) or _YEARS_PATTERN.search(job_description)
+    if match:
+        return int(match.group(1))
+    level_text = level_text.lower()
+    return max(
+        (years for word, years in SENIORITY_YEARS.items() if word in level_text),
+        default=0,
+    )
+
+
+def extract_job_requirements(job_description: str) -> Dict[str, Any]:
+    """
+    Rough job requirements without the job parser: skills from the skill
+    graph vocabulary (those in lines mentioning "preferred", "bonus" and the
+    like count as preferred) and the degree and years asked for
+    """
+    required: List[str] = []
+    preferred: List[str] = []
+    for line in job_description.splitlines():
+        skills = find_skills(line, [])
+        target = preferred if _PREFERRED_PATTERN.search(line) else required
+        target.extend(skill for skill in skills if skill not in target)
+
+    degree_level, degree_line = detect_degree_level(job_description)
+    years = required_years({}, job_description)
+    lines = [line.strip() for line in job_description.splitlines() if line.strip()]
+    return {
+        "role_title": lines[0][:100] if lines else "",
+        "required_skills": required,
+        "preferred_skills": [skill for skill in preferred if skill not in required],
+        "experience_level": f"{years} years" if years else "",
+        "education_requirements": [degree_line.strip()] if degree_level else [],
+        "company_culture_keywords": [],
+        "industry": "",
+        "seniority_level": "",
+    }
+
+
+def _skills_score(
+    candidate_skills: List[str], job_data: Dict[str, Any]
+) -> Tuple[float, Dict[str, Any]]:
+    graph = get_skill_graph()
+    candidate = set(candidate_skills)
+    required = list(dict.fromkeys(graph.normalize(s) for s in job_data["required_skills"]))
+    preferred = list(
+        dict.fromkeys(graph.normalize(s) for s in job_data.get("preferred_skills", []))
+    )
+
+    matched = [skill for skill in required if skill in candidate]
+    missing = [skill for skill in required if skill not in candidate]
+    # Missing skills the candidate has a close neighbour of earn half credit
+    transferable = {
+        skill: matches[0][0]
+        for skill, matches in find_transferable_skills(candidate_skills, missing).items()
+        if matches
+    }
+    preferred_matched = [skill for skill in preferred if skill in candidate]
+
+    required_share = (
+        (len(matched) + 0.5 * len(transferable)) / len(required) if required else 0.5
+    )
+    if preferred:
+        share = 0.8 * required_share + 0.2 * len(preferred_matched) / len(preferred)
+    else:
+        share = required_share
+
+    return 10.0 * share, {
+        "matched_skills": matched,
+        "missing_skills": missing,
+        "transferable_skills": transferable,
+        "preferred_skills_matched": preferred_matched,
+    }
+
+
+def _experience_score(years: float, years_required: int) -> float:
+    if years_required <= 0:
+        return 7.0 if years > 0 else 5.0
+    return 10.0 * min(years / years_required, 1.0)
+
+
+def _education_score(
+    resume_text: str, job_data: Dict[str, Any]
+) -> Tuple[float, Dict[str, Any]]:
+    # Deferred: the agents modules pull in langchain
+    from app.agents.education_analyzer import EducationScoringEngine
+
+    level, degree_line = detect_degree_level(resume_text)
+    required_level, _ = detect_degree_level(
+        "\n".join(job_data.get("education_requirements", []))
+    )
+
+    if level >= required_level:
+        level_score = 10.0 if level else 6.0
+    else:
+        level_score = max(10.0 - 3.0 * (required_level - level), 2.0)
+    relevance = (
+        EducationScoringEngine.calculate_degree_relevance(
+            degree_line, job_data.get("role_title", "")
+        )
+        if level
+        else 5.0
+    )
+
+    return 0.6 * level_score + 0.4 * relevance, {
+        "degree_level": level,
+        "required_degree_level": required_level,
+        "degree": degree_line.strip(),
+    }
+
+
+def _cultural_score(resume_text: str, job_data: Dict[str, Any]) -> float:
+    from app.agents.cultural_fit import CulturalFitAgent
+
+    keywords = job_data.get("company_culture_keywords", [])
+    evidence = get_culture_scanner(keywords).scan(resume_text)
+    return CulturalFitAgent.analyze_from_evidence(evidence, keywords).cultural_fit_score
+
+
+def quick_score(
+    job_description: str,
+    resume_text: str,
+    job_id: Optional[str] = None,
+    tenant_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Approximate fitness score from local heuristics only, no LLM calls. Uses
+    the parsed job requirements when the job is registered or has been
+    analyzed before, and a local extraction from the description otherwise.
+    Scores are weighted like the full workflow's, per the job's scoring profile.
+    """
+    start = time.perf_counter()
+    job_id = job_id or job_id_for_description(job_description)
+    job_data: Optional[Dict[str, Any]] = job_registry.get(job_id)
+    source = "parsed"
+    if job_data is None:
+        job_data = extract_job_requirements(job_description)
+        source = "local"
+
+    candidate_skills = find_skills(
+        resume_text,
+        job_data["required_skills"] + job_data.get("preferred_skills", []),
+    )
+    skills_score, skills_details = _skills_score(candidate_skills, job_data)
+    years = estimate_years_of_experience(resume_text)
+    years_required = required_years(job_data, job_description)
+    education_score, education_details = _education_score(resume_text, job_data)
+
+    score_breakdown = {
+        "Skills Match": round(skills_score, 1),
+        "Experience": round(_experience_score(years, years_required), 1),
+        "Education": round(education_score, 1),
+        "Cultural Fit": round(_cultural_score(resume_text, job_data), 1),
+    }
+    scoring_profile, _ = scoring_profiles.resolve(job_id, tenant_id)
+    overall_score = scoring_profile.overall_score(score_breakdown)
+
+    return {
+        "job_id": job_id,
+        "job_requirements_source": source,
+        "approximate": True,
+        "overall_fitness_score": round(overall_score, 1),
+        "score_breakdown": score_breakdown,
+        "details": {
+            **skills_details,
+            "years_experience": years,
+            "years_required": years_required,
+            **education_details,
+        },
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
@@ -0,0 +1,283 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from app.utils.config import settings
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count used before the provider reports real usage"""
+    return len(text) // settings.CHARS_PER_TOKEN + 1
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class TokenBudgetExhausted(Exception):
+    pass
+
+
+class RequestContext:
+    """
+    Per-request accounting shared by every agent call made while handling one
+    API request: token usage against the budget, the request deadline and the
+    report sections that had to be degraded
+    """
+
+    def __init__(
+        self,
+        tenant_id: str,
+        token_budget: int,
+        timeout_seconds: Optional[float] = None,
+        pool: Optional["TokenPool"] = None,
+    ):
+        self.tenant_id = tenant_id
+        self.token_budget = token_budget
+        self.pool = pool
+        self.deadline = (
+            time.monotonic() + timeout_seconds if timeout_seconds else None
+        )
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.calls: List[Dict[str, Any]] = []
+        self.downscaled: List[str] = []
+        self.degraded_sections: Dict[str, str] = {}
+        self.budget_exhausted = False
+        self._lock = threading.Lock()
+
+    def remaining_seconds(self) -> Optional[float]:
+        """Time left before the deadline, None when the request has no deadline"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def deadline_passed(self) -> bool:
+        remaining = self.remaining_seconds()
+        return remaining is not None and remaining <= 0
+
+    def check_deadline(self, what: str) -> Optional[float]:
+        """Remaining seconds, raising DeadlineExceeded if none are left"""
+        if self.deadline_passed():
+            raise DeadlineExceeded(f"Request deadline exceeded before {what}")
+        return self.remaining_seconds()
+
+    def mark_degraded(self, sections: List[str], reason: str):
+        with self._lock:
+            for section in sections:
+                self.degraded_sections.setdefault(section, reason)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def remaining_tokens(self) -> int:
+        remaining = self.token_budget - self.total_tokens
+        if self.pool is not None:
+            remaining = min(remaining, self.pool.remaining)
+        return max(remaining, 0)
+
+    def record_usage(
+        self,
+        agent_name: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cached_prompt_tokens: int = 0,
+    ):
+        """cached_prompt_tokens: the part of prompt_tokens read from a context cache"""
+        with self._lock:
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            self.cached_prompt_tokens += cached_prompt_tokens
+            if self.pool is not None:
+                self.pool.charge(prompt_tokens + completion_tokens)
+            self.calls.append(
+                {
+                    "agent": agent_name,
+                    "prompt_tokens": prompt_tokens,
+                    "cached_prompt_tokens": cached_prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                }
+            )
+
+    def near_budget(self) -> bool:
+        downscale_at = self.token_budget * (1 - settings.TOKEN_DOWNSCALE_RATIO)
+        return self.remaining_tokens <= downscale_at
+
+    def mark_downscaled(self, what: str):
+        with self._lock:
+            if what not in self.downscaled:
+                self.downscaled.append(what)
+
+    def fit_input(self, name: str, text: str, max_share: float) -> str:
+        """
+        Truncate text that would use more than max_share of the remaining
+        budget. Raises TokenBudgetExhausted rather than cut it below
+        MIN_INPUT_CHARS, which would leave too little to analyze.
+        """
+        max_chars = int(self.remaining_tokens * max_share) * settings.CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        if max_chars < settings.MIN_INPUT_CHARS:
+            self.budget_exhausted = True
+            raise TokenBudgetExhausted(
+                f"Token budget too low to analyze the {name} "
+                f"({len(text)} characters, {max_chars} allowed)"
+            )
+        self.mark_downscaled(f"{name}_truncated")
+        print(f"Truncating {name} from {len(text)} to {max_chars} characters")
+        return text[:max_chars]
+
+    def check_budget(self, what: str):
+        """Raise TokenBudgetExhausted if no tokens are left for another call"""
+        if self.remaining_tokens <= 0:
+            self.budget_exhausted = True
+            raise TokenBudgetExhausted(f"Token budget exhausted before {what}")
+
+    def usage_summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "prompt_tokens": self.prompt_tokens,
+                "cached_prompt_tokens": self.cached_prompt_tokens,
+                "uncached_prompt_tokens": self.prompt_tokens - self.cached_prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "total_tokens": self.total_tokens,
+                "budget": self.token_budget,
+                "remaining": self.remaining_tokens,
+                "downscaled": list(self.downscaled),
+                "calls": list(self.calls),
+            }
+
+
+def combine_usage(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Token totals over the usage summaries of several requests, e.g. a batch"""
+    totals = {
+        key: sum(summary.get(key, 0) for summary in summaries)
+        for key in (
+            "prompt_tokens",
+            "cached_prompt_tokens",
+            "uncached_prompt_tokens",
+            "completion_tokens",
+            "total_tokens",
+        )
+    }
+    prompt_tokens = totals["prompt_tokens"]
+    return {
+        **totals,
+        "cached_prompt_share": (
+            round(totals["cached_prompt_tokens"] / prompt_tokens, 4)
+            if prompt_tokens
+            else 0.0
+        ),
+        "requests": len(summaries),
+    }
+
+
+class TenantTokenLedger:
+    """Tokens used per tenant within a rolling fixed window"""
+
+    def __init__(self, budget: int, window_seconds: int):
+        self.budget = budget
+        self.window_seconds = window_seconds
+        self._usage: Dict[str, List[float]] = {}  # tenant -> [window_start, tokens]
+        self._lock = threading.Lock()
+
+    def _window(self, tenant_id: str) -> List[float]:
+        now = time.time()
+        window = self._usage.get(tenant_id)
+        if window is None or now - window[0] >= self.window_seconds:
+            window = [now, 0]
+            self._usage[tenant_id] = window
+        return window
+
+    def remaining(self, tenant_id: str) -> Optional[int]:
+        """Tokens left for the tenant in this window, None when unlimited"""
+        if self.budget <= 0:
+            return None
+        with self._lock:
+            return max(self.budget - int(self._window(tenant_id)[1]), 0)
+
+    def add(self, tenant_id: str, tokens: int):
+        with self._lock:
+            self._window(tenant_id)[1] += tokens
+
+    def reserve(self, tenant_id: str, tokens: int) -> int:
+        """Set aside up to tokens of the tenant's allowance; all of them if unlimited"""
+        with self._lock:
+            window = self._window(tenant_id)
+            if self.budget > 0:
+                tokens = min(tokens, max(self.budget - int(window[1]), 0))
+            window[1] += tokens
+            return tokens
+
+    def settle(self, tenant_id: str, reserved: int, used: int):
+        """Replace a reservation with the tokens actually used"""
+        with self._lock:
+            window = self._window(tenant_id)
+            window[1] = max(window[1] + used - reserved, 0)
+
+
+tenant_ledger = TenantTokenLedger(
+    settings.TENANT_TOKEN_BUDGET, settings.TENANT_BUDGET_WINDOW_SECONDS
+)
+
+_current_request: ContextVar[Optional[RequestContext]] = ContextVar(
+    "current_request", default=None
+)
+
+
+def current_request() -> Optional[RequestContext]:
+    return _current_request.get()
+
+
+class TokenPool:
+    """
+    Tokens reserved against the tenant's allowance for one API request and
+    shared by every analysis it runs, so a batch can't spend more than the
+    pool and concurrent analyses can't overshoot the tenant budget together
+    """
+
+    def __init__(self, tenant_id: str, tokens: int):
+        self.tenant_id = tenant_id
+        self.reserved = tenant_ledger.reserve(tenant_id, tokens)
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return self.reserved - self.used
+
+    def charge(self, tokens: int):
+        with self._lock:
+            self.used += tokens
+
+    def close(self):
+        """Charge the tenant for the tokens used and release the rest"""
+        tenant_ledger.settle(self.tenant_id, self.reserved, self.used)
+
+
+@contextmanager
+def token_pool(tenant_id: str, tokens: Optional[int] = None):
+    """A TokenPool of tokens (default REQUEST_TOKEN_BUDGET) for one API request"""
+    pool = TokenPool(tenant_id, tokens or settings.REQUEST_TOKEN_BUDGET)
+    try:
+        yield pool
+    finally:
+        pool.close()
+
+
+@contextmanager
+def request_scope(context: RequestContext):
+    """Make context the current request and charge its usage to the tenant"""
+    token = _current_request.set(context)
+    try:
+        yield context
+    finally:
+        _current_request.reset(token)
+        # Pooled usage is charged when the pool closes
+        if context.pool is None:
+            tenant_ledger.add(context.tenant_id, context.total_tokens)
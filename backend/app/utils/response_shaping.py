@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Optional
+
+
+# Sections that repeat values already present elsewhere in the dashboard
+# payload (mostly scoring_overview.score_breakdown and detailed_analysis)
+REDUNDANT_SECTIONS = [
+    "charts_data.radar_chart",
+    "charts_data.score_trend",
+    "charts_data.skills_distribution",
+    # total_years is only reported here, so the rest of the block goes field by field
+    "charts_data.experience_breakdown.relevant_years",
+    "charts_data.experience_breakdown.industry_alignment",
+    "charts_data.experience_breakdown.progression_score",
+    "detailed_metrics.experience_relevance",
+    "detailed_metrics.education_alignment",
+    "detailed_metrics.cultural_fit_score",
+]
+
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """Split a comma separated `fields=` value into dotted paths"""
+    if not fields:
+        return []
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def select_fields(data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Keep only the given dotted paths, e.g. `scoring_overview.score_breakdown`"""
+    selected: Dict[str, Any] = {}
+    for field in fields:
+        source: Any = data
+        keys = field.split(".")
+        for key in keys:
+            if not isinstance(source, dict) or key not in source:
+                break
+            source = source[key]
+        else:
+            target = selected
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = source
+    return selected
+
+
+def drop_fields(data: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Copy of `data` without the given dotted paths"""
+    result = dict(data)
+    for field in fields:
+        *parents, last = field.split(".")
+        target = result
+        for key in parents:
+            if not isinstance(target.get(key), dict):
+                break
+            # Copy each level on the way down so the input isn't mutated
+            target[key] = dict(target[key])
+            target = target[key]
+        else:
+            target.pop(last, None)
+    return result
+
+
+def shape_report(
+    report: Dict[str, Any], fields: Optional[str] = None, compact: bool = False
+) -> Dict[str, Any]:
+    """Apply the compact mode and `fields=` selection requested by the client"""
+    if compact:
+        report = drop_fields(report, REDUNDANT_SECTIONS)
+    selected = parse_fields(fields)
+    if selected:
+        report = select_fields(report, selected)
+    return report
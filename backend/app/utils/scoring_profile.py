@@ -0,0 +1,227 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from app.utils.analysis_store import AnalysisStore, analysis_store
+from app.utils.config import settings
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+SCORE_DIMENSIONS = ["Skills Match", "Experience", "Education", "Cultural Fit"]
+
+# Highest first: (threshold name, category, recommendation)
+RANKING_CATEGORIES: List[Tuple[str, str, str]] = [
+    ("excellent", "Excellent Fit", "Strong candidate - Proceed to final interview"),
+    ("good", "Good Fit", "Good candidate - Proceed to technical interview"),
+    ("fair", "Fair Fit", "Potential candidate - Requires further evaluation"),
+]
+LOWEST_CATEGORY = ("Poor Fit", "Not recommended for this position")
+
+
+class ScoringProfile:
+    """
+    Weights of the dimension scores in the overall fitness score and the
+    minimum overall score of each ranking category. Weights are normalized
+    to sum to 1.
+    """
+
+    def __init__(self, weights: Dict[str, float], thresholds: Dict[str, float]):
+        unknown = [name for name in weights if name not in SCORE_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown score dimensions: {', '.join(unknown)}")
+        weights = {name: float(weights.get(name, 0.0)) for name in SCORE_DIMENSIONS}
+        if any(weight < 0 for weight in weights.values()) or not sum(weights.values()):
+            raise ValueError("Score weights must be non-negative and not all zero")
+
+        names = [name for name, _, _ in RANKING_CATEGORIES]
+        unknown = [name for name in thresholds if name not in names]
+        if unknown:
+            raise ValueError(f"Unknown ranking thresholds: {', '.join(unknown)}")
+        missing = [name for name in names if name not in thresholds]
+        if missing:
+            raise ValueError(f"Missing ranking thresholds: {', '.join(missing)}")
+        ordered = [float(thresholds[name]) for name in names]
+        in_range = 0 <= ordered[-1] and ordered[0] <= 10
+        if ordered != sorted(ordered, reverse=True) or not in_range:
+            raise ValueError(
+                "Ranking thresholds must be between 0 and 10, with excellent >= good >= fair"
+            )
+
+        total = sum(weights.values())
+        self.weights = {name: weight / total for name, weight in weights.items()}
+        self.thresholds = dict(zip(names, ordered))
+
+    @classmethod
+    def default(cls) -> "ScoringProfile":
+        return cls(settings.SCORE_WEIGHTS, settings.SCORE_THRESHOLDS)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScoringProfile":
+        """Profile from an override; omitted weights or thresholds keep the defaults"""
+        for part in ("weights", "thresholds"):
+            if not isinstance(data.get(part) or {}, dict):
+                raise TypeError(f"Scoring profile {part} must be an object")
+        return cls(
+            data.get("weights") or settings.SCORE_WEIGHTS,
+            data.get("thresholds") or settings.SCORE_THRESHOLDS,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "weights": {name: round(w, 4) for name, w in self.weights.items()},
+            "thresholds": dict(self.thresholds),
+        }
+
+    def overall_score(self, scores: Dict[str, float]) -> float:
+        """
+        Weighted average of the given dimension scores. When only some
+        dimensions were analyzed, their weights are renormalized to sum to 1.
+        """
+        weights = {name: w for name, w in self.weights.items() if name in scores}
+        total = sum(weights.values())
+        if not total:
+            # Only zero-weight dimensions were analyzed: weigh them equally
+            return sum(scores.values()) / len(scores) if scores else 0.0
+        return sum(scores[name] * w for name, w in weights.items()) / total
+
+    def ranking(self, score: float) -> Dict[str, str]:
+        for name, category, recommendation in RANKING_CATEGORIES:
+            if score >= self.thresholds[name]:
+                return {"category": category, "recommendation": recommendation}
+        return {"category": LOWEST_CATEGORY[0], "recommendation": LOWEST_CATEGORY[1]}
+
+    def score_matrix(self, scores: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Overall scores and category indexes (into RANKING_CATEGORIES, with
+        len(RANKING_CATEGORIES) for the lowest) for an (n, dimensions) matrix
+        with NaN for dimensions that weren't analyzed
+        """
+        import numpy as np
+
+        weights = np.array([self.weights[name] for name in SCORE_DIMENSIONS])
+        # NaN marks a dimension that wasn't analyzed; renormalize over the rest
+        analyzed = ~np.isnan(scores)
+        totals = analyzed @ weights
+        overall = np.divide(
+            np.nan_to_num(scores) @ weights,
+            totals,
+            out=np.zeros(len(scores)),
+            where=totals > 0,
+        )
+        # Thresholds ascending: the number a score reaches counts up from the lowest
+        ascending = np.array(
+            [self.thresholds[name] for name, _, _ in reversed(RANKING_CATEGORIES)]
+        )
+        reached = np.searchsorted(ascending, overall, side="right")
+        return overall, len(RANKING_CATEGORIES) - reached
+
+
+class ScoringProfiles:
+    """
+    Scoring profile overrides per job and per tenant, resolved job first,
+    then tenant, then the configured defaults
+    """
+
+    def __init__(self, store: AnalysisStore):
+        self.store = store
+        self._profiles: Dict[Tuple[str, str], Optional[ScoringProfile]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scope: str, scope_id: str) -> Optional[ScoringProfile]:
+        key = (scope, scope_id)
+        with self._lock:
+            if key in self._profiles:
+                return self._profiles[key]
+        data = self.store.get_scoring_profile(scope, scope_id)
+        profile = ScoringProfile.from_dict(data) if data is not None else None
+        with self._lock:
+            self._profiles[key] = profile
+        return profile
+
+    def set(self, scope: str, scope_id: str, data: Dict[str, Any]) -> ScoringProfile:
+        profile = ScoringProfile.from_dict(data)
+        self.store.save_scoring_profile(scope, scope_id, profile.to_dict())
+        with self._lock:
+            self._profiles[(scope, scope_id)] = profile
+        return profile
+
+    def resolve(
+        self, job_id: Optional[str], tenant_id: Optional[str] = None
+    ) -> Tuple[ScoringProfile, str]:
+        """(profile, where it came from: "job", "tenant" or "default")"""
+        for scope, scope_id in (("job", job_id), ("tenant", tenant_id)):
+            if scope_id:
+                profile = self.get(scope, scope_id)
+                if profile is not None:
+                    return profile, scope
+        return ScoringProfile.default(), "default"
+
+
+def rescore_report(report: Dict[str, Any], profile: ScoringProfile) -> Dict[str, Any]:
+    """
+    Copy of a stored report with its overall fitness score and ranking
+    recomputed from its unrounded dimension scores under the given profile
+    """
+    overview = report.get("scoring_overview") or {}
+    scores = overview.get("exact_score_breakdown") or overview.get("score_breakdown")
+    if not scores:
+        return report
+    score = profile.overall_score(scores)
+    ranking = profile.ranking(score)
+    overview = {
+        **overview,
+        "overall_fitness_score": round(score, 1),
+        "ranking_category": ranking["category"],
+        "recommendation": ranking["recommendation"],
+    }
+    return {**report, "scoring_overview": overview}
+
+
+def rescore_job(
+    store: AnalysisStore, job_id: str, profile: ScoringProfile
+) -> Dict[str, Any]:
+    """
+    Recompute the overall fitness score and ranking category of every stored
+    analysis of a job from its unrounded dimension scores, in one vectorized
+    pass. No LLM calls are made. Analyses stored before the unrounded scores
+    were kept fall back to the breakdown rounded to one decimal, so theirs
+    are approximate.
+    """
+    import numpy as np
+
+    start = time.perf_counter()
+    rows = list(store.iter_score_breakdowns(job_id, SCORE_DIMENSIONS))
+    if not rows:
+        return {"job_id": job_id, "rescored": 0, "categories": {}}
+
+    table = np.array(rows, dtype=np.float64)  # missing scores come back as NaN
+    analysis_ids = table[:, 0].astype(np.int64)
+    overall, category_indexes = profile.score_matrix(table[:, 1:])
+
+    categories = RANKING_CATEGORIES + [(None, *LOWEST_CATEGORY)]
+    store.update_overall_scores(
+        [
+            (
+                round(float(score), 1),
+                categories[index][1],
+                categories[index][2],
+                int(analysis_id),
+            )
+            for analysis_id, score, index in zip(analysis_ids, overall, category_indexes)
+        ]
+    )
+
+    counts = np.bincount(category_indexes, minlength=len(categories))
+    return {
+        "job_id": job_id,
+        "rescored": len(rows),
+        "scoring_profile": profile.to_dict(),
+        "categories": {
+            category: int(count) for (_, category, _), count in zip(categories, counts)
+        },
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+scoring_profiles = ScoringProfiles(analysis_store)
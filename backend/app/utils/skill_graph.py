@@ -0,0 +1,136 @@
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from app.utils.config import settings
+
+
+SKILL_RELATIONS_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "data", "skill_relations.json"
+)
+
+
+class SkillGraph:
+    """
+    Undirected weighted skill-adjacency graph in CSR form: the neighbours of
+    node i are neighbors[offsets[i]:offsets[i + 1]], with matching weights.
+    Edge weights are in (0, 1] and a path's proximity is the product of its
+    edge weights.
+    """
+
+    def __init__(self, edges: List[Tuple[str, str, float]], aliases: Dict[str, str]):
+        import numpy as np
+
+        self.aliases = {
+            self._clean(alias): self._clean(name) for alias, name in aliases.items()
+        }
+
+        adjacency: Dict[str, Dict[str, float]] = {}
+        for first, second, weight in edges:
+            first, second = self.normalize(first), self.normalize(second)
+            adjacency.setdefault(first, {})[second] = float(weight)
+            adjacency.setdefault(second, {})[first] = float(weight)
+
+        self.skills: List[str] = sorted(adjacency)
+        self.index: Dict[str, int] = {skill: i for i, skill in enumerate(self.skills)}
+
+        offsets = [0]
+        neighbors: List[int] = []
+        weights: List[float] = []
+        for skill in self.skills:
+            for neighbor, weight in sorted(adjacency[skill].items()):
+                neighbors.append(self.index[neighbor])
+                weights.append(weight)
+            offsets.append(len(neighbors))
+
+        self.offsets = np.array(offsets, dtype=np.int32)
+        self.neighbors = np.array(neighbors, dtype=np.int32)
+        self.weights = np.array(weights, dtype=np.float32)
+
+    @staticmethod
+    def _clean(skill: str) -> str:
+        return " ".join(skill.lower().split())
+
+    def normalize(self, skill: str) -> str:
+        cleaned = self._clean(skill)
+        return self.aliases.get(cleaned, cleaned)
+
+    def __contains__(self, skill: str) -> bool:
+        return self.normalize(skill) in self.index
+
+    def related_skills(self, skill: str, max_hops: int) -> Dict[str, float]:
+        """
+        Bounded BFS: best proximity of every skill reachable within max_hops,
+        excluding the start skill itself
+        """
+        start = self.index.get(self.normalize(skill))
+        if start is None:
+            return {}
+
+        best = {start: 1.0}
+        frontier = {start: 1.0}
+        for _ in range(max_hops):
+            next_frontier: Dict[int, float] = {}
+            for node, proximity in frontier.items():
+                begin, end = self.offsets[node], self.offsets[node + 1]
+                for neighbor, weight in zip(
+                    self.neighbors[begin:end].tolist(), self.weights[begin:end].tolist()
+                ):
+                    candidate = proximity * weight
+                    if candidate > best.get(neighbor, 0.0):
+                        best[neighbor] = candidate
+                        next_frontier[neighbor] = candidate
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        del best[start]
+        return {self.skills[node]: round(p, 3) for node, p in best.items()}
+
+
+@lru_cache(maxsize=1)
+def get_skill_graph() -> SkillGraph:
+    with open(SKILL_RELATIONS_PATH, encoding="utf-8") as file:
+        data = json.load(file)
+    return SkillGraph(data["edges"], data.get("aliases", {}))
+
+
+@lru_cache(maxsize=4096)
+def _transferable_skills(
+    candidate_skills: Tuple[str, ...],
+    missing_skills: Tuple[str, ...],
+    max_hops: int,
+    min_proximity: float,
+) -> Tuple[Tuple[str, Tuple[Tuple[str, float], ...]], ...]:
+    graph = get_skill_graph()
+    by_normalized = {graph.normalize(skill): skill for skill in candidate_skills}
+
+    result = []
+    for missing in missing_skills:
+        related = graph.related_skills(missing, max_hops)
+        matches = sorted(
+            (
+                (by_normalized[skill], proximity)
+                for skill, proximity in related.items()
+                if skill in by_normalized and proximity >= min_proximity
+            ),
+            key=lambda match: (-match[1], match[0]),
+        )
+        result.append((missing, tuple(matches)))
+    return tuple(result)
+
+
+def find_transferable_skills(
+    candidate_skills: List[str], missing_skills: List[str]
+) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    For each missing skill, the candidate's skills within SKILL_GRAPH_MAX_HOPS
+    hops and their proximity (best first). Results are cached.
+    """
+    result = _transferable_skills(
+        tuple(sorted(set(candidate_skills))),
+        tuple(missing_skills),
+        settings.SKILL_GRAPH_MAX_HOPS,
+        settings.SKILL_GRAPH_MIN_PROXIMITY,
+    )
+    return {missing: list(matches) for missing, matches in result}
@@ -0,0 +1,162 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from typing import Dict, Optional
+from fastapi import Response
+from app.utils.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+# Vite emits content-hashed names such as assets/index-B7x9Kq2L.js; files
+# copied from public/ (favicon.ico, apple-touch-icon.png) keep their names
+HASHED_ASSET_PATTERN = re.compile(r"^assets/.+-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/xml",
+    "image/svg+xml",
+)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class StaticAsset:
+    def __init__(self, relative_path: str, content: bytes, content_type: str):
+        self.relative_path = relative_path
+        self.content_type = content_type
+        self.etag = '"' + hashlib.sha1(content).hexdigest()[:20] + '"'
+        self.immutable = bool(HASHED_ASSET_PATTERN.search(relative_path))
+        # Encoding ("identity", "br", "gzip") -> body
+        self.variants: Dict[str, bytes] = {"identity": content}
+
+    def etag_for(self, encoding: str) -> str:
+        # Each encoded representation needs its own validator
+        if encoding == "identity":
+            return self.etag
+        return self.etag[:-1] + "-" + encoding + '"'
+
+    @property
+    def cache_control(self) -> str:
+        return IMMUTABLE_CACHE_CONTROL if self.immutable else REVALIDATE_CACHE_CONTROL
+
+
+class StaticAssetManifest:
+    """
+    In-memory copy of the built frontend, loaded once at startup. Compressible
+    files keep pre-built brotli/gzip variants so requests never touch the disk
+    or compress on the fly.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(directory)
+        self.assets: Dict[str, StaticAsset] = {}
+
+    @property
+    def index(self) -> Optional[StaticAsset]:
+        return self.assets.get("index.html")
+
+    def load(self):
+        assets = {}
+        if not os.path.isdir(self.directory):
+            print(f"Frontend build not found at {self.directory}, skipping static files")
+            self.assets = assets
+            return
+
+        for root, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                # Pre-compressed siblings from the frontend build are attached
+                # to their source file below instead of being served directly
+                if filename.endswith((".gz", ".br")):
+                    continue
+
+                full_path = os.path.join(root, filename)
+                relative_path = os.path.relpath(full_path, self.directory).replace(
+                    os.sep, "/"
+                )
+                with open(full_path, "rb") as file:
+                    content = file.read()
+
+                content_type = (
+                    mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                )
+                asset = StaticAsset(relative_path, content, content_type)
+                if content_type.startswith(COMPRESSIBLE_TYPES):
+                    self._add_compressed_variants(asset, full_path, content)
+                assets[relative_path] = asset
+
+        self.assets = assets
+        print(f"Loaded {len(assets)} static files from {self.directory}")
+
+    @staticmethod
+    def _add_compressed_variants(asset: StaticAsset, full_path: str, content: bytes):
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            if os.path.isfile(full_path + suffix):
+                with open(full_path + suffix, "rb") as file:
+                    asset.variants[encoding] = file.read()
+
+        if len(content) < settings.GZIP_MIN_SIZE:
+            return
+        if "br" not in asset.variants and brotli is not None:
+            asset.variants["br"] = brotli.compress(content, quality=11)
+        if "gzip" not in asset.variants:
+            asset.variants["gzip"] = gzip.compress(content, compresslevel=9, mtime=0)
+
+        # Drop variants that don't actually save bytes
+        for encoding in ("br", "gzip"):
+            if len(asset.variants.get(encoding, content)) >= len(content):
+                asset.variants.pop(encoding, None)
+
+    def get(self, path: str) -> Optional[StaticAsset]:
+        return self.assets.get(path.lstrip("/"))
+
+    @staticmethod
+    def _choose_encoding(asset: StaticAsset, accept_encoding: str) -> str:
+        accepted = {}
+        for part in accept_encoding.split(","):
+            name, _, params = part.strip().partition(";")
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            if name:
+                accepted[name.strip().lower()] = quality
+
+        for encoding in ("br", "gzip"):
+            if encoding in asset.variants and accepted.get(
+                encoding, accepted.get("*", 0.0)
+            ) > 0:
+                return encoding
+        return "identity"
+
+    def response(
+        self, asset: StaticAsset, accept_encoding: str = "", if_none_match: str = ""
+    ) -> Response:
+        encoding = self._choose_encoding(asset, accept_encoding)
+        headers = {
+            "ETag": asset.etag_for(encoding),
+            "Cache-Control": asset.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if if_none_match and headers["ETag"] in [
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ]:
+            return Response(status_code=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(
+            content=asset.variants[encoding],
+            media_type=asset.content_type,
+            headers=headers,
+        )
@@ -1,13 +1,138 @@
 from langgraph.graph import StateGraph, END
-from typing import TypedDict, Dict, Any
+from typing import TypedDict, Dict, Any, Callable, FrozenSet, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from app.agents.job_parser import JobParserAgent
 from app.agents.resume_extractor import ResumeExtractorAgent
 from app.agents.skills_matcher import SkillsMatcherAgent
 from app.agents.experience_evaluator import ExperienceEvaluatorAgent
 from app.agents.cultural_fit import CulturalFitAgent
 from app.agents.education_analyzer import EducationAnalyzerAgent
-from app.agents.report_generator import DashboardDataGenerator, ReportGeneratorAgent
+from app.agents.report_generator import (
+    NARRATIVE_REPORT_SECTIONS,
+    OPTIONAL_REPORT_SECTIONS,
+    REPORT_SECTIONS,
+    DashboardDataGenerator,
+    ReportGeneratorAgent,
+)
+from app.utils.analysis_store import analysis_store, job_id_for_description
+from app.utils.config import settings
+from app.utils.job_registry import job_registry
+from app.utils.job_similarity import description_diff, similar_jobs
+from app.utils.request_context import DeadlineExceeded, current_request
+from app.utils.scoring_profile import ScoringProfile
+import contextvars
 import os
+import threading
+
+_early_executor = ThreadPoolExecutor(thread_name_prefix="early-analysis")
+
+# Dimension a caller can ask for -> (graph node, state field, score name, score key)
+ANALYSIS_DIMENSIONS: Dict[str, Tuple[str, str, str, str]] = {
+    "skills": (
+        "analyze_skills",
+        "skills_analysis",
+        "Skills Match",
+        "overall_match_score",
+    ),
+    "experience": (
+        "evaluate_experience",
+        "experience_analysis",
+        "Experience",
+        "overall_experience_score",
+    ),
+    "education": (
+        "analyze_education",
+        "education_analysis",
+        "Education",
+        "overall_education_score",
+    ),
+    "cultural_fit": (
+        "analyze_cultural_fit",
+        "cultural_analysis",
+        "Cultural Fit",
+        "cultural_fit_score",
+    ),
+}
+# The comprehensive report is written from every analysis
+REPORT_DIMENSION = "report"
+DIMENSION_NAMES = list(ANALYSIS_DIMENSIONS) + [REPORT_DIMENSION]
+
+
+def resolve_dimensions(dimensions: Optional[List[str]]) -> FrozenSet[str]:
+    """Requested dimensions plus the ones they depend on; None means all"""
+    if not dimensions:
+        return frozenset(DIMENSION_NAMES)
+    unknown = [name for name in dimensions if name not in DIMENSION_NAMES]
+    if unknown:
+        raise ValueError(f"Unknown analysis dimensions: {', '.join(unknown)}")
+    if REPORT_DIMENSION in dimensions:
+        return frozenset(DIMENSION_NAMES)
+    return frozenset(dimensions)
+
+
+class EarlyAnalyses:
+    """
+    Analyses started from streamed resume fields while extraction is still
+    running. Each task starts once every resume field it needs has arrived.
+    With a gate (task key, check), the other tasks also wait for that task
+    and only start if check passes on its result.
+    """
+
+    def __init__(
+        self,
+        tasks: Dict[str, Tuple[List[str], Callable[[Dict], Any]]],
+        gate: Optional[Tuple[str, Callable[[Dict], bool]]] = None,
+    ):
+        self.tasks = tasks
+        self.gate = gate if gate is not None and gate[0] in tasks else None
+        self.fields: Dict[str, Any] = {}
+        self.futures: Dict[str, Future] = {}
+        # Reentrant: a gate callback may run in the thread that registers it
+        self._lock = threading.RLock()
+        # Tasks may start from a worker thread, so keep the request's context
+        self._context = contextvars.copy_context()
+
+    def on_field(self, name: str, value: Any):
+        with self._lock:
+            self.fields[name] = value
+            self._start_ready()
+
+    def _gate_open(self) -> bool:
+        key, check = self.gate
+        future = self.futures.get(key)
+        if future is None or not future.done() or future.exception() is not None:
+            return False
+        return check(future.result())
+
+    def _start_ready(self):
+        with self._lock:
+            for key, (needs, analyze) in self.tasks.items():
+                if key in self.futures or not all(n in self.fields for n in needs):
+                    continue
+                if self.gate is not None and key != self.gate[0] and not self._gate_open():
+                    continue
+                print(f"Starting {key} early from streamed resume fields")
+                self.futures[key] = _early_executor.submit(
+                    self._context.copy().run, analyze, dict(self.fields)
+                )
+                if self.gate is not None and key == self.gate[0]:
+                    self.futures[key].add_done_callback(lambda _: self._start_ready())
+
+    def results(self) -> Dict[str, Any]:
+        """Results of the finished tasks; failed ones are left to their nodes"""
+        if self.gate is not None and self.gate[0] in self.futures:
+            # Let the gated tasks start before collecting them
+            wait([self.futures[self.gate[0]]])
+            self._start_ready()
+        with self._lock:
+            futures = dict(self.futures)
+        results = {}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                print(f"Early {key} failed, it will run in its own step: {str(e)}")
+        return results
 
 
 class WorkflowState(TypedDict):
@@ -22,6 +147,10 @@ class WorkflowState(TypedDict):
     overall_score: float
     final_report: Dict[str, Any]
     comprehensive_report: Dict[str, Any]  # Added
+    report_sections: List[str]
+    scoring_profile: ScoringProfile
+    dimensions: FrozenSet[str]
+    early_reject: bool
     error: str
 
 
@@ -37,35 +166,116 @@ class ResumeAnalysisWorkflow:
         self.report_generator = ReportGeneratorAgent(api_key)  # Added
         self.dashboard_generator = DashboardDataGenerator()  # Added
 
-        # Build the workflow graph
-        self.workflow = self._build_workflow()
-
-    def _build_workflow(self) -> StateGraph:
+        # Build the workflow graph; graphs for subsets of the dimensions are
+        # built on first use
+        self._workflows: Dict[FrozenSet[str], Any] = {}
+        self._workflows_lock = threading.Lock()
+        self.workflow = self.workflow_for(frozenset(DIMENSION_NAMES))
+
+    def workflow_for(self, dimensions: FrozenSet[str]):
+        """Compiled graph running only the nodes the given dimensions need"""
+        with self._workflows_lock:
+            workflow = self._workflows.get(dimensions)
+            if workflow is None:
+                workflow = self._build_workflow(dimensions)
+                self._workflows[dimensions] = workflow
+            return workflow
+
+    def _build_workflow(self, dimensions: FrozenSet[str]) -> StateGraph:
         workflow = StateGraph(WorkflowState)
+        analysis_nodes = {
+            "analyze_skills": self._analyze_skills,
+            "evaluate_experience": self._evaluate_experience,
+            "analyze_education": self._analyze_education,
+            "analyze_cultural_fit": self._analyze_cultural_fit,
+        }
 
         # Add nodes
         workflow.add_node("parse_job", self._parse_job_description)
         workflow.add_node("extract_resume", self._extract_resume_data)
-        workflow.add_node("analyze_skills", self._analyze_skills)
-        workflow.add_node("evaluate_experience", self._evaluate_experience)
-        workflow.add_node("analyze_education", self._analyze_education)
-        workflow.add_node("analyze_cultural_fit", self._analyze_cultural_fit)
-        workflow.add_node("generate_report", self._generate_comprehensive_report)
-
-        # Add edges
-        workflow.add_edge("parse_job", "extract_resume")
-        workflow.add_edge("extract_resume", "analyze_skills")
-        workflow.add_edge("analyze_skills", "evaluate_experience")
-        workflow.add_edge("evaluate_experience", "analyze_education")
-        workflow.add_edge("analyze_education", "analyze_cultural_fit")
-        workflow.add_edge("analyze_cultural_fit", "generate_report")
-        workflow.add_edge("generate_report", END)
+        steps = ["parse_job", "extract_resume"]
+        for name, (node, _, _, _) in ANALYSIS_DIMENSIONS.items():
+            if name in dimensions:
+                workflow.add_node(node, analysis_nodes[node])
+                steps.append(node)
+        if REPORT_DIMENSION in dimensions:
+            workflow.add_node("generate_report", self._generate_comprehensive_report)
+            steps.append("generate_report")
+        else:
+            workflow.add_node("summarize_scores", self._summarize_scores)
+            steps.append("summarize_scores")
+
+        # Add edges. Once skills are analyzed, a clearly unqualified candidate
+        # can skip the remaining steps for a compact rejection report
+        gated = self._has_skills_gate(dimensions)
+        if gated:
+            workflow.add_node("reject_candidate", self._reject_candidate)
+            workflow.add_edge("reject_candidate", END)
+        for step, next_step in zip(steps, steps[1:]):
+            if gated and step == "analyze_skills":
+                workflow.add_conditional_edges(
+                    step,
+                    self._after_skills,
+                    {"continue": next_step, "reject": "reject_candidate"},
+                )
+            else:
+                workflow.add_edge(step, next_step)
+        workflow.add_edge(steps[-1], END)
 
         # Set entry point
         workflow.set_entry_point("parse_job")
 
         return workflow.compile()
 
+    @staticmethod
+    def _has_skills_gate(dimensions: FrozenSet[str]) -> bool:
+        """Early reject needs the skills analysis and something left to skip"""
+        return "skills" in dimensions and len(dimensions) > 1
+
+    @staticmethod
+    def early_reject_reason(
+        skills_analysis: Dict[str, Any], job_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """Why the skills analysis rules the candidate out, or None if it doesn't"""
+        score = skills_analysis.get("overall_match_score")
+        required = job_data.get("required_skills") or []
+        if score is None or not required:
+            return None
+        missing = len(skills_analysis.get("missing_critical_skills", []))
+        missing_share = min(missing / len(required), 1.0)
+        if (
+            score < settings.EARLY_REJECT_MAX_SKILLS_SCORE
+            and missing_share >= settings.EARLY_REJECT_MIN_MISSING_SHARE
+        ):
+            return (
+                f"Skills match score {score:.1f} with {missing} of "
+                f"{len(required)} required skills missing"
+            )
+        return None
+
+    def _after_skills(self, state: WorkflowState) -> str:
+        if (
+            state["early_reject"]
+            and not state["error"]
+            and state["skills_analysis"]
+            and self.early_reject_reason(state["skills_analysis"], state["job_data"])
+        ):
+            return "reject"
+        return "continue"
+
+    def warm_up(self):
+        """Create the model clients of every agent ahead of the first request"""
+        for agent in (
+            self.job_parser,
+            self.resume_extractor,
+            self.skills_matcher,
+            self.experience_evaluator,
+            self.education_analyzer,
+            self.cultural_fit_agent,
+            self.report_generator,
+        ):
+            agent.router.warm_up()
+
     def save_graph_as_mermaid(
         self, folder_path: str, filename: str = "workflow_graph.png"
     ):
@@ -88,27 +298,162 @@ class ResumeAnalysisWorkflow:
         except Exception as e:
             print(f"An error occurred while generating the Mermaid graph: {e}")
 
+    def parse_job(self, job_description: str) -> Tuple[str, Dict[str, Any], str]:
+        """
+        Parsed requirements for a job description, reusing those of the same
+        or a near-identical known job. Returns (job_id, requirements, source)
+        with source one of "registry", "similar" or "parsed".
+        """
+        job_id = job_id_for_description(job_description)
+        job_data = job_registry.get(job_id)
+        if job_data is not None:
+            similar_jobs.count_exact_hit()
+            return job_id, job_data, "registry"
+
+        signature, similar = None, None
+        if settings.JOB_SIMILARITY_ENABLED:
+            signature, similar = similar_jobs.find(job_description)
+
+        known = analysis_store.get_job(similar[0]) if similar else None
+        if known is not None:
+            print(f"Reusing requirements of job {similar[0]} ({similar[1]:.0%} similar)")
+            job_data = known["requirements"]
+            source = "similar"
+            changes = description_diff(known["description"], job_description)
+            if settings.JOB_SIMILARITY_REFINE and changes:
+                job_data = self.job_parser.refine_job_requirements(
+                    job_data, changes
+                ).dict()
+                similar_jobs.count_refinement()
+        else:
+            request = current_request()
+            text = job_description
+            if request is not None:
+                text = request.fit_input(
+                    "job_description", text, settings.JOB_INPUT_BUDGET_SHARE
+                )
+            job_data = self.job_parser.parse_job_description(text).dict()
+            source = "parsed"
+
+        job_registry.put(job_id, job_data, job_description)
+        if signature is not None:
+            similar_jobs.record(job_id, signature)
+        return job_id, job_data, source
+
     def _parse_job_description(self, state: WorkflowState) -> WorkflowState:
+        # Registered jobs come with their parsed requirements
+        if state["job_data"]:
+            return state
         try:
-            job_data = self.job_parser.parse_job_description(state["job_description"])
-            state["job_data"] = job_data.dict()
+            _, state["job_data"], _ = self.parse_job(state["job_description"])
             return state
         except Exception as e:
             state["error"] = f"Job parsing error: {str(e)}"
             return state
 
+    def extract_resume(self, resume_text: str) -> Dict[str, Any]:
+        """
+        Structured resume data, extracted once when the same resume is
+        analyzed against several jobs
+        """
+        request = current_request()
+        if request is not None:
+            resume_text = request.fit_input(
+                "resume_text", resume_text, settings.RESUME_INPUT_BUDGET_SHARE
+            )
+        return self.resume_extractor.extract_resume_data(resume_text).dict()
+
     def _extract_resume_data(self, state: WorkflowState) -> WorkflowState:
+        if state["resume_data"]:
+            # Extracted beforehand: start the analyses that need the resume together
+            if not state["error"]:
+                early = self._early_analyses(
+                    state["job_data"], state["dimensions"], state["early_reject"]
+                )
+                for name, value in state["resume_data"].items():
+                    early.on_field(name, value)
+                state.update(early.results())
+            return state
         try:
+            resume_text = state["resume_text"]
+            request = current_request()
+            if request is not None:
+                resume_text = request.fit_input(
+                    "resume_text", resume_text, settings.RESUME_INPUT_BUDGET_SHARE
+                )
+
+            early = None
+            if settings.RESUME_STREAMING and not state["error"]:
+                early = self._early_analyses(
+                    state["job_data"],
+                    state["dimensions"],
+                    state["early_reject"],
+                )
+
             resume_data = self.resume_extractor.extract_resume_data(
-                state["resume_text"]
+                resume_text, on_field=early.on_field if early else None
             )
             state["resume_data"] = resume_data.dict()
+
+            # The skills, experience and education steps skip work done here
+            if early is not None:
+                state.update(early.results())
             return state
         except Exception as e:
             state["error"] = f"Resume extraction error: {str(e)}"
             return state
 
+    def _early_analyses(
+        self,
+        job_data: Dict[str, Any],
+        dimensions: FrozenSet[str],
+        early_reject: bool = False,
+    ) -> EarlyAnalyses:
+        """
+        Requested analyses that only need part of the resume, keyed by their
+        state field. With early reject the others wait for the skills analysis
+        so a rejected candidate doesn't pay for them.
+        """
+        wanted = {
+            field
+            for name, (_, field, _, _) in ANALYSIS_DIMENSIONS.items()
+            if name in dimensions
+        }
+        tasks = {
+            "skills_analysis": (
+                ["skills"],
+                lambda fields: self.skills_matcher.analyze_skills_match(
+                    fields["skills"],
+                    job_data["required_skills"],
+                    job_data["preferred_skills"],
+                ).dict(),
+            ),
+            "experience_analysis": (
+                ["work_experience"],
+                lambda fields: self.experience_evaluator.evaluate_experience(
+                    fields["work_experience"], job_data
+                ).dict(),
+            ),
+            "education_analysis": (
+                ["education", "certifications"],
+                lambda fields: self.education_analyzer.analyze_education(
+                    fields["education"], fields["certifications"], job_data
+                ).dict(),
+            ),
+        }
+        gate = None
+        if early_reject and self._has_skills_gate(dimensions):
+            gate = (
+                "skills_analysis",
+                lambda result: self.early_reject_reason(result, job_data) is None,
+            )
+        return EarlyAnalyses(
+            {key: task for key, task in tasks.items() if key in wanted}, gate
+        )
+
     def _analyze_skills(self, state: WorkflowState) -> WorkflowState:
+        if state["skills_analysis"]:
+            return state
         try:
             skills_analysis = self.skills_matcher.analyze_skills_match(
                 state["resume_data"]["skills"],
@@ -122,6 +467,8 @@ class ResumeAnalysisWorkflow:
             return state
 
     def _evaluate_experience(self, state: WorkflowState) -> WorkflowState:
+        if state["experience_analysis"]:
+            return state
         try:
             experience_analysis = self.experience_evaluator.evaluate_experience(
                 state["resume_data"]["work_experience"], state["job_data"]
@@ -135,7 +482,9 @@ class ResumeAnalysisWorkflow:
     def _analyze_cultural_fit(self, state: WorkflowState) -> WorkflowState:
         try:
             cultural_analysis = self.cultural_fit_agent.analyze_cultural_fit(
-                state["resume_data"], state["job_data"]["company_culture_keywords"]
+                state["resume_data"],
+                state["job_data"]["company_culture_keywords"],
+                state["resume_text"],
             )
             state["cultural_analysis"] = cultural_analysis.dict()
             return state
@@ -238,13 +587,31 @@ class ResumeAnalysisWorkflow:
             },
         }
 
-    def analyze_resume(self, job_description: str, resume_text: str) -> Dict[str, Any]:
-        """Run the complete analysis workflow"""
+    def analyze_resume(
+        self,
+        job_description: str,
+        resume_text: str,
+        report_sections: Optional[List[str]] = None,
+        job_data: Optional[Dict[str, Any]] = None,
+        scoring_profile: Optional[ScoringProfile] = None,
+        dimensions: Optional[List[str]] = None,
+        early_reject: Optional[bool] = None,
+        resume_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the analysis workflow for the given dimensions (default: all),
+        generating only the given report sections. Pass job_data for an
+        already parsed job to skip parsing, resume_data for an already
+        extracted resume to skip extraction, and the job's scoring profile to
+        weight and rank the overall score. early_reject overrides
+        EARLY_REJECT_ENABLED.
+        """
+        dimensions = resolve_dimensions(dimensions)
         initial_state = WorkflowState(
             job_description=job_description,
             resume_text=resume_text,
-            job_data={},
-            resume_data={},
+            job_data=job_data or {},
+            resume_data=resume_data or {},
             skills_analysis={},
             experience_analysis={},
             education_analysis={},
@@ -252,10 +619,16 @@ class ResumeAnalysisWorkflow:
             overall_score=0.0,
             final_report={},
             comprehensive_report={},
+            report_sections=report_sections or [],
+            scoring_profile=scoring_profile or ScoringProfile.default(),
+            dimensions=dimensions,
+            early_reject=(
+                settings.EARLY_REJECT_ENABLED if early_reject is None else early_reject
+            ),
             error="",
         )
 
-        result = self.workflow.invoke(initial_state)
+        result = self.workflow_for(dimensions).invoke(initial_state)
 
         if result.get("error"):
             raise Exception(result["error"])
@@ -264,6 +637,8 @@ class ResumeAnalysisWorkflow:
 
     def _analyze_education(self, state: WorkflowState) -> WorkflowState:
         """Analyze candidate's education and certifications"""
+        if state["education_analysis"]:
+            return state
         try:
             education_analysis = self.education_analyzer.analyze_education(
                 state["resume_data"]["education"],
@@ -276,51 +651,167 @@ class ResumeAnalysisWorkflow:
             state["error"] = f"Education analysis error: {str(e)}"
             return state
 
+    def _dimension_scores(self, state: WorkflowState) -> Dict[str, float]:
+        """Unrounded score of each requested dimension, by score name"""
+        return {
+            score_name: state[field][score_key]
+            for name, (_, field, score_name, score_key) in ANALYSIS_DIMENSIONS.items()
+            if name in state["dimensions"]
+        }
+
+    def _overall_score(self, state: WorkflowState) -> float:
+        """
+        Weighted average of the requested dimension scores, per the scoring
+        profile; weights are renormalized over those dimensions
+        """
+        return state["scoring_profile"].overall_score(self._dimension_scores(state))
+
+    def _dashboard_data(
+        self, state: WorkflowState, comprehensive_report
+    ) -> Dict[str, Any]:
+        dashboard_data = self.dashboard_generator.generate_dashboard_data(
+            state["job_data"],
+            state["resume_data"],
+            state["skills_analysis"],
+            state["experience_analysis"],
+            state["education_analysis"],
+            state["cultural_analysis"],
+            comprehensive_report,
+            state["overall_score"],
+            state["scoring_profile"],
+        )
+
+        # Only the dimensions that were analyzed have a score
+        dimensions = state["dimensions"]
+        analyzed = [name for name in DIMENSION_NAMES if name in dimensions]
+        breakdown = dashboard_data["scoring_overview"]["score_breakdown"]
+        dashboard_data["scoring_overview"]["score_breakdown"] = {
+            score_name: breakdown[score_name]
+            for name, (_, _, score_name, _) in ANALYSIS_DIMENSIONS.items()
+            if name in dimensions
+        }
+        # Kept unrounded so re-scoring reproduces the overall score exactly
+        dashboard_data["scoring_overview"]["exact_score_breakdown"] = (
+            self._dimension_scores(state)
+        )
+        dashboard_data["analyzed_dimensions"] = analyzed
+
+        request = current_request()
+        dashboard_data["degraded_sections"] = (
+            dict(request.degraded_sections) if request is not None else {}
+        )
+        return dashboard_data
+
     def _generate_comprehensive_report(self, state: WorkflowState) -> WorkflowState:
         """Generate comprehensive analysis report and dashboard data"""
         try:
-            # Calculate overall score with education included
-            skills_score = state["skills_analysis"]["overall_match_score"]
-            experience_score = state["experience_analysis"]["overall_experience_score"]
-            education_score = state["education_analysis"]["overall_education_score"]
-            cultural_score = state["cultural_analysis"]["cultural_fit_score"]
+            overall_score = self._overall_score(state)
+            state["overall_score"] = overall_score
 
-            # Weighted average (adjusted to include education)
-            overall_score = (
-                skills_score * 0.35
-                + experience_score * 0.35
-                + education_score * 0.15
-                + cultural_score * 0.15
+            comprehensive_report = self._write_report(state, overall_score)
+
+            state["final_report"] = self._dashboard_data(state, comprehensive_report)
+            state["final_report"]["report_sections"] = state["report_sections"] or list(
+                REPORT_SECTIONS
             )
-            state["overall_score"] = overall_score
+            state["comprehensive_report"] = comprehensive_report.dict()
 
-            # Generate comprehensive report
-            comprehensive_report = self.report_generator.generate_comprehensive_report(
-                state["job_data"],
-                state["resume_data"],
-                state["skills_analysis"],
-                state["experience_analysis"],
-                state["education_analysis"],
-                state["cultural_analysis"],
-                overall_score,
+            return state
+        except Exception as e:
+            state["error"] = f"Report generation error: {str(e)}"
+            return state
+
+    def _summarize_scores(self, state: WorkflowState) -> WorkflowState:
+        """Dashboard data for the requested dimensions, without the LLM report"""
+        try:
+            state["overall_score"] = self._overall_score(state)
+            comprehensive_report = self.report_generator.build_minimal_report(
+                state["skills_analysis"], state["experience_analysis"]
             )
+            state["final_report"] = self._dashboard_data(state, comprehensive_report)
+            return state
+        except Exception as e:
+            state["error"] = f"Score summary error: {str(e)}"
+            return state
 
-            # Generate dashboard data
-            dashboard_data = self.dashboard_generator.generate_dashboard_data(
+    def _reject_candidate(self, state: WorkflowState) -> WorkflowState:
+        """Compact rejection report from the skills analysis alone"""
+        try:
+            reason = self.early_reject_reason(state["skills_analysis"], state["job_data"])
+            print(f"Rejecting candidate early: {reason}")
+            skills = ANALYSIS_DIMENSIONS["skills"]
+            scores = {skills[2]: state["skills_analysis"][skills[3]]}
+            state["overall_score"] = state["scoring_profile"].overall_score(scores)
+            report = self.dashboard_generator.generate_rejection_data(
                 state["job_data"],
                 state["resume_data"],
                 state["skills_analysis"],
-                state["experience_analysis"],
-                state["education_analysis"],
-                state["cultural_analysis"],
-                comprehensive_report,
-                overall_score,
+                state["overall_score"],
+                reason,
+                state["scoring_profile"],
             )
-
-            state["final_report"] = dashboard_data
-            state["comprehensive_report"] = comprehensive_report.dict()
-
+            report["early_rejection"]["skipped_dimensions"] = [
+                name
+                for name in DIMENSION_NAMES
+                if name in state["dimensions"] and name != "skills"
+            ]
+            report["scoring_overview"]["exact_score_breakdown"] = scores
+            report["analyzed_dimensions"] = ["skills"]
+            request = current_request()
+            report["degraded_sections"] = (
+                dict(request.degraded_sections) if request is not None else {}
+            )
+            state["final_report"] = report
             return state
         except Exception as e:
-            state["error"] = f"Report generation error: {str(e)}"
+            state["error"] = f"Rejection report error: {str(e)}"
             return state
+
+    def _write_report(self, state: WorkflowState, overall_score: float):
+        """
+        Generate the comprehensive report, trimming it to fit the request's
+        token budget and deadline. Trimmed sections are marked as degraded.
+        """
+        request = current_request()
+        remaining = request.remaining_seconds() if request is not None else None
+
+        if remaining is None or remaining >= settings.REPORT_MIN_SECONDS:
+            # Skip the optional report sections when the token budget is nearly spent
+            include_optional_sections = True
+            if request is not None and request.near_budget():
+                include_optional_sections = False
+                request.mark_downscaled("report_optional_sections")
+                request.mark_degraded(OPTIONAL_REPORT_SECTIONS, "token_budget")
+
+            # Short on time: a brief report without interview questions
+            include_interview_questions = True
+            if remaining is not None and remaining < settings.REPORT_FULL_MIN_SECONDS:
+                include_optional_sections = False
+                include_interview_questions = False
+                request.mark_degraded(
+                    OPTIONAL_REPORT_SECTIONS + ["interview_questions"], "deadline"
+                )
+
+            try:
+                return self.report_generator.generate_comprehensive_report(
+                    state["job_data"],
+                    state["resume_data"],
+                    state["skills_analysis"],
+                    state["experience_analysis"],
+                    state["education_analysis"],
+                    state["cultural_analysis"],
+                    overall_score,
+                    include_optional_sections=include_optional_sections,
+                    include_interview_questions=include_interview_questions,
+                    sections=state["report_sections"] or None,
+                )
+            except DeadlineExceeded as e:
+                print(f"{e}, assembling the report locally")
+
+        # No time left for the narrative
+        request.mark_degraded(
+            NARRATIVE_REPORT_SECTIONS + OPTIONAL_REPORT_SECTIONS, "deadline"
+        )
+        return self.report_generator.build_minimal_report(
+            state["skills_analysis"], state["experience_analysis"]
+        )
@@ -0,0 +1,147 @@
+"""
+Throughput and peak memory of the streaming analysis export.
+
+Fills a scratch SQLite store with synthetic final reports, then exports them
+as CSV and Parquet in a fresh process per run so each run's peak RSS is its
+own. Peak memory should stay flat as the row count grows.
+
+Usage (from the backend directory):
+    python benchmarks/analysis_export.py [--analyses 100000]
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import sqlite3
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GOOGLE_API_KEY", "x")
+os.environ.setdefault("DATABASE_PATH", os.path.join("/tmp", "hiresight-bench.db"))
+
+from app.utils.analysis_export import check_export_format, export_analyses
+from app.utils.analysis_store import AnalysisStore
+
+JOB_ID = "benchmark-job"
+SKILLS = ["Python", "FastAPI", "PostgreSQL", "Docker", "AWS", "Kubernetes", "Go"]
+SENTENCE = "The candidate shows solid backend experience relevant to this role. "
+
+
+def synthetic_report(rng: random.Random, index: int) -> dict:
+    matched = [skill for skill in SKILLS if rng.random() < 0.6]
+    scores = {
+        name: round(rng.uniform(3, 10), 1)
+        for name in ("Skills Match", "Experience", "Education", "Cultural Fit")
+    }
+    return {
+        "candidate_summary": {
+            "name": f"Candidate {index}",
+            "email": f"candidate{index}@example.com",
+            "job_title": "Senior Backend Engineer",
+        },
+        "scoring_overview": {
+            "overall_fitness_score": round(sum(scores.values()) / 4, 1),
+            "ranking_category": "Good Fit",
+            "recommendation": "Consider for interview",
+            "confidence_level": 0.8,
+            "score_breakdown": scores,
+        },
+        "detailed_metrics": {
+            "skills_match_percentage": round(100 * len(matched) / len(SKILLS), 1),
+            "experience_relevance": scores["Experience"],
+            "education_alignment": scores["Education"],
+            "cultural_fit_score": scores["Cultural Fit"],
+            "years_relevant_experience": rng.randint(0, 15),
+        },
+        "detailed_analysis": {
+            "skills": {
+                "matched_skills": matched,
+                "missing_skills": [s for s in SKILLS if s not in matched],
+                "transferable_skills": ["Flask"],
+            }
+        },
+        # Bulk that is stored but not exported, as in real reports
+        "executive_summary": SENTENCE * 20,
+        "key_insights": {"top_strengths": [SENTENCE] * 5},
+    }
+
+
+def populate(path: str, analyses: int):
+    if os.path.exists(path):
+        os.remove(path)
+    AnalysisStore(path)  # creates the schema
+    rng = random.Random(0)
+    connection = sqlite3.connect(path)
+    batch = 5000
+    for start in range(0, analyses, batch):
+        connection.executemany(
+            "INSERT INTO analyses (job_id, candidate_name, overall_score, created_at, report) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (JOB_ID, f"Candidate {i}", 7.0, "2024-01-15T10:30:00", json.dumps(
+                    synthetic_report(rng, i)
+                ))
+                for i in range(start, min(start + batch, analyses))
+            ],
+        )
+    connection.commit()
+    connection.close()
+
+
+def export_once(path: str, export_format: str, output: str):
+    """Run in a child process: export and print seconds and peak RSS"""
+    start = time.perf_counter()
+    with open(output, "wb") as file:
+        for chunk in export_analyses(AnalysisStore(path), JOB_ID, export_format):
+            file.write(chunk)
+    seconds = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"seconds": seconds, "peak_mb": peak_kb / 1024}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--analyses", type=int, default=100000)
+    parser.add_argument("--database", default="/tmp/hiresight-export-bench.db")
+    parser.add_argument("--child", nargs=3, metavar=("DATABASE", "FORMAT", "OUTPUT"))
+    args = parser.parse_args()
+
+    if args.child:
+        export_once(*args.child)
+        return
+
+    formats = ["csv"]
+    try:
+        check_export_format("parquet")
+        formats.append("parquet")
+    except RuntimeError:
+        pass  # pyarrow isn't installed
+    sizes = sorted({max(args.analyses // 10, 1), args.analyses})
+    print(f"{'analyses':>9}{'format':>9}{'seconds':>9}{'rows/s':>10}{'MB out':>8}{'peak RSS MB':>13}")
+    for size in sizes:
+        populate(args.database, size)
+        for export_format in formats:
+            output = f"{args.database}.{export_format}"
+            result = json.loads(
+                subprocess.run(
+                    [sys.executable, __file__, "--child", args.database, export_format, output],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout.strip().splitlines()[-1]
+            )
+            print(
+                f"{size:>9}{export_format:>9}{result['seconds']:>9.2f}"
+                f"{size / result['seconds']:>10.0f}"
+                f"{os.path.getsize(output) / 1e6:>8.1f}{result['peak_mb']:>13.1f}"
+            )
+            os.remove(output)
+    os.remove(args.database)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Import-time regression guard for the API entry point.
+
+Runs `python -X importtime -c "import app.main"` in a fresh interpreter and
+fails if importing the app takes longer than the budget or loads any of the
+heavy LLM, PDF or data libraries, which should only be imported on first use.
+
+Usage (from the backend directory):
+    python benchmarks/import_time.py [--max-ms 800] [--runs 3]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFERRED_MODULES = [
+    "langchain",
+    "langchain_core",
+    "langchain_google_genai",
+    "langgraph",
+    "PyPDF2",
+    "pyarrow",
+    "numpy",
+    "app.workflow.resume_workflow",
+]
+
+
+def measure_import(module: str):
+    """Return ({module: (self_us, cumulative_us)}, total_us) for one cold import"""
+    env = dict(os.environ, GOOGLE_API_KEY=os.environ.get("GOOGLE_API_KEY", "x"))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header line
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+
+    return timings, timings.get(module, (0, 0))[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--max-ms", type=float, default=800.0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [measure_import(args.module) for _ in range(args.runs)]
+    timings, _ = runs[-1]
+    best_ms = min(total for _, total in runs) / 1000
+
+    print(f"Import of {args.module}: best {best_ms:.1f} ms over {args.runs} runs")
+    print("Heaviest imports (cumulative):")
+    heaviest = sorted(timings.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (_, cumulative_us) in heaviest[: args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    failures = []
+    if best_ms > args.max_ms:
+        failures.append(f"import took {best_ms:.1f} ms (budget {args.max_ms} ms)")
+    for module in DEFERRED_MODULES:
+        if module in timings:
+            failures.append(f"{module} is imported eagerly")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
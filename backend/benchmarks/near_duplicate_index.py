@@ -0,0 +1,91 @@
+"""
+Insert/query throughput of the MinHash LSH near-duplicate index.
+
+Generates synthetic resumes, inserts their signatures into one index and then
+queries with lightly edited copies (changed dates, extra whitespace) and with
+unrelated documents, reporting throughput and how many duplicates were found.
+
+Usage (from the backend directory):
+    python benchmarks/near_duplicate_index.py [--documents 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GOOGLE_API_KEY", "x")
+os.environ.setdefault("DATABASE_PATH", os.path.join("/tmp", "hiresight-bench.db"))
+
+from app.utils.config import settings
+from app.utils.near_duplicate import MinHasher, MinHashLSHIndex
+
+# Letters only: normalization drops digits, so "term1" and "term2" would collide
+_vocabulary_rng = random.Random(0)
+VOCABULARY = [
+    "".join(_vocabulary_rng.choices("abcdefghijklmnopqrstuvwxyz", k=7))
+    for _ in range(20000)
+]
+
+
+def synthetic_resume(rng: random.Random, words: int = 250) -> str:
+    lines = []
+    for year in range(rng.randint(2, 5)):
+        body = " ".join(rng.choices(VOCABULARY, k=words // 4))
+        lines.append(f"{2010 + year} - {2011 + year}: {body}")
+    return "\n".join(lines)
+
+
+def edited_copy(text: str) -> str:
+    return text.replace("201", "202").replace(": ", ":   ").upper()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    hasher = MinHasher(settings.DUPLICATE_NUM_PERM)
+    index = MinHashLSHIndex(settings.DUPLICATE_NUM_PERM, settings.DUPLICATE_LSH_BANDS)
+    threshold = settings.DUPLICATE_SIMILARITY_THRESHOLD
+
+    print(f"Generating {args.documents:,} synthetic resumes...")
+    documents = [synthetic_resume(rng) for _ in range(args.documents)]
+
+    start = time.perf_counter()
+    signatures = [hasher.signature(text) for text in documents]
+    signing_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key, signature in enumerate(signatures):
+        index.insert(key, signature)
+    insert_seconds = time.perf_counter() - start
+
+    duplicates = [
+        edited_copy(documents[rng.randrange(args.documents)])
+        for _ in range(args.queries // 2)
+    ]
+    unrelated = [synthetic_resume(rng) for _ in range(args.queries - len(duplicates))]
+
+    start = time.perf_counter()
+    found_duplicates = sum(
+        index.query(hasher.signature(text), threshold) is not None for text in duplicates
+    )
+    false_positives = sum(
+        index.query(hasher.signature(text), threshold) is not None for text in unrelated
+    )
+    query_seconds = time.perf_counter() - start
+
+    print(f"Signatures:  {args.documents / signing_seconds:>10,.0f} docs/s")
+    print(f"Inserts:     {args.documents / insert_seconds:>10,.0f} docs/s")
+    print(f"Queries:     {args.queries / query_seconds:>10,.0f} queries/s (incl. signing)")
+    print(f"Edited copies detected: {found_duplicates}/{len(duplicates)}")
+    print(f"Unrelated flagged:      {false_positives}/{len(unrelated)}")
+
+
+if __name__ == "__main__":
+    main()
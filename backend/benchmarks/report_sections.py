@@ -0,0 +1,295 @@
+"""
+Wall time and parse-failure rate of the comprehensive report, generated as
+one monolithic structured-output call or as concurrent section calls.
+
+By default the model is simulated: each call takes a fixed overhead plus time
+proportional to the characters it outputs, and returns malformed JSON (a
+stray trailing comma, or truncated) with a probability that grows with
+output length. Pass --live to call
+the configured Gemini models instead (needs a real GOOGLE_API_KEY).
+
+Usage (from the backend directory):
+    python benchmarks/report_sections.py [--reports 20] [--live]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GOOGLE_API_KEY", "x")
+os.environ.setdefault("DATABASE_PATH", os.path.join("/tmp", "hiresight-bench.db"))
+
+from langchain_core.language_models import SimpleChatModel
+
+import app.utils.model_router as model_router
+from app.agents.report_generator import REPORT_SECTION_FIELDS, ReportGeneratorAgent
+from app.utils.config import settings
+from app.utils.json_repair import repair_stats
+from app.utils.model_router import routing_stats
+
+JOB = {
+    "role_title": "Senior Backend Engineer",
+    "required_skills": ["Python", "FastAPI", "PostgreSQL", "Docker", "AWS"],
+    "preferred_skills": ["Kubernetes", "Terraform"],
+    "experience_level": "5+ years",
+    "education_requirements": ["BSc Computer Science"],
+    "responsibilities": ["Design APIs", "Own services in production", "Mentor"],
+    "company_culture_keywords": ["ownership", "collaboration"],
+    "industry": "Software",
+    "seniority_level": "Senior",
+}
+RESUME = {
+    "name": "Jane Roe",
+    "email": "jane@example.com",
+    "phone": None,
+    "skills": ["Python", "Flask", "MySQL", "Docker", "GCP"],
+    "work_experience": [
+        {
+            "company": f"Company {i}",
+            "position": "Software Engineer",
+            "duration": "2 years",
+            "responsibilities": ["Built REST APIs", "Ran on-call rotations"],
+            "achievements": ["Cut p95 latency by 40%"],
+        }
+        for i in range(4)
+    ],
+    "education": [
+        {
+            "institution": "State University",
+            "degree": "BSc",
+            "field_of_study": "Computer Science",
+            "graduation_year": "2015",
+        }
+    ],
+    "certifications": [],
+    "projects": ["Open source HTTP client"],
+    "summary": "Backend engineer with eight years of Python experience.",
+}
+SKILLS = {
+    "overall_match_score": 7.0,
+    "matched_skills": ["Python", "Docker"],
+    "missing_critical_skills": ["FastAPI", "PostgreSQL", "AWS"],
+    "transferable_skills": ["Flask", "MySQL", "GCP"],
+    "skill_categories": {"backend": ["Python", "Flask"]},
+    "recommendations": ["Build a FastAPI service", "Get AWS experience"],
+}
+EXPERIENCE = {
+    "overall_experience_score": 8.0,
+    "relevant_experience_years": 8,
+    "industry_alignment_score": 8,
+    "role_progression_score": 7,
+    "leadership_experience_score": 6,
+    "achievements_quality_score": 7,
+    "experience_gaps": ["No AWS production experience"],
+    "strengths": ["API design", "Operational ownership", "Performance work"],
+}
+EDUCATION = {
+    "overall_education_score": 7.5,
+    "degree_alignment_score": 8,
+    "field_of_study_relevance": 9,
+    "institution_quality_score": 7,
+    "education_level_match": True,
+    "relevant_certifications": [],
+    "missing_certifications": ["AWS Solutions Architect"],
+    "continuous_learning_indicators": [],
+    "education_strengths": ["CS degree"],
+    "education_gaps": [],
+    "recommendations": [],
+}
+CULTURAL = {
+    "cultural_fit_score": 7.0,
+    "soft_skills_identified": ["Teamwork", "Mentoring"],
+    "communication_style": "Collaborative",
+    "leadership_indicators": ["Led migration"],
+    "team_collaboration_signals": ["Cross-team projects"],
+    "adaptability_score": 7,
+    "cultural_alignment_factors": ["ownership"],
+}
+
+SENTENCE = "The candidate shows solid backend experience relevant to this role. "
+SIMULATED_REPORT = {
+    "executive_summary": "\n\n".join(SENTENCE * 6 for _ in range(3)),
+    "overall_recommendation": "Proceed to technical interview. " + SENTENCE * 2,
+    "hiring_confidence": 0.8,
+    "key_strengths": [SENTENCE.strip() for _ in range(5)],
+    "critical_concerns": [SENTENCE.strip() for _ in range(3)],
+    "interview_questions": [
+        {
+            "category": "Technical",
+            "question": f"Question {i}: how would you design and operate this service?",
+            "focus_area": "System design",
+            "difficulty_level": "Medium",
+        }
+        for i in range(9)
+    ],
+    "development_recommendations": [
+        {
+            "category": "Skills",
+            "priority": "High",
+            "recommendation": SENTENCE.strip(),
+            "timeline": "3 months",
+            "impact": "Faster ramp-up on the team's stack",
+        }
+        for _ in range(5)
+    ],
+    "risk_factors": [
+        {
+            "risk_type": "Skills gap",
+            "severity": "Medium",
+            "description": SENTENCE.strip(),
+            "mitigation_strategy": SENTENCE.strip(),
+        }
+        for _ in range(4)
+    ],
+    "salary_recommendation_range": "$150,000 - $175,000",
+    "onboarding_suggestions": [SENTENCE.strip() for _ in range(5)],
+    "performance_predictions": {f"Area {i}": SENTENCE.strip() for i in range(5)},
+}
+# Interview question counts of the job's question bank and of the questions
+# personal to a candidate, which replace SIMULATED_REPORT's full set
+SIMULATED_QUESTION_COUNTS = {"bank": 10, "personal": 3}
+# Prompt marker -> report sections the simulated model answers with
+PROMPT_MARKERS = {
+    "Generate a comprehensive hiring report": list(REPORT_SECTION_FIELDS),
+    "Write the summary of a hiring report": ["summary"],
+    "targeted interview questions": ["interview"],
+    "interview questions for this role": ["bank"],
+    "interview questions for this candidate": ["personal"],
+    "Recommend specific areas of improvement": ["development"],
+    "Identify the main risks": ["risk"],
+    "Plan the onboarding": ["onboarding"],
+}
+
+
+def simulated_output(sections: list) -> dict:
+    if sections[0] in SIMULATED_QUESTION_COUNTS:
+        count = SIMULATED_QUESTION_COUNTS[sections[0]]
+        questions = [
+            {**question, "question": f"{sections[0].title()} {question['question']}"}
+            for question in (SIMULATED_REPORT["interview_questions"] * 2)[:count]
+        ]
+        return {"interview_questions": questions}
+    return {
+        field: SIMULATED_REPORT[field]
+        for name in sections
+        for field in REPORT_SECTION_FIELDS[name]
+    }
+
+
+class SimulatedModel(SimpleChatModel):
+    overhead_seconds: float
+    chars_per_second: float
+    failure_per_1k_chars: float
+    syntax_error_share: float
+    seed: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "simulated"
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs) -> str:
+        prompt = messages[-1].content
+        sections = next(
+            names for marker, names in PROMPT_MARKERS.items() if marker in prompt
+        )
+        output = json.dumps(simulated_output(sections))
+        time.sleep(self.overhead_seconds + len(output) / self.chars_per_second)
+
+        # Chance that the output is malformed, per 1000 characters: either a
+        # stray trailing comma in a markdown fence, or cut off somewhere
+        failure = 1 - (1 - self.failure_per_1k_chars) ** (len(output) / 1000)
+        if random.random() < failure:
+            if random.random() < self.syntax_error_share:
+                return "```json\n" + output[:-1] + ",}\n```"
+            return output[: random.randint(1, len(output) - 1)]
+        return output
+
+
+def run(agent: ReportGeneratorAgent, mode: str, reports: int) -> dict:
+    settings.REPORT_MODE = mode
+    before = routing_stats.snapshot()["tiers"]
+    repaired_before = repair_stats.snapshot()["repaired"]
+    durations = []
+    failed_reports = 0
+    for _ in range(reports):
+        start = time.perf_counter()
+        try:
+            agent.generate_comprehensive_report(
+                JOB, RESUME, SKILLS, EXPERIENCE, EDUCATION, CULTURAL, 7.4
+            )
+        except Exception:
+            failed_reports += 1
+        durations.append(time.perf_counter() - start)
+
+    after = routing_stats.snapshot()["tiers"]
+    calls = sum(t["calls"] for t in after.values()) - sum(
+        t["calls"] for t in before.values()
+    )
+    failures = sum(t["parse_failures"] for t in after.values()) - sum(
+        t["parse_failures"] for t in before.values()
+    )
+    repaired = repair_stats.snapshot()["repaired"] - repaired_before
+    durations.sort()
+    return {
+        "mean_seconds": statistics.mean(durations),
+        "p95_seconds": durations[max(int(len(durations) * 0.95) - 1, 0)],
+        "calls": calls,
+        "parse_failure_rate": failures / calls if calls else 0.0,
+        "repaired": repaired,
+        "failed_reports": failed_reports,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reports", type=int, default=20)
+    parser.add_argument("--live", action="store_true")
+    parser.add_argument("--overhead", type=float, default=1.0)
+    parser.add_argument("--chars-per-second", type=float, default=400.0)
+    parser.add_argument("--failure-per-1k-chars", type=float, default=0.02)
+    parser.add_argument(
+        "--syntax-error-share",
+        type=float,
+        default=0.5,
+        help="Share of malformed outputs that are fixable syntax slips, not truncation",
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=0.05,
+        help="Multiplier on simulated latency, to keep the run short",
+    )
+    args = parser.parse_args()
+
+    if not args.live:
+        random.seed(0)
+        model = SimulatedModel(
+            overhead_seconds=args.overhead * args.time_scale,
+            chars_per_second=args.chars_per_second / args.time_scale,
+            failure_per_1k_chars=args.failure_per_1k_chars,
+            syntax_error_share=args.syntax_error_share,
+        )
+        model_router.get_llm = lambda *a, **k: model
+
+    agent = ReportGeneratorAgent(settings.GOOGLE_API_KEY)
+    print(f"{args.reports} reports per mode ({'live' if args.live else 'simulated'})")
+    print(
+        f"{'mode':<12}{'mean s':>9}{'p95 s':>9}{'calls':>7}"
+        f"{'parse fail':>12}{'repaired':>10}{'failed reports':>16}"
+    )
+    for mode in ("monolithic", "sectioned"):
+        result = run(agent, mode, args.reports)
+        print(
+            f"{mode:<12}{result['mean_seconds']:>9.3f}{result['p95_seconds']:>9.3f}"
+            f"{result['calls']:>7}{result['parse_failure_rate']:>12.1%}"
+            f"{result['repaired']:>10}{result['failed_reports']:>16}"
+        )
+
+
+if __name__ == "__main__":
+    main()
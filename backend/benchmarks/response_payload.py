@@ -0,0 +1,158 @@
+"""
+Payload size and serialization time for batch responses.
+
+Builds synthetic dashboard reports with DashboardDataGenerator and compares
+the stdlib JSON encoder used by JSONResponse with orjson, for the full and
+compact payloads, with and without gzip.
+
+Usage (from the backend directory):
+    python benchmarks/response_payload.py [--candidates 500]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GOOGLE_API_KEY", "x")
+
+import orjson
+
+from app.agents.report_generator import (
+    ComprehensiveReport,
+    DashboardDataGenerator,
+    InterviewQuestion,
+    RecommendationItem,
+    RiskFactor,
+)
+from app.utils.response_shaping import shape_report
+
+SKILLS = ["Python", "FastAPI", "PostgreSQL", "Docker", "AWS", "React", "Kafka", "Go"]
+
+
+def synthetic_report(generator: DashboardDataGenerator, rng: random.Random) -> dict:
+    score = lambda: round(rng.uniform(3, 10), 1)  # noqa: E731
+    matched = rng.sample(SKILLS, rng.randint(2, 6))
+    report = ComprehensiveReport(
+        executive_summary="Candidate summary paragraph. " * 12,
+        overall_recommendation="Proceed to technical interview",
+        hiring_confidence=round(rng.random(), 2),
+        key_strengths=[f"Strength {i}" for i in range(5)],
+        critical_concerns=[f"Concern {i}" for i in range(3)],
+        interview_questions=[
+            InterviewQuestion(
+                category=rng.choice(["Technical", "Behavioral", "System Design"]),
+                question=f"Question {i} about {rng.choice(SKILLS)}?",
+                focus_area="Depth",
+                difficulty_level="Medium",
+            )
+            for i in range(8)
+        ],
+        development_recommendations=[
+            RecommendationItem(
+                category="Skills",
+                priority=rng.choice(["High", "Medium", "Low"]),
+                recommendation=f"Learn {skill}",
+                timeline="3 months",
+                impact="Medium",
+            )
+            for skill in SKILLS[:4]
+        ],
+        risk_factors=[
+            RiskFactor(
+                risk_type="Retention",
+                severity="Low",
+                description="Frequent job changes",
+                mitigation_strategy="Discuss career goals",
+            )
+        ],
+        salary_recommendation_range="$100k-$120k",
+        onboarding_suggestions=["Pair with a mentor", "Architecture walkthrough"],
+        performance_predictions={"Technical": "Strong", "Collaboration": "Good"},
+    )
+    return generator.generate_dashboard_data(
+        {"role_title": "Backend Engineer"},
+        {"name": "Candidate", "email": "c@example.com", "phone": "555"},
+        {
+            "overall_match_score": score(),
+            "matched_skills": matched,
+            "missing_critical_skills": [s for s in SKILLS if s not in matched][:3],
+            "transferable_skills": ["Flask"],
+            "skill_categories": {"technical": matched},
+        },
+        {
+            "overall_experience_score": score(),
+            "relevant_experience_years": rng.randint(1, 12),
+            "industry_alignment_score": score(),
+            "role_progression_score": score(),
+            "leadership_experience_score": score(),
+            "experience_gaps": ["No on-call experience"],
+        },
+        {
+            "overall_education_score": score(),
+            "education_level_match": True,
+            "field_of_study_relevance": score(),
+            "institution_quality_score": score(),
+            "relevant_certifications": [],
+            "continuous_learning_indicators": ["Online courses"],
+            "education_gaps": [],
+        },
+        {"cultural_fit_score": score(), "soft_skills_identified": ["Teamwork"]},
+        report,
+        score(),
+    )
+
+
+def time_encoder(encode, payload, repeats: int):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        body = encode(payload)
+        best = min(best, time.perf_counter() - start)
+    return body, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    generator = DashboardDataGenerator()
+    print(f"Building {args.candidates} synthetic reports...")
+    reports = [synthetic_report(generator, rng) for _ in range(args.candidates)]
+
+    payloads = {
+        "full": reports,
+        "compact": [shape_report(r, compact=True) for r in reports],
+        "fields=scoring_overview": [
+            shape_report(r, fields="candidate_summary.name,scoring_overview")
+            for r in reports
+        ],
+    }
+    encoders = {
+        # Same settings as starlette's JSONResponse.render
+        "json": lambda p: json.dumps(
+            p, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8"),
+        "orjson": orjson.dumps,
+    }
+
+    print(f"{'payload':<26}{'encoder':<8}{'bytes':>12}{'gzip bytes':>12}{'encode ms':>11}")
+    for payload_name, payload in payloads.items():
+        for encoder_name, encode in encoders.items():
+            body, seconds = time_encoder(encode, payload, args.repeats)
+            compressed = len(gzip.compress(body, compresslevel=6))
+            print(
+                f"{payload_name:<26}{encoder_name:<8}{len(body):>12,}"
+                f"{compressed:>12,}{seconds * 1000:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Requests/sec for the frontend asset and SPA index routes.
+
+Compares the in-memory manifest served by app.main with the previous
+FileResponse handler (os.path checks and a disk read on every request).
+Needs a frontend build in frontend/dist (`npm run build`).
+
+Usage (from the backend directory):
+    python benchmarks/static_serving.py [--requests 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GOOGLE_API_KEY", "x")
+
+from fastapi import FastAPI
+from fastapi.responses import FileResponse
+from fastapi.testclient import TestClient
+
+from app.main import app, static_files_dir
+
+
+def build_file_response_app() -> FastAPI:
+    """The catch-all handler as it was before the manifest"""
+    baseline = FastAPI()
+
+    @baseline.get("/{full_path:path}")
+    async def catch_all(full_path: str):
+        file_path = os.path.join(static_files_dir, full_path)
+        if os.path.exists(file_path) and os.path.isfile(file_path):
+            return FileResponse(file_path)
+        return FileResponse(os.path.join(static_files_dir, "index.html"))
+
+    return baseline
+
+
+def requests_per_second(client: TestClient, path: str, count: int, headers: dict):
+    client.get(path, headers=headers)  # warm up
+    start = time.perf_counter()
+    for _ in range(count):
+        response = client.get(path, headers=headers)
+        assert response.status_code in (200, 304), response.status_code
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    assets_dir = os.path.join(static_files_dir, "assets")
+    if not os.path.isdir(assets_dir) or not os.listdir(assets_dir):
+        sys.exit(f"No frontend build found in {static_files_dir}")
+    asset_path = "/assets/" + sorted(os.listdir(assets_dir))[0]
+
+    browser_headers = {"accept-encoding": "gzip, deflate, br"}
+    cases = [
+        ("asset", asset_path, browser_headers),
+        ("index (SPA route)", "/dashboard", browser_headers),
+    ]
+
+    with TestClient(app) as manifest_client:
+        etag = manifest_client.get(asset_path, headers=browser_headers).headers["etag"]
+        cases.append(
+            ("asset revalidation (304)", asset_path, {**browser_headers, "if-none-match": etag})
+        )
+
+        baseline_client = TestClient(build_file_response_app())
+        print(f"{'route':<28}{'FileResponse':>16}{'manifest':>16}")
+        for label, path, headers in cases:
+            baseline_rps = requests_per_second(
+                baseline_client, path, args.requests, headers
+            )
+            manifest_rps = requests_per_second(
+                manifest_client, path, args.requests, headers
+            )
+            print(f"{label:<28}{baseline_rps:>12.0f} r/s{manifest_rps:>12.0f} r/s")
+
+
+if __name__ == "__main__":
+    main()